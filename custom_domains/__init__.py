@@ -3,7 +3,7 @@ from .google_calendar import GoogleCalendar
 from .person_extended import Emily, Marshall
 from .sonos_speaker import SonosSpeaker
 from .sprinkler_zone import SprinklerZone
-from .zone_extended import ZoneExtended
+from .zone_extended import ResolvedZoneMetadata, ZoneExtended
 
 __all__ = [
     BathroomFloor.__name__,
@@ -11,6 +11,7 @@ __all__ = [
     GoogleCalendar.__name__,
     Emily.__name__,
     Marshall.__name__,
+    ResolvedZoneMetadata.__name__,
     Thermostat.__name__,
     SonosSpeaker.__name__,
     SprinklerZone.__name__,
@@ -1,9 +1,19 @@
+import heapq
+import threading
+from bisect import bisect_left, bisect_right
+from collections.abc import Hashable, Iterable
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta, tzinfo
+from itertools import accumulate
+from typing import Any, ClassVar
 
 from maestro import get_config
 from maestro.domains import Calendar
 from maestro.integrations import EntityId
+from maestro.utils import local_now
+
+CALENDAR_CACHE_TTL = timedelta(minutes=15)
+DEFAULT_WINDOW_DAYS = 7
 
 
 class GoogleCalendar(Calendar):
@@ -14,6 +24,9 @@ class GoogleCalendar(Calendar):
     location: str
     all_day: bool
 
+    _event_cache: ClassVar[dict[EntityId, CachedEventWindow]] = {}
+    _event_cache_lock = threading.Lock()
+
     @dataclass
     class Event:
         title: str
@@ -38,40 +51,222 @@ class GoogleCalendar(Calendar):
 
     def get_gcal_events(
         self,
-        days: int = 7,
+        days: int = DEFAULT_WINDOW_DAYS,
+        calendar_ids: list[EntityId] | None = None,
+    ) -> list[Event]:
+        """Events overlapping the next `days` days, sorted by start"""
+        now = local_now()
+        return self.get_events_between(now, now + timedelta(days=days), calendar_ids)
+
+    def get_events_between(
+        self,
+        start: datetime,
+        end: datetime,
+        calendar_ids: list[EntityId] | None = None,
+    ) -> list[Event]:
+        """
+        Events overlapping [start, end) across calendars, sorted by start. Served from a
+        per-calendar cache, calling `get_events` only for calendars or time ranges not yet cached.
+        """
+        indexes = self._get_indexes(calendar_ids or [self.id], start, end)
+        return list(
+            heapq.merge(
+                *(index.overlapping(start, end) for index in indexes),
+                key=lambda event: event.start,
+            )
+        )
+
+    def get_upcoming_events(
+        self,
+        count: int,
         calendar_ids: list[EntityId] | None = None,
     ) -> list[Event]:
-        events = []
-        raw_response = self.get_events(duration={"days": days}, calendar_ids=calendar_ids)
-
-        for calendar, content in raw_response.items():
-            for event_data in content["events"]:
-                if not isinstance(event_data, dict):
-                    raise TypeError(f"Expected dict but got {type(event_data).__name__}")
-
-                start_string = event_data.get("start", "")
-                end_string = event_data.get("end", "")
-                all_day = "T" not in start_string and "T" not in end_string
-
-                start = datetime.fromisoformat(start_string)
-                end = datetime.fromisoformat(end_string)
-
-                if start.tzinfo is None:
-                    start = start.replace(tzinfo=get_config().timezone)
-                if end.tzinfo is None:
-                    end = end.replace(tzinfo=get_config().timezone)
-
-                events.append(
-                    self.Event(
-                        title=event_data.get("summary", ""),
-                        description=event_data.get("description"),  # TODO: verify key
-                        start=start,
-                        end=end,
-                        calendar=EntityId(calendar),
-                        location=event_data.get("location"),
-                        all_day=all_day,
-                    )
-                )
-        events.sort(key=lambda e: e.start)
-
-        return events
+        """The next `count` events starting within the default window"""
+        now = local_now()
+        end = now + timedelta(days=DEFAULT_WINDOW_DAYS)
+        indexes = self._get_indexes(calendar_ids or [self.id], now, end)
+        upcoming = heapq.merge(
+            *(index.upcoming(now, end, count) for index in indexes),
+            key=lambda event: event.start,
+        )
+        return [event for _, event in zip(range(count), upcoming, strict=False)]
+
+    @classmethod
+    def invalidate_event_cache(cls, calendar_id: EntityId | None = None) -> None:
+        with cls._event_cache_lock:
+            if calendar_id is None:
+                cls._event_cache.clear()
+            else:
+                cls._event_cache.pop(calendar_id, None)
+
+    def _get_indexes(
+        self, calendar_ids: list[EntityId], start: datetime, end: datetime
+    ) -> list[CalendarEventIndex]:
+        """
+        Fetch only what the cache can't answer: the whole range for calendars that are uncached,
+        expired or whose state has moved on, and just the missing tail for the rest.
+        Fetches run to the next local midnight so that windows sliding with the clock stay cached.
+        """
+        now = local_now()
+        fetch_end = get_fetch_end(end)
+        fingerprints = {calendar_id: self._fingerprint(calendar_id) for calendar_id in calendar_ids}
+        indexes: dict[EntityId, CalendarEventIndex] = {}
+
+        # Calendars missing the same range share one service call
+        missing: dict[tuple[datetime, datetime, bool], list[EntityId]] = {}
+        with self._event_cache_lock:
+            for calendar_id in calendar_ids:
+                cached = self._event_cache.get(calendar_id)
+                if (
+                    cached is None
+                    or cached.fingerprint != fingerprints[calendar_id]
+                    or now - cached.fetched_at >= CALENDAR_CACHE_TTL
+                    or start < cached.start
+                ):
+                    missing.setdefault((start, fetch_end, False), []).append(calendar_id)
+                elif end > cached.end:
+                    missing.setdefault((cached.end, fetch_end, True), []).append(calendar_id)
+                else:
+                    indexes[calendar_id] = cached.index
+
+        fetches = list(missing.items())
+        while fetches:
+            (fetch_start, fetch_end, extend), ids = fetches.pop()
+            fetched = self._fetch_events(fetch_start, fetch_end, ids)
+            refetch: list[EntityId] = []
+            with self._event_cache_lock:
+                for calendar_id in ids:
+                    events = fetched.get(calendar_id, [])
+                    if not extend:
+                        window = CachedEventWindow(
+                            start=fetch_start,
+                            end=fetch_end,
+                            fetched_at=now,
+                            fingerprint=fingerprints[calendar_id],
+                            index=CalendarEventIndex.build(events),
+                        )
+                    elif (
+                        cached := self._event_cache.get(calendar_id)
+                    ) is not None and cached.end == fetch_start:
+                        window = cached.extended(events, fetch_end)
+                    else:
+                        # Invalidated or replaced mid-fetch, so fetch the whole range instead
+                        refetch.append(calendar_id)
+                        continue
+                    self._event_cache[calendar_id] = window
+                    indexes[calendar_id] = window.index
+
+            if refetch:
+                fetches.append(((start, fetch_end, False), refetch))
+
+        return [indexes[calendar_id] for calendar_id in calendar_ids]
+
+    def _fingerprint(self, calendar_id: EntityId) -> Hashable:
+        """Cheap cached-state read that changes whenever HA moves the calendar's next event"""
+        calendar = self if calendar_id == self.id else GoogleCalendar(calendar_id)
+        return (calendar.state, calendar.message, calendar.start_time, calendar.end_time)
+
+    def _fetch_events(
+        self, start: datetime, end: datetime, calendar_ids: list[EntityId]
+    ) -> dict[EntityId, list[Event]]:
+        raw_response = self.get_events(
+            start_date_time=start, end_date_time=end, calendar_ids=calendar_ids
+        )
+        timezone = get_config().timezone
+
+        return {
+            EntityId(calendar): [
+                self._parse_event(EntityId(calendar), event_data, timezone)
+                for event_data in content["events"]
+            ]
+            for calendar, content in raw_response.items()
+        }
+
+    def _parse_event(self, calendar: EntityId, event_data: Any, timezone: tzinfo) -> Event:
+        if not isinstance(event_data, dict):
+            raise TypeError(f"Expected dict but got {type(event_data).__name__}")
+
+        start_string = event_data.get("start", "")
+        end_string = event_data.get("end", "")
+        all_day = "T" not in start_string and "T" not in end_string
+
+        start = datetime.fromisoformat(start_string)
+        end = datetime.fromisoformat(end_string)
+
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=timezone)
+        if end.tzinfo is None:
+            end = end.replace(tzinfo=timezone)
+
+        return self.Event(
+            title=event_data.get("summary", ""),
+            description=event_data.get("description"),  # TODO: verify key
+            start=start,
+            end=end,
+            calendar=calendar,
+            location=event_data.get("location"),
+            all_day=all_day,
+        )
+
+
+def get_fetch_end(end: datetime) -> datetime:
+    """Round `end` up to the next local midnight, unless it already is one"""
+    midnight = end.replace(hour=0, minute=0, second=0, microsecond=0)
+    return end if midnight == end else midnight + timedelta(days=1)
+
+
+@dataclass(frozen=True)
+class CalendarEventIndex:
+    """
+    Events sorted by start, with a running max of end times so that overlap queries
+    bisect to the first candidate instead of scanning from the beginning.
+    """
+
+    events: list[GoogleCalendar.Event]
+    starts: list[float]
+    max_ends: list[float]
+
+    @classmethod
+    def build(cls, events: Iterable[GoogleCalendar.Event]) -> CalendarEventIndex:
+        ordered = sorted(events, key=lambda event: event.start)
+        return cls(
+            events=ordered,
+            starts=[event.start.timestamp() for event in ordered],
+            max_ends=list(accumulate((event.end.timestamp() for event in ordered), max)),
+        )
+
+    def overlapping(self, start: datetime, end: datetime) -> list[GoogleCalendar.Event]:
+        """Events with start < `end` and end > `start`"""
+        start_timestamp = start.timestamp()
+        first = bisect_right(self.max_ends, start_timestamp)
+        last = bisect_left(self.starts, end.timestamp())
+
+        return [
+            event for event in self.events[first:last] if event.end.timestamp() > start_timestamp
+        ]
+
+    def upcoming(self, after: datetime, end: datetime, count: int) -> list[GoogleCalendar.Event]:
+        """Up to `count` events starting in [after, end)"""
+        first = bisect_left(self.starts, after.timestamp())
+        last = min(bisect_left(self.starts, end.timestamp()), first + count)
+        return self.events[first:last]
+
+
+@dataclass(frozen=True)
+class CachedEventWindow:
+    start: datetime
+    end: datetime
+    fetched_at: datetime
+    fingerprint: Hashable
+    index: CalendarEventIndex
+
+    def extended(self, events: list[GoogleCalendar.Event], end: datetime) -> CachedEventWindow:
+        """Add a fetched tail. Events starting before the old end overlapped it and are cached"""
+        added = [event for event in events if event.start >= self.end]
+        return CachedEventWindow(
+            start=self.start,
+            end=end,
+            fetched_at=self.fetched_at,
+            fingerprint=self.fingerprint,
+            index=CalendarEventIndex.build([*self.index.events, *added]),
+        )
@@ -1,10 +1,72 @@
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, ClassVar
+
 from maestro.domains import MediaPlayer
-from maestro.integrations import Domain
+from maestro.integrations import Domain, EntityId
+from maestro.utils import log
+
+MAX_CONCURRENT_ACTIONS = 4
+# Services HA applies to every entity in a list. Anything else is sent per entity
+MULTI_ENTITY_ACTIONS = frozenset(
+    {
+        "media_pause",
+        "media_play",
+        "media_stop",
+        "volume_mute",
+        "volume_set",
+        "select_source",
+        "unjoin",
+        "snapshot",
+        "restore",
+    }
+)
+
+
+@dataclass(frozen=True)
+class SpeakerAction:
+    player: MediaPlayer
+    action: str
+    data: dict[str, Any] = field(default_factory=dict)
+    domain: Domain = Domain.MEDIA_PLAYER
+
+
+@dataclass(frozen=True)
+class ActionResult:
+    domain: Domain
+    action: str
+    entity_ids: list[EntityId]
+    data: dict[str, Any]
+    latency_seconds: float
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class BulkActionReport:
+    results: list[ActionResult]
+
+    @property
+    def failures(self) -> list[ActionResult]:
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def max_latency_seconds(self) -> float:
+        return max((result.latency_seconds for result in self.results), default=0.0)
 
 
 class SonosSpeaker(MediaPlayer):
     group_members: list[str]
 
+    _action_executor: ClassVar = ThreadPoolExecutor(
+        max_workers=MAX_CONCURRENT_ACTIONS, thread_name_prefix="sonos"
+    )
+
     def join(self, members: list[SonosSpeaker]) -> None:
         speaker_ids = [speaker.id for speaker in members]
         self.perform_action("join", group_members=speaker_ids)
@@ -27,3 +89,64 @@ class SonosSpeaker(MediaPlayer):
             entity_id=self.id,
             with_group=with_group,
         )
+
+    @classmethod
+    def perform_bulk(cls, actions: Iterable[SpeakerAction]) -> BulkActionReport:
+        """
+        Perform many player actions at once. Identical actions are merged into one multi-entity
+        call where HA supports it, and every resulting call runs on a bounded shared pool.
+        Failures are logged and reported rather than raised.
+        """
+        calls: dict[tuple[Domain, str, str], tuple[SpeakerAction, list[EntityId]]] = {}
+        for speaker_action in actions:
+            if speaker_action.action in MULTI_ENTITY_ACTIONS:
+                key = (speaker_action.domain, speaker_action.action, repr(speaker_action.data))
+            else:
+                key = (speaker_action.domain, speaker_action.action, speaker_action.player.id)
+            calls.setdefault(key, (speaker_action, []))[1].append(speaker_action.player.id)
+
+        futures = [
+            cls._action_executor.submit(cls._timed_action, speaker_action, entity_ids)
+            for speaker_action, entity_ids in calls.values()
+        ]
+        report = BulkActionReport(results=[future.result() for future in futures])
+
+        for failure in report.failures:
+            log.error(
+                "Bulk speaker action failed",
+                action=f"{failure.domain}.{failure.action}",
+                entity_ids=failure.entity_ids,
+                exception_type=type(failure.error).__name__,
+            )
+        log.debug(
+            "Performed bulk speaker actions",
+            calls=len(report.results),
+            failures=len(report.failures),
+            max_latency_seconds=round(report.max_latency_seconds, 3),
+        )
+
+        return report
+
+    @staticmethod
+    def _timed_action(speaker_action: SpeakerAction, entity_ids: list[EntityId]) -> ActionResult:
+        entity_id: str | list[str] = entity_ids[0] if len(entity_ids) == 1 else [*entity_ids]
+        error = None
+        started = perf_counter()
+        try:
+            speaker_action.player.state_manager.hass_client.perform_action(
+                domain=speaker_action.domain,
+                action=speaker_action.action,
+                entity_id=entity_id,
+                **speaker_action.data,
+            )
+        except Exception as e:
+            error = e
+
+        return ActionResult(
+            domain=speaker_action.domain,
+            action=speaker_action.action,
+            entity_ids=entity_ids,
+            data=speaker_action.data,
+            latency_seconds=perf_counter() - started,
+            error=error,
+        )
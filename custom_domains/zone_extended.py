@@ -1,4 +1,8 @@
 from copy import deepcopy
+from dataclasses import dataclass
+from datetime import timedelta
+from types import ModuleType
+from typing import ClassVar
 
 from maestro.domains import Zone
 from maestro.integrations import EntityId, StateManager
@@ -6,40 +10,106 @@ from maestro.integrations import EntityId, StateManager
 from scripts.config.zones import ZoneMetadata, zone_metadata_registry
 
 
+@dataclass(frozen=True, slots=True)
+class ResolvedZoneMetadata:
+    """Read-only zone metadata with `short_name` already resolved. Shared between callers"""
+
+    short_name: str
+    prefix: str
+    region: bool
+    debounce: timedelta
+    lakeshore: bool
+
+
 class ZoneExtended(Zone):
+    _metadata_memo: ClassVar[dict[str, ResolvedZoneMetadata]] = {}
+    _zone_index: ClassVar[dict[str, Zone]] = {}
+    _zone_index_source: ClassVar[ModuleType | None] = None
+
     def __init__(
         self,
         entity_id: str | EntityId,
         state_manager: StateManager | None = None,
     ):
         super().__init__(entity_id=entity_id, state_manager=state_manager)
-        self._metadata: ZoneMetadata | None = None
+        self._metadata: ResolvedZoneMetadata | None = None
 
     @property
-    def metadata(self) -> ZoneMetadata:
+    def metadata(self) -> ResolvedZoneMetadata:
         """Lazy-load metadata to avoid accessing state manager during module import"""
         if self._metadata is None:
             self._metadata = self.get_zone_metadata(self.friendly_name)
         return self._metadata
 
     @classmethod
-    def get_zone_metadata(cls, friendly_name: str) -> ZoneMetadata:
-        registry_entry = zone_metadata_registry.get(friendly_name)
+    def get_zone_metadata(cls, friendly_name: str) -> ResolvedZoneMetadata:
+        """Memoized per friendly name, so repeat lookups return the same shared object"""
+        if (resolved := cls._metadata_memo.get(friendly_name)) is not None:
+            return resolved
+
+        zone_metadata = zone_metadata_registry.get(friendly_name) or ZoneMetadata()
+        resolved = ResolvedZoneMetadata(
+            short_name=zone_metadata.short_name or friendly_name,
+            prefix=zone_metadata.prefix,
+            region=zone_metadata.region,
+            debounce=zone_metadata.debounce,
+            lakeshore=zone_metadata.lakeshore,
+        )
 
-        zone_metadata = deepcopy(registry_entry) or ZoneMetadata()
+        return cls._metadata_memo.setdefault(friendly_name, resolved)
+
+    @classmethod
+    def copy_zone_metadata(cls, friendly_name: str) -> ZoneMetadata:
+        """A private, mutable copy of a zone's registry metadata for callers that need to edit it"""
+        zone_metadata = deepcopy(zone_metadata_registry.get(friendly_name)) or ZoneMetadata()
 
         if zone_metadata.short_name is None:
             zone_metadata.short_name = friendly_name
 
         return zone_metadata
 
+    @classmethod
+    def clear_zone_metadata_memo(cls) -> None:
+        cls._metadata_memo.clear()
+
     @classmethod
     def resolve_zone(cls, friendly_name: str) -> Zone:
-        from registry import zone as zone_registry
+        """
+        Look up a zone by friendly name from an index built on first use.
+        Hits are re-checked against the live friendly name; misses and stale hits rebuild the index.
+        """
+        zone_registry = cls._zone_registry()
+        zone = None
+        if zone_registry is cls._zone_index_source:
+            zone = cls._zone_index.get(friendly_name)
 
+        if zone is None or zone.friendly_name != friendly_name:
+            zone = cls._build_zone_index(zone_registry).get(friendly_name)
+
+        if zone is None:
+            raise ValueError(f"No zone entity found for friendly_name: {friendly_name}")
+
+        return zone
+
+    @classmethod
+    def invalidate_zone_index(cls) -> None:
+        cls._zone_index = {}
+        cls._zone_index_source = None
+
+    @classmethod
+    def _build_zone_index(cls, zone_registry: ModuleType) -> dict[str, Zone]:
+        zone_index: dict[str, Zone] = {}
         for attr_name in dir(zone_registry):
             attr = getattr(zone_registry, attr_name)
-            if isinstance(attr, Zone) and attr.friendly_name == friendly_name:
-                return attr
+            if isinstance(attr, Zone):
+                zone_index.setdefault(attr.friendly_name, attr)
+
+        cls._zone_index = zone_index
+        cls._zone_index_source = zone_registry
+        return zone_index
+
+    @classmethod
+    def _zone_registry(cls) -> ModuleType:
+        from registry import zone as zone_registry
 
-        raise ValueError(f"No zone entity found for friendly_name: {friendly_name}")
+        return zone_registry
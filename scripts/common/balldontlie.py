@@ -1,5 +1,9 @@
+import threading
 from dataclasses import dataclass
+from datetime import timedelta
 from enum import StrEnum
+from time import monotonic
+from typing import Any
 
 import requests
 from maestro.utils import log
@@ -10,6 +14,18 @@ BASE_URL = "https://api.balldontlie.io/mlb/v1"
 
 DETROIT_TIGERS_TEAM_ID = 10
 
+STATUS_IN_PROGRESS = "STATUS_IN_PROGRESS"
+STATUS_FINAL = "STATUS_FINAL"
+
+# The free tier allows 5 requests per minute
+RATE_LIMIT_REQUESTS = 5
+RATE_LIMIT_PERIOD_SECONDS = 60
+REQUEST_TIMEOUT_SECONDS = 30
+
+MID_INNING_POLL_INTERVAL = timedelta(seconds=30)
+INNING_BREAK_POLL_INTERVAL = timedelta(minutes=2)
+PRE_GAME_POLL_INTERVAL = timedelta(minutes=5)
+
 
 class InningHalf(StrEnum):
     TOP = "Top"
@@ -26,21 +42,113 @@ class LiveGameData:
     period: int
     inning_half: InningHalf
 
+    @property
+    def is_final(self) -> bool:
+        return self.status == STATUS_FINAL
+
+
+class TokenBucket:
+    """Allows bursts up to `capacity`, refilling at `capacity` tokens per `period_seconds`"""
+
+    def __init__(self, capacity: int, period_seconds: float) -> None:
+        self.capacity = capacity
+        self.refill_per_second = capacity / period_seconds
+        self._tokens = float(capacity)
+        self._updated_at = monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            now = monotonic()
+            elapsed = now - self._updated_at
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_per_second)
+            self._updated_at = now
+
+            if self._tokens < 1:
+                return False
+
+            self._tokens -= 1
+            return True
+
+
+class BalldontlieClient:
+    """
+    Live game client sharing one HTTP session. Final results are cached per game date and
+    never refetched, and requests are held to the API's rate limit by a token bucket.
+    """
+
+    def __init__(self, base_url: str = BASE_URL, api_key: str = BALLDONTLIE_API_KEY) -> None:
+        self.base_url = base_url
+        self.session = requests.Session()
+        self.session.headers["Authorization"] = api_key
+        self.token_bucket = TokenBucket(RATE_LIMIT_REQUESTS, RATE_LIMIT_PERIOD_SECONDS)
+
+        self._final_games: dict[tuple[int, str], LiveGameData] = {}
+        self._latest_games: dict[tuple[int, str], LiveGameData] = {}
+        self._lock = threading.Lock()
+
+    def get_live_game(self, team_id: int, game_date: str) -> LiveGameData | None:
+        """Live game data for a team on a date (YYYY-MM-DD). Returns None on failure"""
+        key = (team_id, game_date)
+        with self._lock:
+            if (final_game := self._final_games.get(key)) is not None:
+                return final_game
+
+        if not self.token_bucket.try_acquire():
+            log.warning("balldontlie rate limit reached, using last result", team_id=team_id)
+            return self.get_latest_game(team_id, game_date)
+
+        url = f"{self.base_url}/games"
+        params: dict[str, str | int] = {"team_ids[]": team_id, "dates[]": game_date}
+
+        try:
+            response = self.session.get(url, params=params, timeout=REQUEST_TIMEOUT_SECONDS)
+            response.raise_for_status()
+            data = response.json()
+        except Exception:
+            log.exception(
+                "Failed to fetch game data from balldontlie", team_id=team_id, date=game_date
+            )
+            return None
+
+        game = parse_live_game(data)
+        if game is not None:
+            with self._lock:
+                self._latest_games[key] = game
+                if game.is_final:
+                    self._final_games[key] = game
+
+        return game
+
+    def get_latest_game(self, team_id: int, game_date: str) -> LiveGameData | None:
+        """Most recent result fetched for a game, without calling the API"""
+        with self._lock:
+            return self._latest_games.get((team_id, game_date))
+
+
+def get_poll_interval(
+    game: LiveGameData | None, previous: LiveGameData | None = None
+) -> timedelta | None:
+    """
+    How long to wait before polling again: quickly during play, slower between innings or
+    before first pitch, and not at all once the game is final.
+    """
+    if game is None:
+        return INNING_BREAK_POLL_INTERVAL
+    if game.is_final:
+        return None
+    if game.status != STATUS_IN_PROGRESS:
+        return PRE_GAME_POLL_INTERVAL if game.period == 0 else INNING_BREAK_POLL_INTERVAL
 
-def get_live_game(team_id: int, game_date: str) -> LiveGameData | None:
-    """Fetch live game data for a team on a given date (YYYY-MM-DD). Returns None on failure."""
-    url = f"{BASE_URL}/games"
-    headers = {"Authorization": BALLDONTLIE_API_KEY}
-    params: dict[str, str | int] = {"team_ids[]": team_id, "dates[]": game_date}
+    # A half-inning that just turned over is most likely in its break
+    half_changed = previous is not None and (previous.period, previous.inning_half) != (
+        game.period,
+        game.inning_half,
+    )
+    return INNING_BREAK_POLL_INTERVAL if half_changed else MID_INNING_POLL_INTERVAL
 
-    try:
-        response = requests.get(url, params=params, headers=headers, timeout=30)
-        response.raise_for_status()
-        data = response.json()
-    except Exception:
-        log.exception("Failed to fetch game data from balldontlie", team_id=team_id, date=game_date)
-        return None
 
+def parse_live_game(data: dict[str, Any]) -> LiveGameData | None:
     games = data.get("data", [])
     if not games:
         return None
@@ -70,3 +178,6 @@ def get_live_game(team_id: int, game_date: str) -> LiveGameData | None:
         period=period,
         inning_half=inning_half,
     )
+
+
+balldontlie_client = BalldontlieClient()
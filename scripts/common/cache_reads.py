@@ -0,0 +1,54 @@
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import cast
+
+from maestro.integrations import RedisClient, StateId, StateManager
+from redis import Redis
+
+type CachedState = str | int | float | dict | list | bool | datetime
+
+
+@dataclass(frozen=True)
+class EncodedState:
+    """The JSON envelope Maestro caches entity states and attributes in"""
+
+    value: str
+    type: str
+
+
+def get_raw_client(redis_client: RedisClient) -> Redis | None:
+    """The underlying redis-py client, which the test mock doesn't provide"""
+    client = getattr(redis_client, "client", None)
+    return client if isinstance(client, Redis) else None
+
+
+def get_many(keys: Sequence[str], redis_client: RedisClient | None = None) -> list[str | None]:
+    """Values for every key in one MGET, or one GET per key when there's no raw client"""
+    redis_client = redis_client or StateManager().redis_client
+    if not keys:
+        return []
+
+    if (client := get_raw_client(redis_client)) is not None:
+        return cast(list[str | None], client.mget(keys))
+
+    return [redis_client.get(key) for key in keys]
+
+
+def get_cached_states(state_ids: Sequence[StateId]) -> list[CachedState | None]:
+    """Decoded cached states for many entities or attributes, read in one round trip"""
+    redis_client = StateManager().redis_client
+    encoded_states = get_many([state_id.cache_key for state_id in state_ids], redis_client)
+
+    states: list[CachedState | None] = []
+    for encoded in encoded_states:
+        if encoded is None:
+            states.append(None)
+            continue
+
+        # Decoding only reads `value` and `type`, so this envelope stands in for Maestro's own
+        envelope = EncodedState(**json.loads(encoded))
+        states.append(redis_client.decode_cached_state(envelope))  # type:ignore [arg-type]
+
+    return states
@@ -0,0 +1,161 @@
+import os
+import socket
+import statistics
+import threading
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from time import perf_counter
+
+from maestro.utils import local_now, log
+
+type ProbeTarget = tuple[str, int]
+type Connect = Callable[[ProbeTarget, float], None]
+
+PROBE_TARGETS: tuple[ProbeTarget, ...] = (("8.8.8.8", 53), ("1.1.1.1", 53))
+PROBE_TIMEOUT_SECONDS = 3.0
+PROBE_INTERVAL_SECONDS = 15.0
+HISTORY_SIZE = 20
+
+
+@dataclass(frozen=True)
+class ProbeRound:
+    checked_at: datetime
+    latency_ms: float | None
+    sent: int
+    lost: int
+
+
+@dataclass(frozen=True)
+class ConnectivityStatus:
+    online: bool
+    latency_ms: int | None
+    packet_loss: float
+    checked_at: datetime | None
+
+
+def tcp_connect(target: ProbeTarget, timeout: float) -> None:
+    with socket.create_connection(target, timeout=timeout):
+        pass
+
+
+class ConnectivityMonitor:
+    """
+    Probes the internet from a background thread and caches the result, so readers never block.
+    Targets in each round are probed concurrently and a rolling history of rounds is kept.
+    With `start_monitor` off nothing probes in the background, so callers (and tests) drive
+    `probe` themselves.
+    """
+
+    def __init__(
+        self,
+        targets: tuple[ProbeTarget, ...] = PROBE_TARGETS,
+        timeout_seconds: float = PROBE_TIMEOUT_SECONDS,
+        interval_seconds: float = PROBE_INTERVAL_SECONDS,
+        connect: Connect = tcp_connect,
+        start_monitor: bool = True,
+    ) -> None:
+        self.targets = targets
+        self.timeout_seconds = timeout_seconds
+        self.interval_seconds = interval_seconds
+        self.connect = connect
+        self.start_monitor = start_monitor
+
+        self._history: deque[ProbeRound] = deque(maxlen=HISTORY_SIZE)
+        self._executor = ThreadPoolExecutor(max_workers=len(targets), thread_name_prefix="probe")
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._monitor_pid: int | None = None
+
+    def status(self) -> ConnectivityStatus:
+        """Latest cached status. Only probes inline if nothing has been measured yet"""
+        self._ensure_monitor()
+        with self._lock:
+            has_history = bool(self._history)
+        if not has_history:
+            self.probe()
+
+        with self._lock:
+            return self._summarize(list(self._history))
+
+    def probe(self) -> ProbeRound:
+        """Probe every target at once, waiting no longer than the slowest timeout"""
+        latencies = list(self._executor.map(self._probe_target, self.targets))
+        successes = [latency for latency in latencies if latency is not None]
+
+        probe_round = ProbeRound(
+            checked_at=local_now(),
+            latency_ms=min(successes) if successes else None,
+            sent=len(latencies),
+            lost=len(latencies) - len(successes),
+        )
+        with self._lock:
+            self._history.append(probe_round)
+
+        return probe_round
+
+    def history(self) -> list[ProbeRound]:
+        with self._lock:
+            return list(self._history)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._history.clear()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def _probe_target(self, target: ProbeTarget) -> float | None:
+        started = perf_counter()
+        try:
+            self.connect(target, self.timeout_seconds)
+        except OSError:
+            return None
+
+        return (perf_counter() - started) * 1000
+
+    def _summarize(self, history: list[ProbeRound]) -> ConnectivityStatus:
+        if not history:
+            return ConnectivityStatus(
+                online=False, latency_ms=None, packet_loss=0.0, checked_at=None
+            )
+
+        latest = history[-1]
+        # Median over recent rounds so the card doesn't churn on every jittery sample
+        latencies = [probe.latency_ms for probe in history if probe.latency_ms is not None]
+        sent = sum(probe.sent for probe in history)
+
+        return ConnectivityStatus(
+            online=latest.latency_ms is not None,
+            latency_ms=round(statistics.median(latencies))
+            if latest.latency_ms is not None
+            else None,
+            packet_loss=sum(probe.lost for probe in history) / sent if sent else 0.0,
+            checked_at=latest.checked_at,
+        )
+
+    def _ensure_monitor(self) -> None:
+        """Start one probing thread per process"""
+        pid = os.getpid()
+        if not self.start_monitor or self._monitor_pid == pid:
+            return
+
+        with self._lock:
+            if self._monitor_pid == pid:
+                return
+            self._monitor_pid = pid
+
+        threading.Thread(target=self._run, name="connectivity-monitor", daemon=True).start()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                self.probe()
+            except Exception:
+                log.exception("Connectivity probe failed")
+            self._stopped.wait(self.interval_seconds)
+
+
+connectivity_monitor = ConnectivityMonitor()
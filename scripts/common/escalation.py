@@ -0,0 +1,54 @@
+from collections.abc import Callable, Sequence
+from datetime import datetime, timedelta
+from typing import Any
+
+from maestro.utils import JobScheduler, local_now
+
+# A step running late still leaves its successor in the future
+MIN_STEP_DELAY = timedelta(seconds=1)
+
+
+def schedule_escalation(
+    job_id: str,
+    func: Callable[..., None],
+    steps: Sequence[timedelta],
+    func_params: dict[str, Any] | None = None,
+    started_at: datetime | None = None,
+) -> None:
+    """
+    Run `func` at each offset in `steps` from `started_at`, passing the offset as `duration`.
+    The whole chain is one job that carries its remaining steps and re-arms itself under the
+    same ID, so scheduling costs one write and cancelling is a single `cancel_escalation`.
+    """
+    if not steps:
+        return
+
+    started_at = started_at or local_now()
+    JobScheduler().schedule_job(
+        run_time=max(started_at + steps[0], local_now() + MIN_STEP_DELAY),
+        func=run_escalation_step,
+        func_params={
+            "job_id": job_id,
+            "func": func,
+            "steps": list(steps),
+            "func_params": func_params or {},
+            "started_at": started_at,
+        },
+        job_id=job_id,
+    )
+
+
+def run_escalation_step(
+    job_id: str,
+    func: Callable[..., None],
+    steps: list[timedelta],
+    func_params: dict[str, Any],
+    started_at: datetime,
+) -> None:
+    # Re-arm before running the step so that a failing step doesn't end the chain
+    schedule_escalation(job_id, func, steps[1:], func_params, started_at)
+    func(**func_params, duration=steps[0])
+
+
+def cancel_escalation(job_id: str) -> None:
+    JobScheduler().cancel_job(job_id)
@@ -14,6 +14,9 @@ class EventType(StrEnum):
     OLIVIA_ASLEEP = auto()
     OLIVIA_AWAKE = auto()
     OLIVIA_INFO = auto()
+    OLIVIA_STATS = auto()
+
+    SLEEP_EVENT_COMMITTED = auto()
 
     MAESTRO_UI_EVENT = "maestro_ui_event"
 
@@ -1,7 +1,21 @@
+import threading
+from collections import Counter, deque
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from datetime import datetime, timedelta
+from time import monotonic
 
 import requests
+from maestro.utils import local_now, log
+from requests.adapters import HTTPAdapter
 
+from scripts.common.market_calendar import (
+    MARKET_TIMEZONE,
+    get_current_session,
+    get_next_market_open,
+    get_session,
+)
 from scripts.config.secrets import FINNHUB_TOKEN
 
 FINNHUB_BASE_URL = "https://finnhub.io/api/v1"
@@ -9,6 +23,17 @@ FINNHUB_BASE_URL = "https://finnhub.io/api/v1"
 SPY_SYMBOL = "SPY"
 NET_SYMBOL = "NET"
 
+# Just under the once-a-minute refresh so each tick during market hours sees a fresh quote
+QUOTE_TTL_SECONDS = 55
+# Finnhub's free tier allows 60 calls per minute; leave headroom for other consumers of the key
+RATE_LIMIT_CALLS = 30
+RATE_LIMIT_PERIOD_SECONDS = 60
+MAX_CONCURRENT_REQUESTS = 4
+REQUEST_TIMEOUT_SECONDS = 30
+REFRESH_INTERVAL = timedelta(minutes=1)
+# Wait for the closing print to settle before taking the day's final quote
+SETTLE_DELAY = timedelta(minutes=2)
+
 
 @dataclass
 class FinnhubResponse:
@@ -28,12 +53,186 @@ class FinnhubResponse:
     t: float  # Update Timestamp
 
 
-def get_stock_quote(symbol: str = SPY_SYMBOL) -> FinnhubResponse:
-    """Returns a stock quote for the given stock symbol"""
-    url = f"{FINNHUB_BASE_URL}/quote"
-    params = {"symbol": symbol.upper(), "token": FINNHUB_TOKEN}
+@dataclass(frozen=True)
+class CachedQuote:
+    quote: FinnhubResponse
+    expires_at: datetime
+
+
+@dataclass(frozen=True)
+class QuoteRefresh:
+    run_time: datetime
+    settle: bool
+
+
+class RateBudgetExceededError(Exception):
+    pass
+
+
+class RateBudget:
+    """Sliding-window call budget"""
+
+    def __init__(self, calls: int, period_seconds: float) -> None:
+        self.calls = calls
+        self.period_seconds = period_seconds
+        self._call_times: deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            now = monotonic()
+            while self._call_times and now - self._call_times[0] >= self.period_seconds:
+                self._call_times.popleft()
+
+            if len(self._call_times) >= self.calls:
+                return False
+
+            self._call_times.append(now)
+            return True
+
+    def remaining(self) -> int:
+        with self._lock:
+            now = monotonic()
+            recent = sum(
+                1 for call_time in self._call_times if now - call_time < self.period_seconds
+            )
+            return self.calls - recent
+
+
+def get_quote_expiry(fetched_at: datetime) -> datetime:
+    """Quotes go stale quickly while the market trades, and not at all once it has closed"""
+    if (session := get_current_session(fetched_at)) is not None:
+        return min(fetched_at + timedelta(seconds=QUOTE_TTL_SECONDS), session.close)
+
+    return get_next_market_open(fetched_at)
+
+
+def get_next_quote_refresh(now: datetime) -> QuoteRefresh:
+    """
+    Every minute through a live session, then one settle refresh shortly after the close,
+    then nothing until the next session opens.
+    """
+    if (session := get_current_session(now)) is not None:
+        next_minute = now.replace(second=0, microsecond=0) + REFRESH_INTERVAL
+        if next_minute < session.close:
+            return QuoteRefresh(run_time=next_minute, settle=False)
+        return QuoteRefresh(run_time=session.close + SETTLE_DELAY, settle=True)
+
+    # Covers a last in-session refresh that ran late, past the close
+    session = get_session(now.astimezone(MARKET_TIMEZONE).date())
+    if session is not None and session.close <= now < session.close + SETTLE_DELAY:
+        return QuoteRefresh(run_time=session.close + SETTLE_DELAY, settle=True)
+
+    return QuoteRefresh(run_time=get_next_market_open(now), settle=False)
+
+
+class FinnhubClient:
+    """
+    Quote client sharing one pooled session. Quotes are cached per symbol until they can have
+    changed, concurrent lookups fan out across a small pool, and API calls are held to a budget.
+    """
+
+    def __init__(
+        self,
+        base_url: str = FINNHUB_BASE_URL,
+        token: str = FINNHUB_TOKEN,
+        rate_budget: RateBudget | None = None,
+        max_workers: int = MAX_CONCURRENT_REQUESTS,
+    ) -> None:
+        self.base_url = base_url
+        self.token = token
+        self.rate_budget = rate_budget or RateBudget(RATE_LIMIT_CALLS, RATE_LIMIT_PERIOD_SECONDS)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="finnhub")
+        self._cache: dict[str, CachedQuote] = {}
+        self._lock = threading.Lock()
+        self._stats: Counter[str] = Counter()
+
+    def get_quote(self, symbol: str) -> FinnhubResponse:
+        """Returns a stock quote for the given symbol, raising if it can't be fetched"""
+        symbol = symbol.upper()
+        if (quote := self._get_cached(symbol)) is not None:
+            return quote
+
+        return self._fetch(symbol)
+
+    def get_quotes(self, symbols: Iterable[str]) -> dict[str, FinnhubResponse]:
+        """Quotes for each symbol, fetched concurrently. Symbols that fail are logged and omitted"""
+        quotes: dict[str, FinnhubResponse] = {}
+        missing: list[str] = []
+        for symbol in dict.fromkeys(symbol.upper() for symbol in symbols):
+            if (quote := self._get_cached(symbol)) is not None:
+                quotes[symbol] = quote
+            else:
+                missing.append(symbol)
+
+        futures = {symbol: self._executor.submit(self._fetch, symbol) for symbol in missing}
+        for symbol, future in futures.items():
+            try:
+                quotes[symbol] = future.result()
+            except Exception as e:
+                log.error(
+                    "Finnhub API request failed", symbol=symbol, exception_type=type(e).__name__
+                )
+
+        return quotes
+
+    def get_cached_quotes(self, symbols: Iterable[str]) -> dict[str, FinnhubResponse]:
+        """Whatever quotes are cached for the symbols, stale or not, without calling the API"""
+        with self._lock:
+            return {
+                symbol: cached.quote
+                for symbol in (symbol.upper() for symbol in symbols)
+                if (cached := self._cache.get(symbol)) is not None
+            }
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {key: self._stats[key] for key in ("hits", "misses", "throttled")}
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._stats.clear()
+
+    def _get_cached(self, symbol: str) -> FinnhubResponse | None:
+        with self._lock:
+            cached = self._cache.get(symbol)
+            if cached is not None and local_now() < cached.expires_at:
+                self._stats["hits"] += 1
+                return cached.quote
+
+            self._stats["misses"] += 1
+            return None
+
+    def _fetch(self, symbol: str) -> FinnhubResponse:
+        if not self.rate_budget.try_acquire():
+            with self._lock:
+                self._stats["throttled"] += 1
+                stale = self._cache.get(symbol)
+            if stale is not None:
+                log.warning("Finnhub rate budget exhausted, serving stale quote", symbol=symbol)
+                return stale.quote
+            raise RateBudgetExceededError(f"Finnhub rate budget exhausted fetching {symbol}")
+
+        response = self.session.get(
+            f"{self.base_url}/quote",
+            params={"symbol": symbol, "token": self.token},
+            timeout=REQUEST_TIMEOUT_SECONDS,
+        )
+        response.raise_for_status()
+        quote = FinnhubResponse(**response.json())
+
+        fetched_at = local_now()
+        with self._lock:
+            self._cache[symbol] = CachedQuote(quote=quote, expires_at=get_quote_expiry(fetched_at))
+
+        return quote
 
-    response = requests.get(url, params, timeout=30)
-    quote = FinnhubResponse(**response.json())
 
-    return quote
+finnhub_client = FinnhubClient()
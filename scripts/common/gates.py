@@ -1,8 +1,12 @@
+import os
+import threading
+from collections import Counter
 from collections.abc import Callable
 from datetime import datetime, timedelta
 from enum import StrEnum
 from functools import wraps
-from typing import Any
+from time import monotonic
+from typing import Any, ClassVar
 
 from maestro.domains import ON
 from maestro.integrations import StateChangeEvent, StateManager
@@ -14,10 +18,15 @@ from maestro.triggers import (
     state_change_trigger,
 )
 from maestro.utils import JobScheduler, local_now, log, resolve_timestamp
+from redis import Redis
 
 from registry import input_boolean, input_datetime, input_select
+from scripts.common.cache_reads import get_many, get_raw_client
 
 GATE_EXPIRY_CACHE_PREFIX = "GATE_EXPIRY"
+GATE_INVALIDATION_CHANNEL = "GATE_INVALIDATION"
+LISTENER_POLL_SECONDS = 1.0
+LISTENER_RETRY_SECONDS = 30
 PLACEHOLDER_OPTION = "Select a gate..."
 GATE_SELECTOR_RESET_JOB_ID = "gate_selector_reset"
 
@@ -29,11 +38,22 @@ class Gate(StrEnum):
 
 
 class GateManager:
-    """Manages gate state in Redis for dynamically enabling/disabling functions"""
+    """
+    Manages gate state in Redis for dynamically enabling/disabling functions.
+    Gate expiries are cached per worker and only served while subscribed to invalidations.
+    """
 
     state_manager = StateManager()
     redis = state_manager.redis_client
 
+    _cache: ClassVar[dict[Gate, datetime | None]] = {}
+    _generations: ClassVar[Counter[Gate]] = Counter()
+    _stats: ClassVar[Counter[str]] = Counter()
+    _lock = threading.Lock()
+    _listener_ready = threading.Event()
+    _listener_pid: int | None = None
+    _listener_retry_at = 0.0
+
     @classmethod
     def _build_gate_key(cls, gate: Gate) -> str:
         return cls.redis.build_key(GATE_EXPIRY_CACHE_PREFIX, gate)
@@ -44,16 +64,51 @@ class GateManager:
         Check cache to see if gate key is present (not set = gate open).
         Returns the expiry datetime if closed, otherwise None.
         """
-        key = cls._build_gate_key(gate)
-        state = cls.redis.get(key)
+        return cls.gates_closed(gate)[gate]
 
-        return datetime.fromisoformat(state) if state else None
+    @classmethod
+    def gates_closed(cls, *gates: Gate) -> dict[Gate, datetime | None]:
+        """
+        Bulk version of `is_closed`. Any gates missing from the local cache are
+        resolved together in a single MGET rather than one GET per gate.
+        """
+        results: dict[Gate, datetime | None] = {}
+        generations: dict[Gate, int] = {}
+        use_cache = cls._ensure_listener()
+
+        if use_cache:
+            with cls._lock:
+                for gate in gates:
+                    if gate in cls._cache:
+                        cls._stats["hits"] += 1
+                        results[gate] = cls._unexpired(gate, cls._cache[gate])
+                    else:
+                        generations[gate] = cls._generations[gate]
+
+        missing = [gate for gate in dict.fromkeys(gates) if gate not in results]
+        if not missing:
+            return results
+
+        with cls._lock:
+            cls._stats["misses"] += len(missing)
+        fetched = cls._fetch_expiries(missing)
+        results.update(fetched)
+
+        if use_cache:
+            with cls._lock:
+                # An invalidation that landed during the fetch means our value may already be stale
+                for gate, expiry in fetched.items():
+                    if cls._generations[gate] == generations[gate] and cls._listener_ready.is_set():
+                        cls._cache[gate] = expiry
+
+        return results
 
     @classmethod
     def open(cls, gate: Gate) -> None:
         """Open gate (enable function)"""
         key = cls._build_gate_key(gate)
         cls.redis.delete(key)
+        cls._publish_invalidation(gate)
         log.info("Gate opened", gate=gate)
 
     @classmethod
@@ -62,19 +117,135 @@ class GateManager:
         key = cls._build_gate_key(gate)
         value = (local_now() + timedelta(seconds=ttl_seconds)).isoformat()
         cls.redis.set(key, value, ttl_seconds)
+        cls._publish_invalidation(gate)
         log.info("Gate closed", gate=gate)
 
     @classmethod
     def get_gates(cls) -> dict[str, datetime | None]:
-        return {gate: cls.is_closed(gate) for gate in sorted(Gate)}
+        gates = sorted(Gate)
+        expiries = cls.gates_closed(*gates)
+        return {gate: expiries[gate] for gate in gates}
+
+    @classmethod
+    def cache_stats(cls) -> dict[str, int]:
+        """Hit/miss/invalidation counters for this worker's gate cache"""
+        return {key: cls._stats[key] for key in ("hits", "misses", "invalidations")}
+
+    @classmethod
+    def reset_cache(cls) -> None:
+        """Drop all locally cached gate state and counters"""
+        with cls._lock:
+            cls._cache.clear()
+            cls._generations.update(Gate)
+            cls._stats.clear()
+
+    @classmethod
+    def _fetch_expiries(cls, gates: list[Gate]) -> dict[Gate, datetime | None]:
+        keys = [cls._build_gate_key(gate) for gate in gates]
+
+        states = get_many(keys, cls.redis)
+
+        return {
+            gate: datetime.fromisoformat(state) if state else None
+            for gate, state in zip(gates, states, strict=True)
+        }
+
+    @classmethod
+    def _unexpired(cls, gate: Gate, expiry: datetime | None) -> datetime | None:
+        """Track TTL expiry locally so an expired gate reads as open without a round trip"""
+        if expiry is not None and expiry <= local_now():
+            cls._cache[gate] = None
+            return None
+        return expiry
+
+    @classmethod
+    def _invalidate(cls, gate: Gate | None = None) -> None:
+        with cls._lock:
+            cls._stats["invalidations"] += 1
+            gates = list(Gate) if gate is None else [gate]
+            for gate_ in gates:
+                cls._generations[gate_] += 1
+                cls._cache.pop(gate_, None)
+
+    @classmethod
+    def _raw_client(cls) -> Redis | None:
+        return get_raw_client(cls.redis)
+
+    @classmethod
+    def _publish_invalidation(cls, gate: Gate) -> None:
+        cls._invalidate(gate)
+        if (client := cls._raw_client()) is None:
+            return
+
+        try:
+            client.publish(GATE_INVALIDATION_CHANNEL, str(gate))
+        except Exception:
+            log.exception("Failed to publish gate invalidation", gate=gate)
+
+    @classmethod
+    def _ensure_listener(cls) -> bool:
+        """
+        Start this worker's invalidation listener if it isn't running (e.g. after a fork).
+        Returns True if the local cache can be trusted.
+        """
+        pid = os.getpid()
+        if cls._listener_pid == pid:
+            return cls._listener_ready.is_set()
+        if cls._raw_client() is None:
+            return False
+
+        with cls._lock:
+            if cls._listener_pid == pid or monotonic() < cls._listener_retry_at:
+                return cls._listener_ready.is_set()
+
+            cls._listener_pid = pid
+            cls._listener_ready.clear()
+            cls._cache.clear()
+
+        threading.Thread(target=cls._listen, name="gate-invalidation", daemon=True).start()
+        return False
+
+    @classmethod
+    def _listen(cls) -> None:
+        try:
+            if (client := cls._raw_client()) is None:
+                return
+            pubsub = client.pubsub()
+            pubsub.subscribe(GATE_INVALIDATION_CHANNEL)
+
+            while True:
+                # Poll instead of listen() since the client's socket timeout breaks blocking reads
+                message = pubsub.get_message(timeout=LISTENER_POLL_SECONDS)
+                if message is None:
+                    continue
+                if message["type"] == "subscribe":
+                    cls._listener_ready.set()
+                elif message["type"] == "message":
+                    data = message["data"]
+                    data = data.decode() if isinstance(data, bytes) else str(data)
+                    cls._invalidate(Gate(data) if data in Gate else None)
+        except Exception:
+            log.exception("Gate invalidation listener stopped, falling back to direct reads")
+        finally:
+            with cls._lock:
+                cls._listener_ready.clear()
+                cls._cache.clear()
+                cls._listener_pid = None
+                cls._listener_retry_at = monotonic() + LISTENER_RETRY_SECONDS
 
 
 def gate_check(gate: Gate, func_name: str | None = None) -> bool:
     """Returns True if the provided gate is open"""
-    if GateManager.is_closed(gate) is None:
+    return gates_check(gate, func_name=func_name)
+
+
+def gates_check(*gates: Gate, func_name: str | None = None) -> bool:
+    """Returns True if all of the provided gates are open"""
+    closed_gates = [gate for gate, expiry in GateManager.gates_closed(*gates).items() if expiry]
+    if not closed_gates:
         return True
 
-    log_kwargs: dict[str, str] = {"gate": gate}
+    log_kwargs: dict[str, str] = {"gate": ", ".join(closed_gates)}
     if func_name is not None:
         log_kwargs["function"] = func_name
     log.info("Function execution skipped - gate closed", **log_kwargs)
@@ -82,16 +253,16 @@ def gate_check(gate: Gate, func_name: str | None = None) -> bool:
     return False
 
 
-def require_gate_check(gate: Gate) -> Callable:
+def require_gate_check(*gates: Gate) -> Callable:
     """
-    Decorator to check a gate before running a function.
+    Decorator to check one or more gates before running a function.
     IMPORTANT: The @gate_check decorator must be *inside* (ordered after) any trigger decorators
     """
 
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            if not gate_check(gate, func_name=func.__name__):
+            if not gates_check(*gates, func_name=func.__name__):
                 return None
 
             return func(*args, **kwargs)
@@ -0,0 +1,54 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from maestro.utils import JobScheduler
+
+
+@dataclass(frozen=True)
+class GroupJob:
+    job_id: str
+    run_time: datetime
+    func: Callable[..., Any]
+    func_params: dict[str, Any] | None = None
+
+
+class JobGroup:
+    """
+    Related jobs scheduled and cancelled together. A group's members are the scheduled jobs
+    whose IDs start with `<name>_`, so membership is read from the job store itself and can't
+    drift from it: jobs that have run drop out, and concurrent writers can't lose each other's.
+    """
+
+    def __init__(self, name: str, scheduler: JobScheduler | None = None) -> None:
+        self.name = name
+        self.prefix = f"{name}_"
+        self.scheduler = scheduler or JobScheduler()
+
+    def schedule(self, *jobs: GroupJob) -> None:
+        """Schedule jobs into the group, replacing any member with the same ID"""
+        for job in jobs:
+            if not job.job_id.startswith(self.prefix):
+                raise ValueError(f"Job ID {job.job_id} must start with {self.prefix}")
+
+        for job in jobs:
+            self.scheduler.schedule_job(
+                run_time=job.run_time,
+                func=job.func,
+                func_params=job.func_params,
+                job_id=job.job_id,
+            )
+
+    def job_ids(self) -> list[str]:
+        """Members still waiting to run, read from the job store in one call"""
+        return sorted(
+            job.id
+            for job in self.scheduler.apscheduler.get_jobs()
+            if job.id.startswith(self.prefix)
+        )
+
+    def cancel(self) -> None:
+        """Cancel every member still waiting to run"""
+        for job_id in self.job_ids():
+            self.scheduler.cancel_job(job_id)
@@ -0,0 +1,132 @@
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from functools import cache
+from zoneinfo import ZoneInfo
+
+MARKET_TIMEZONE = ZoneInfo("America/New_York")
+MARKET_OPEN = time(9, 30)
+MARKET_CLOSE = time(16, 0)
+EARLY_CLOSE = time(13, 0)
+JUNETEENTH_FIRST_YEAR = 2022
+
+
+@dataclass(frozen=True)
+class MarketSession:
+    open: datetime
+    close: datetime
+
+    def __contains__(self, moment: datetime) -> bool:
+        return self.open <= moment < self.close
+
+
+def get_session(day: date) -> MarketSession | None:
+    """NYSE regular session for a date, or None if the market doesn't open"""
+    if day.weekday() >= 5 or day in get_holidays(day.year):
+        return None
+
+    close = EARLY_CLOSE if day in get_early_closes(day.year) else MARKET_CLOSE
+    return MarketSession(
+        open=datetime.combine(day, MARKET_OPEN, tzinfo=MARKET_TIMEZONE),
+        close=datetime.combine(day, close, tzinfo=MARKET_TIMEZONE),
+    )
+
+
+def get_current_session(moment: datetime) -> MarketSession | None:
+    session = get_session(moment.astimezone(MARKET_TIMEZONE).date())
+    return session if session is not None and moment in session else None
+
+
+def is_market_open(moment: datetime) -> bool:
+    return get_current_session(moment) is not None
+
+
+def get_next_session(moment: datetime) -> MarketSession:
+    """The session in progress at `moment`, otherwise the next one to open"""
+    day = moment.astimezone(MARKET_TIMEZONE).date()
+    while True:
+        session = get_session(day)
+        if session is not None and moment < session.close:
+            return session
+        day += timedelta(days=1)
+
+
+def get_next_market_open(moment: datetime) -> datetime:
+    """First session open strictly after `moment`"""
+    session = get_next_session(moment)
+    if session.open <= moment:
+        session = get_next_session(session.close)
+
+    return session.open
+
+
+@cache
+def get_holidays(year: int) -> frozenset[date]:
+    """NYSE full-day closures, moved to the nearest weekday when they fall on a weekend"""
+    holidays = {
+        _nth_weekday(year, 1, weekday=0, n=3),  # Martin Luther King Jr. Day
+        _nth_weekday(year, 2, weekday=0, n=3),  # Washington's Birthday
+        _easter(year) - timedelta(days=2),  # Good Friday
+        _last_weekday(year, 5, weekday=0),  # Memorial Day
+        _observed(date(year, 7, 4)),  # Independence Day
+        _nth_weekday(year, 9, weekday=0, n=1),  # Labor Day
+        _nth_weekday(year, 11, weekday=3, n=4),  # Thanksgiving
+        _observed(date(year, 12, 25)),  # Christmas
+    }
+    if year >= JUNETEENTH_FIRST_YEAR:
+        holidays.add(_observed(date(year, 6, 19)))
+
+    # NYSE doesn't close on the prior Friday when New Year's Day falls on a Saturday
+    new_years = date(year, 1, 1)
+    if new_years.weekday() != 5:
+        holidays.add(_observed(new_years))
+
+    return frozenset(holidays)
+
+
+@cache
+def get_early_closes(year: int) -> frozenset[date]:
+    """Trading days that close at 1pm: before Independence Day, after Thanksgiving, Christmas Eve"""
+    holidays = get_holidays(year)
+    candidates = [
+        _nth_weekday(year, 11, weekday=3, n=4) + timedelta(days=1),
+        date(year, 12, 24),
+    ]
+    if date(year, 7, 4).weekday() < 5:
+        candidates.append(date(year, 7, 3))
+
+    return frozenset(day for day in candidates if day.weekday() < 5 and day not in holidays)
+
+
+def _observed(holiday: date) -> date:
+    if holiday.weekday() == 5:
+        return holiday - timedelta(days=1)
+    if holiday.weekday() == 6:
+        return holiday + timedelta(days=1)
+    return holiday
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    first = date(year, month, 1)
+    return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+
+
+def _last_weekday(year: int, month: int, weekday: int) -> date:
+    next_month = date(year + month // 12, month % 12 + 1, 1)
+    last = next_month - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter(year: int) -> date:
+    """Gregorian Easter Sunday (anonymous Gregorian algorithm)"""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+
+    return date(year, month, day + 1)
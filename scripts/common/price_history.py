@@ -0,0 +1,177 @@
+import base64
+import struct
+import threading
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from datetime import datetime
+
+from maestro.integrations import StateManager
+from maestro.utils import IntervalSeconds
+
+from scripts.common.finance import FinnhubResponse
+from scripts.common.market_calendar import MARKET_TIMEZONE, MarketSession, get_session
+
+PRICE_HISTORY_KEY_PREFIX = "PRICE_HISTORY"
+# A little over two full sessions of one-minute quotes, at 16 bytes per point
+HISTORY_CAPACITY = 1024
+
+_HEADER = struct.Struct("<I")
+
+
+class PriceHistory:
+    """Fixed-capacity ring buffer of (timestamp, price) points, oldest overwritten first"""
+
+    def __init__(self, symbol: str, capacity: int = HISTORY_CAPACITY) -> None:
+        self.symbol = symbol
+        self.capacity = capacity
+        self._timestamps = array("d", [0.0]) * capacity
+        self._prices = array("d", [0.0]) * capacity
+        self._start = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def last_timestamp(self) -> float | None:
+        if not self._count:
+            return None
+        return self._timestamps[(self._start + self._count - 1) % self.capacity]
+
+    def append(self, timestamp: float, price: float) -> bool:
+        """Add a point. Repeats of the latest quote and out-of-order points are ignored"""
+        last_timestamp = self.last_timestamp
+        if last_timestamp is not None and timestamp <= last_timestamp:
+            return False
+
+        index = (self._start + self._count) % self.capacity
+        self._timestamps[index] = timestamp
+        self._prices[index] = price
+        if self._count < self.capacity:
+            self._count += 1
+        else:
+            self._start = (self._start + 1) % self.capacity
+
+        return True
+
+    def timestamps(self) -> array:
+        return self._ordered(self._timestamps)
+
+    def prices(self) -> array:
+        return self._ordered(self._prices)
+
+    def to_bytes(self) -> bytes:
+        return _HEADER.pack(self._count) + self.timestamps().tobytes() + self.prices().tobytes()
+
+    @classmethod
+    def from_bytes(cls, symbol: str, data: bytes, capacity: int = HISTORY_CAPACITY) -> PriceHistory:
+        (count,) = _HEADER.unpack_from(data)
+        timestamps = array("d")
+        prices = array("d")
+        offset = _HEADER.size
+        timestamps.frombytes(data[offset : offset + count * 8])
+        prices.frombytes(data[offset + count * 8 : offset + count * 16])
+
+        # Keep the newest points if the capacity has shrunk since this was stored
+        history = cls(symbol, capacity)
+        for timestamp, price in zip(timestamps[-capacity:], prices[-capacity:], strict=True):
+            history.append(timestamp, price)
+
+        return history
+
+    def _ordered(self, values: array) -> array:
+        end = self._start + self._count
+        if end <= self.capacity:
+            return values[self._start : end]
+        return values[self._start :] + values[: end - self.capacity]
+
+
+def downsample_session(
+    history: PriceHistory, buckets: int, session: MarketSession | None = None
+) -> list[float]:
+    """
+    Last price in each of `buckets` equal slices of a session, defaulting to the session of the
+    latest point. Gaps carry the previous price forward, and slices not yet reached are omitted.
+    """
+    last_timestamp = history.last_timestamp
+    if last_timestamp is None:
+        return []
+
+    if session is None:
+        session = get_session(datetime.fromtimestamp(last_timestamp, MARKET_TIMEZONE).date())
+    if session is None:
+        return []
+
+    timestamps = history.timestamps()
+    prices = history.prices()
+    open_timestamp = session.open.timestamp()
+    bucket_seconds = (session.close.timestamp() - open_timestamp) / buckets
+
+    first = bisect_left(timestamps, open_timestamp)
+    if first == len(timestamps):
+        return []
+
+    # Open the line at the last pre-session price, if there is one
+    price = prices[first - 1] if first else prices[first]
+    values: list[float] = []
+    index = first
+    for bucket in range(buckets):
+        bucket_end = open_timestamp + bucket_seconds * (bucket + 1)
+        while index < len(timestamps) and timestamps[index] < bucket_end:
+            price = prices[index]
+            index += 1
+        values.append(price)
+        if index == len(timestamps):
+            break
+
+    return values
+
+
+_histories: dict[str, PriceHistory] = {}
+_lock = threading.Lock()
+
+
+def get_price_history(symbol: str) -> PriceHistory:
+    """This process's copy of a symbol's history, loaded from Redis on first use"""
+    with _lock:
+        if (history := _histories.get(symbol)) is None:
+            history = _histories[symbol] = load_price_history(symbol)
+        return history
+
+
+def record_quotes(quotes: Mapping[str, FinnhubResponse]) -> None:
+    """Append each quote to its symbol's history, persisting only the ones that changed"""
+    for symbol, quote in quotes.items():
+        history = get_price_history(symbol)
+        with _lock:
+            appended = history.append(quote.t, quote.c)
+        if appended:
+            save_price_history(history)
+
+
+def load_price_history(symbol: str) -> PriceHistory:
+    redis = StateManager().redis_client
+    encoded = redis.get(key=redis.build_key(PRICE_HISTORY_KEY_PREFIX, symbol))
+    if not encoded:
+        return PriceHistory(symbol)
+
+    return PriceHistory.from_bytes(symbol, base64.b64decode(encoded))
+
+
+def save_price_history(history: PriceHistory) -> None:
+    redis = StateManager().redis_client
+    with _lock:
+        encoded = base64.b64encode(history.to_bytes()).decode()
+
+    redis.set(
+        key=redis.build_key(PRICE_HISTORY_KEY_PREFIX, history.symbol),
+        value=encoded,
+        ttl_seconds=IntervalSeconds.ONE_WEEK,
+    )
+
+
+def clear_price_histories() -> None:
+    """Drop this process's in-memory copies. The next read reloads from Redis"""
+    with _lock:
+        _histories.clear()
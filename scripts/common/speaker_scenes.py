@@ -0,0 +1,138 @@
+import json
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import cast
+
+from maestro.domains import MediaPlayer
+from maestro.integrations import AttributeId, EntityId, StateManager
+
+from custom_domains.sonos_speaker import BulkActionReport, SonosSpeaker, SpeakerAction
+from scripts.common.cache_reads import get_cached_states
+
+SCENE_KEY_PREFIX = "SPEAKER_SCENE"
+SCENE_ATTRIBUTES = ("volume_level", "is_volume_muted", "group_members", "source")
+
+
+@dataclass(frozen=True)
+class SpeakerState:
+    """Target state for one player. Fields left as None are not part of the scene"""
+
+    volume: float | None = None
+    muted: bool | None = None
+    # Coordinator first, as HA lists it. A lone speaker is ungrouped
+    group: tuple[str, ...] | None = None
+    source: str | None = None
+
+
+type SpeakerScene = dict[EntityId, SpeakerState]
+
+
+def capture_scene(players: Sequence[MediaPlayer]) -> SpeakerScene:
+    """Current state of every player, read from the state cache in one round trip"""
+    values = get_cached_states(
+        [
+            AttributeId(f"{player.id}.{attribute}")
+            for player in players
+            for attribute in SCENE_ATTRIBUTES
+        ]
+    )
+    width = len(SCENE_ATTRIBUTES)
+    scene: SpeakerScene = {}
+    for index, player in enumerate(players):
+        volume, muted, group, source = values[index * width : (index + 1) * width]
+        scene[player.id] = SpeakerState(
+            volume=cast(float | None, volume),
+            muted=cast(bool | None, muted),
+            group=None if group is None else tuple(cast(list[str], group)),
+            source=cast(str | None, source),
+        )
+
+    return scene
+
+
+def get_scene_actions(
+    scene: SpeakerScene, current: SpeakerScene, players: Iterable[MediaPlayer]
+) -> list[SpeakerAction]:
+    """Only the actions needed to move each player from its current state to the scene"""
+    actions: list[SpeakerAction] = []
+    for player in players:
+        if (target := scene.get(player.id)) is None:
+            continue
+        state = current.get(player.id, SpeakerState())
+
+        if target.volume is not None and state.volume != target.volume:
+            actions.append(SpeakerAction(player, "volume_set", {"volume_level": target.volume}))
+        if target.muted is not None and state.muted != target.muted:
+            actions.append(SpeakerAction(player, "volume_mute", {"is_volume_muted": target.muted}))
+        if target.source is not None and state.source != target.source:
+            actions.append(SpeakerAction(player, "select_source", {"source": target.source}))
+        if target.group is not None and state.group != target.group:
+            actions.extend(_group_actions(player, target.group, state.group))
+
+    return actions
+
+
+def apply_scene(
+    scene: SpeakerScene,
+    players: Sequence[MediaPlayer],
+    extra_actions: Iterable[SpeakerAction] = (),
+) -> BulkActionReport:
+    """Apply the scene's deltas, with any other actions, in a single parallel pass"""
+    actions = get_scene_actions(scene, capture_scene(players), players)
+    return SonosSpeaker.perform_bulk([*extra_actions, *actions])
+
+
+def save_scene(name: str, scene: SpeakerScene) -> None:
+    redis_client = StateManager().redis_client
+    encoded = {
+        entity_id: [state.volume, state.muted, state.group, state.source]
+        for entity_id, state in scene.items()
+    }
+    redis_client.set(
+        key=redis_client.build_key(SCENE_KEY_PREFIX, name),
+        value=json.dumps(encoded, separators=(",", ":")),
+        ttl_seconds=None,
+    )
+
+
+def load_scene(name: str) -> SpeakerScene | None:
+    redis_client = StateManager().redis_client
+    encoded = redis_client.get(key=redis_client.build_key(SCENE_KEY_PREFIX, name))
+    if encoded is None:
+        return None
+
+    scene: SpeakerScene = {}
+    for entity_id, (volume, muted, group, source) in json.loads(encoded).items():
+        scene[EntityId(entity_id)] = SpeakerState(
+            volume=volume,
+            muted=muted,
+            group=None if group is None else tuple(group),
+            source=source,
+        )
+
+    return scene
+
+
+def snapshot_scene(name: str, players: Sequence[MediaPlayer]) -> SpeakerScene:
+    """Capture and store the players' current state, eg. before an announcement"""
+    scene = capture_scene(players)
+    save_scene(name, scene)
+    return scene
+
+
+def restore_scene(name: str, players: Sequence[MediaPlayer]) -> BulkActionReport | None:
+    """Put the players back to a stored scene. Returns None if no such scene was saved"""
+    if (scene := load_scene(name)) is None:
+        return None
+    return apply_scene(scene, players)
+
+
+def _group_actions(
+    player: MediaPlayer, target: tuple[str, ...], current: tuple[str, ...] | None
+) -> list[SpeakerAction]:
+    # A group is rebuilt from its coordinator. Members are moved by its join, not their own
+    if len(target) > 1 and target[0] == player.id:
+        return [SpeakerAction(player, "join", {"group_members": list(target[1:])})]
+    if len(target) <= 1 and current is not None and len(current) > 1:
+        return [SpeakerAction(player, "unjoin")]
+    return []
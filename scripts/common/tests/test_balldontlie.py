@@ -0,0 +1,88 @@
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from maestro.testing import MaestroTest
+
+from ..balldontlie import (
+    INNING_BREAK_POLL_INTERVAL,
+    MID_INNING_POLL_INTERVAL,
+    PRE_GAME_POLL_INTERVAL,
+    STATUS_FINAL,
+    STATUS_IN_PROGRESS,
+    BalldontlieClient,
+    InningHalf,
+    LiveGameData,
+    TokenBucket,
+    get_poll_interval,
+)
+
+GAME_DATE = "2026-06-01"
+
+
+def build_response(status: str, period: int = 5, inning: str = "top") -> MagicMock:
+    game: dict[str, Any] = {
+        "status": status,
+        "period": period,
+        "scoring_summary": [{"away_score": 2, "home_score": 3, "inning": inning}],
+    }
+    response = MagicMock()
+    response.json.return_value = {"data": [game]}
+    return response
+
+
+def build_game(status: str, period: int, inning_half: InningHalf) -> LiveGameData:
+    return LiveGameData(
+        away_runs=0, home_runs=0, status=status, period=period, inning_half=inning_half
+    )
+
+
+def test_final_game_is_cached(mt: MaestroTest) -> None:
+    client = BalldontlieClient()
+
+    with patch.object(client.session, "get") as session_get:
+        session_get.return_value = build_response(STATUS_IN_PROGRESS)
+        game = client.get_live_game(10, GAME_DATE)
+        assert game is not None
+        assert (game.away_runs, game.home_runs, game.inning_half) == (2, 3, InningHalf.TOP)
+
+        session_get.return_value = build_response(STATUS_FINAL, period=9)
+        assert client.get_live_game(10, GAME_DATE) == client.get_latest_game(10, GAME_DATE)
+
+        # Final results are served without calling the API again
+        for _ in range(3):
+            game = client.get_live_game(10, GAME_DATE)
+            assert game is not None
+            assert game.is_final
+
+    assert session_get.call_count == 2
+
+
+def test_rate_limit_serves_latest_result(mt: MaestroTest) -> None:
+    client = BalldontlieClient()
+    client.token_bucket = TokenBucket(capacity=2, period_seconds=3600)
+
+    with patch.object(client.session, "get") as session_get:
+        session_get.return_value = build_response(STATUS_IN_PROGRESS)
+        for _ in range(5):
+            game = client.get_live_game(10, GAME_DATE)
+            assert game is not None
+
+    assert session_get.call_count == 2
+
+
+def test_poll_interval() -> None:
+    top_5 = build_game(STATUS_IN_PROGRESS, 5, InningHalf.TOP)
+    bottom_5 = build_game(STATUS_IN_PROGRESS, 5, InningHalf.BOTTOM)
+
+    # Fast during play, slower right after the half-inning turns over
+    assert get_poll_interval(top_5, previous=top_5) == MID_INNING_POLL_INTERVAL
+    assert get_poll_interval(bottom_5, previous=top_5) == INNING_BREAK_POLL_INTERVAL
+    assert get_poll_interval(top_5) == MID_INNING_POLL_INTERVAL
+
+    # Slow before first pitch or during a stoppage, and stopped once final
+    scheduled = build_game("STATUS_SCHEDULED", 0, InningHalf.TOP)
+    assert get_poll_interval(scheduled) == PRE_GAME_POLL_INTERVAL
+    delayed = build_game("STATUS_DELAYED", 6, InningHalf.TOP)
+    assert get_poll_interval(delayed) == INNING_BREAK_POLL_INTERVAL
+    assert get_poll_interval(build_game(STATUS_FINAL, 9, InningHalf.BOTTOM)) is None
+    assert get_poll_interval(None) == INNING_BREAK_POLL_INTERVAL
@@ -0,0 +1,62 @@
+from unittest.mock import MagicMock, patch
+
+from maestro.integrations import AttributeId, EntityId, StateManager
+from maestro.testing import MaestroTest
+from redis import Redis
+
+from registry import media_player
+
+from ..cache_reads import get_cached_states, get_many, get_raw_client
+
+test_speaker = media_player.living_room
+
+
+def fake_raw_client() -> MagicMock:
+    """A redis-py client whose MGET reads through to the test cache"""
+    redis_client = StateManager().redis_client
+    raw_client = MagicMock(spec=Redis)
+    raw_client.mget.side_effect = lambda keys: [redis_client.get(key) for key in keys]
+    return raw_client
+
+
+def test_get_many(mt: MaestroTest) -> None:
+    redis_client = StateManager().redis_client
+    redis_client.set("test_key_1", "one", ttl_seconds=None)
+    redis_client.set("test_key_2", "two", ttl_seconds=None)
+    keys = ["test_key_1", "missing", "test_key_2"]
+
+    # Without a raw client every key is read on its own
+    assert get_raw_client(redis_client) is None
+    assert get_many(keys) == ["one", None, "two"]
+
+    # With one, all keys are read in a single MGET
+    raw_client = fake_raw_client()
+    with patch.object(redis_client, "client", raw_client, create=True):
+        assert get_raw_client(redis_client) is raw_client
+        assert get_many(keys) == ["one", None, "two"]
+        assert get_many([]) == []
+    raw_client.mget.assert_called_once_with(keys)
+
+
+def test_get_cached_states(mt: MaestroTest) -> None:
+    mt.set_state(
+        test_speaker,
+        "playing",
+        {"volume_level": 0.4, "is_volume_muted": False, "group_members": [test_speaker.id]},
+    )
+    state_ids = [
+        test_speaker.id,
+        AttributeId(f"{test_speaker.id}.volume_level"),
+        AttributeId(f"{test_speaker.id}.is_volume_muted"),
+        AttributeId(f"{test_speaker.id}.group_members"),
+        EntityId("media_player.missing"),
+    ]
+    expected = ["playing", 0.4, False, [test_speaker.id], None]
+
+    # Values come back decoded to their cached types, over either read path
+    assert get_cached_states(state_ids) == expected
+
+    raw_client = fake_raw_client()
+    with patch.object(StateManager().redis_client, "client", raw_client, create=True):
+        assert get_cached_states(state_ids) == expected
+    assert raw_client.mget.call_count == 1
@@ -0,0 +1,73 @@
+from time import perf_counter, sleep
+from unittest.mock import patch
+
+import pytest
+from maestro.testing import MaestroTest
+
+from ..connectivity import ConnectivityMonitor, ProbeTarget
+
+reachable: ProbeTarget = ("10.0.0.1", 53)
+unreachable: ProbeTarget = ("10.0.0.2", 53)
+
+
+def fake_connect(target: ProbeTarget, timeout: float) -> None:
+    sleep(0.2 if target == reachable else timeout)
+    if target == unreachable:
+        raise OSError("timed out")
+
+
+def test_probe_targets_concurrently(mt: MaestroTest) -> None:
+    monitor = ConnectivityMonitor(
+        targets=(reachable, unreachable),
+        timeout_seconds=0.3,
+        connect=fake_connect,
+        start_monitor=False,
+    )
+
+    start = perf_counter()
+    probe_round = monitor.probe()
+    elapsed = perf_counter() - start
+
+    # Bounded by the slowest target rather than the sum of both
+    assert elapsed < 0.45
+    assert probe_round.sent == 2
+    assert probe_round.lost == 1
+    assert probe_round.latency_ms == pytest.approx(200, abs=100)
+
+
+def test_status_is_cached(mt: MaestroTest) -> None:
+    monitor = ConnectivityMonitor(targets=(reachable,), connect=fake_connect, start_monitor=False)
+
+    with patch.object(monitor, "probe", wraps=monitor.probe) as probe:
+        # The first read measures once, later reads are served from history
+        status = monitor.status()
+        assert status.online
+        assert status.latency_ms is not None
+        assert status.packet_loss == 0.0
+
+        monitor.status()
+        monitor.status()
+        assert probe.call_count == 1
+
+
+def test_status_tracks_packet_loss(mt: MaestroTest) -> None:
+    online = True
+
+    def flaky_connect(target: ProbeTarget, timeout: float) -> None:
+        if not online:
+            raise OSError("unreachable")
+
+    monitor = ConnectivityMonitor(targets=(reachable,), connect=flaky_connect, start_monitor=False)
+    monitor.probe()
+    online = False
+    monitor.probe()
+
+    status = monitor.status()
+    assert not status.online
+    assert status.latency_ms is None
+    assert status.packet_loss == 0.5
+
+    online = True
+    monitor.probe()
+    assert monitor.status().online
+    assert len(monitor.history()) == 3
@@ -0,0 +1,170 @@
+import json
+import threading
+from collections import Counter
+from collections.abc import Iterator
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import sleep
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from maestro.testing import MaestroTest
+
+from ..finance import (
+    FinnhubClient,
+    QuoteRefresh,
+    RateBudget,
+    RateBudgetExceededError,
+    get_next_quote_refresh,
+    get_quote_expiry,
+)
+from ..market_calendar import MARKET_TIMEZONE
+
+# Tuesday, mid-session and after the close
+MARKET_HOURS = datetime(2026, 3, 10, 11, 0, tzinfo=MARKET_TIMEZONE)
+AFTER_HOURS = datetime(2026, 3, 10, 18, 0, tzinfo=MARKET_TIMEZONE)
+
+
+class FakeFinnhub(ThreadingHTTPServer):
+    def __init__(self, delay_seconds: float = 0.0) -> None:
+        super().__init__(("127.0.0.1", 0), FakeFinnhubHandler)
+        self.delay_seconds = delay_seconds
+        self.requests: Counter[str] = Counter()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+
+class FakeFinnhubHandler(BaseHTTPRequestHandler):
+    server: FakeFinnhub
+
+    def do_GET(self) -> None:
+        symbol = parse_qs(urlparse(self.path).query)["symbol"][0]
+        with self.server.lock:
+            self.server.requests[symbol] += 1
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(self.server.max_in_flight, self.server.in_flight)
+
+        sleep(self.server.delay_seconds)
+        body = json.dumps(
+            {"c": 100.0, "d": 1.0, "dp": 1.0, "h": 101, "l": 99, "o": 99, "pc": 99, "t": 0}
+        ).encode()
+
+        with self.server.lock:
+            self.server.in_flight -= 1
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None: ...
+
+
+@pytest.fixture
+def finnhub() -> Iterator[FakeFinnhub]:
+    server = FakeFinnhub(delay_seconds=0.1)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_get_quotes_concurrently(mt: MaestroTest, finnhub: FakeFinnhub) -> None:
+    client = FinnhubClient(base_url=finnhub.base_url)
+
+    with mt.mock_datetime_as(MARKET_HOURS):
+        quotes = client.get_quotes(["spy", "NET", "SPY"])
+
+    assert set(quotes) == {"SPY", "NET"}
+    assert quotes["SPY"].c == 100.0
+    assert finnhub.requests == {"SPY": 1, "NET": 1}
+    assert finnhub.max_in_flight == 2
+
+
+def test_quote_cache_during_market_hours(mt: MaestroTest, finnhub: FakeFinnhub) -> None:
+    client = FinnhubClient(base_url=finnhub.base_url)
+
+    with mt.mock_datetime_as(MARKET_HOURS):
+        client.get_quote("SPY")
+        client.get_quote("SPY")
+    assert finnhub.requests["SPY"] == 1
+
+    # Quotes expire within a minute while the market trades
+    with mt.mock_datetime_as(MARKET_HOURS.replace(minute=1)):
+        client.get_quote("SPY")
+    assert finnhub.requests["SPY"] == 2
+    assert client.stats() == {"hits": 1, "misses": 2, "throttled": 0}
+
+
+def test_quote_cache_while_market_closed(mt: MaestroTest, finnhub: FakeFinnhub) -> None:
+    client = FinnhubClient(base_url=finnhub.base_url)
+
+    # A quote fetched after the close holds until the next open
+    assert get_quote_expiry(AFTER_HOURS) == datetime(2026, 3, 11, 9, 30, tzinfo=MARKET_TIMEZONE)
+
+    with mt.mock_datetime_as(AFTER_HOURS):
+        client.get_quotes(["SPY", "NET"])
+    for hour in (19, 22, 23):
+        with mt.mock_datetime_as(AFTER_HOURS.replace(hour=hour)):
+            client.get_quotes(["SPY", "NET"])
+
+    assert finnhub.requests == {"SPY": 1, "NET": 1}
+
+
+def test_rate_budget(mt: MaestroTest, finnhub: FakeFinnhub) -> None:
+    client = FinnhubClient(base_url=finnhub.base_url, rate_budget=RateBudget(2, period_seconds=60))
+
+    with mt.mock_datetime_as(MARKET_HOURS):
+        client.get_quotes(["SPY", "NET"])
+    assert client.rate_budget.remaining() == 0
+
+    # Over budget, a stale quote is served in place of a call
+    with mt.mock_datetime_as(MARKET_HOURS.replace(minute=5)):
+        quotes = client.get_quotes(["SPY", "QQQ"])
+        with pytest.raises(RateBudgetExceededError):
+            client.get_quote("QQQ")
+
+    assert set(quotes) == {"SPY"}
+    assert finnhub.requests == {"SPY": 1, "NET": 1}
+    assert client.stats()["throttled"] == 3
+
+
+def test_cached_quotes_skip_the_api(mt: MaestroTest, finnhub: FakeFinnhub) -> None:
+    client = FinnhubClient(base_url=finnhub.base_url)
+    assert client.get_cached_quotes(["SPY"]) == {}
+
+    with mt.mock_datetime_as(MARKET_HOURS):
+        client.get_quote("SPY")
+    with mt.mock_datetime_as(AFTER_HOURS):
+        assert set(client.get_cached_quotes(["spy", "NET"])) == {"SPY"}
+
+    assert finnhub.requests == {"SPY": 1}
+
+
+def test_next_quote_refresh() -> None:
+    def at(month: int, day: int, hour: int, minute: int, second: int = 0) -> datetime:
+        return datetime(2026, month, day, hour, minute, second, tzinfo=MARKET_TIMEZONE)
+
+    # Every minute through the session, on the minute
+    assert get_next_quote_refresh(at(3, 10, 11, 0, 12)) == QuoteRefresh(at(3, 10, 11, 1), False)
+
+    # One settle refresh after the close, including when the last tick runs late
+    assert get_next_quote_refresh(at(3, 10, 15, 59)) == QuoteRefresh(at(3, 10, 16, 2), True)
+    assert get_next_quote_refresh(at(3, 10, 16, 0, 5)) == QuoteRefresh(at(3, 10, 16, 2), True)
+
+    # Then nothing until the next open
+    assert get_next_quote_refresh(at(3, 10, 16, 2)) == QuoteRefresh(at(3, 11, 9, 30), False)
+    assert get_next_quote_refresh(at(3, 11, 6, 0)) == QuoteRefresh(at(3, 11, 9, 30), False)
+
+    # Over a weekend, a holiday, and an early close
+    assert get_next_quote_refresh(at(3, 13, 17, 0)) == QuoteRefresh(at(3, 16, 9, 30), False)
+    assert get_next_quote_refresh(at(4, 2, 17, 0)) == QuoteRefresh(at(4, 6, 9, 30), False)
+    assert get_next_quote_refresh(at(11, 27, 12, 59)) == QuoteRefresh(at(11, 27, 13, 2), True)
@@ -0,0 +1,194 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import timedelta
+from enum import StrEnum
+from typing import cast
+from unittest.mock import MagicMock, patch
+
+from maestro.testing import MaestroTest
+from maestro.utils import local_now
+from redis import Redis
+
+from ..gates import (
+    GATE_INVALIDATION_CHANNEL,
+    Gate,
+    GateManager,
+    gate_check,
+    gates_check,
+    require_gate_check,
+)
+
+test_gate = Gate.CRITICAL_DOOR_NOTIFS
+
+
+@contextmanager
+def cached_reads() -> Iterator[MagicMock]:
+    """Serve reads through a fake redis-py client with the invalidation listener marked ready"""
+    raw_client = MagicMock(spec=Redis)
+    raw_client.mget.side_effect = lambda keys: [GateManager.redis.get(key) for key in keys]
+
+    GateManager.reset_cache()
+    GateManager._listener_ready.set()
+    try:
+        with (
+            patch.object(GateManager.redis, "client", raw_client, create=True),
+            patch.object(GateManager, "_ensure_listener", return_value=True),
+        ):
+            yield raw_client
+    finally:
+        GateManager._listener_ready.clear()
+        GateManager.reset_cache()
+
+
+def test_open_and_close(mt: MaestroTest) -> None:
+    # Gates are open by default
+    assert GateManager.is_closed(test_gate) is None
+    assert gate_check(test_gate)
+
+    # Closing a gate is visible on the next read
+    GateManager.close(test_gate, ttl_seconds=3600)
+    expiry = GateManager.is_closed(test_gate)
+    assert expiry is not None
+    assert abs((expiry - local_now()) - timedelta(hours=1)) < timedelta(seconds=5)
+    assert not gate_check(test_gate)
+
+    # Opening a gate is visible on the next read
+    GateManager.open(test_gate)
+    assert GateManager.is_closed(test_gate) is None
+    assert gate_check(test_gate)
+
+
+def test_cached_reads(mt: MaestroTest) -> None:
+    GateManager.close(test_gate, ttl_seconds=60)
+
+    with cached_reads() as raw_client:
+        # First read fetches, repeat reads are served locally
+        expiry = GateManager.is_closed(test_gate)
+        assert expiry is not None
+        assert GateManager.is_closed(test_gate) == expiry
+        assert raw_client.mget.call_count == 1
+        assert GateManager.cache_stats() == {"hits": 1, "misses": 1, "invalidations": 0}
+
+        # A cached expiry reads as open once it has passed, without a round trip
+        with mt.mock_datetime_as(local_now() + timedelta(minutes=2)):
+            assert GateManager.is_closed(test_gate) is None
+            assert GateManager.is_closed(test_gate) is None
+        assert raw_client.mget.call_count == 1
+
+        # Writes invalidate the local copy and publish to other workers
+        GateManager.open(test_gate)
+        raw_client.publish.assert_called_with(GATE_INVALIDATION_CHANNEL, str(test_gate))
+        assert GateManager.is_closed(test_gate) is None
+        assert raw_client.mget.call_count == 2
+        assert GateManager.cache_stats() == {"hits": 3, "misses": 2, "invalidations": 1}
+
+        # Resetting drops the local copy and the counters
+        GateManager.reset_cache()
+        assert GateManager._cache == {}
+        assert GateManager.cache_stats() == {"hits": 0, "misses": 0, "invalidations": 0}
+
+
+def test_invalidation_during_fetch(mt: MaestroTest) -> None:
+    GateManager.close(test_gate, ttl_seconds=60)
+
+    with cached_reads() as raw_client:
+        # An invalidation landing mid-fetch keeps the fetched value out of the cache
+        def fetch_then_invalidate(keys: list[str]) -> list[str | None]:
+            values = [GateManager.redis.get(key) for key in keys]
+            GateManager._invalidate(test_gate)
+            return values
+
+        raw_client.mget.side_effect = fetch_then_invalidate
+        assert GateManager.is_closed(test_gate) is not None
+        assert test_gate not in GateManager._cache
+
+        # The next read goes back to Redis
+        raw_client.mget.side_effect = lambda keys: [GateManager.redis.get(key) for key in keys]
+        assert GateManager.is_closed(test_gate) is not None
+        assert raw_client.mget.call_count == 2
+        assert test_gate in GateManager._cache
+
+
+def test_invalidation_listener(mt: MaestroTest) -> None:
+    GateManager.close(test_gate, ttl_seconds=60)
+
+    with cached_reads() as raw_client:
+        GateManager.is_closed(test_gate)
+        GateManager.is_closed(Gate.NOTIF_ON_EMILY_ZONE_CHANGE)
+
+        # Messages from other workers drop the named gate, then the listener hits an error
+        pubsub = raw_client.pubsub.return_value
+        pubsub.get_message.side_effect = [
+            {"type": "subscribe", "data": 1},
+            None,
+            {"type": "message", "data": str(test_gate).encode()},
+            ConnectionError("connection lost"),
+        ]
+        GateManager._listen()
+        pubsub.subscribe.assert_called_once_with(GATE_INVALIDATION_CHANNEL)
+        assert test_gate not in GateManager._cache
+
+        # A stopped listener stops serving from the cache until it is restarted
+        assert not GateManager._listener_ready.is_set()
+        assert GateManager._cache == {}
+        assert GateManager.cache_stats()["invalidations"] == 1
+
+
+def test_gates_closed(mt: MaestroTest) -> None:
+    # Bulk lookup returns every requested gate
+    GateManager.close(Gate.NOTIF_ON_EMILY_ZONE_CHANGE, ttl_seconds=60)
+    expiries = GateManager.gates_closed(*Gate)
+    assert set(expiries) == set(Gate)
+    assert expiries[Gate.NOTIF_ON_EMILY_ZONE_CHANGE] is not None
+    assert expiries[Gate.NOTIF_ON_MARSHALL_ZONE_CHANGE] is None
+
+    # get_gates is built from the bulk lookup
+    assert GateManager.get_gates() == {gate: expiries[gate] for gate in sorted(Gate)}
+
+    # Multi-gate checks fail if any gate is closed
+    assert not gates_check(Gate.NOTIF_ON_EMILY_ZONE_CHANGE, Gate.NOTIF_ON_MARSHALL_ZONE_CHANGE)
+    assert gates_check(Gate.CRITICAL_DOOR_NOTIFS, Gate.NOTIF_ON_MARSHALL_ZONE_CHANGE)
+
+
+def test_require_gate_check_multiple_gates(mt: MaestroTest) -> None:
+    calls: list[str] = []
+
+    @require_gate_check(Gate.CRITICAL_DOOR_NOTIFS, Gate.NOTIF_ON_EMILY_ZONE_CHANGE)
+    def guarded() -> None:
+        calls.append("called")
+
+    # Function runs while all gates are open
+    guarded()
+    assert len(calls) == 1
+
+    # Function is skipped when any one gate is closed
+    GateManager.close(Gate.NOTIF_ON_EMILY_ZONE_CHANGE, ttl_seconds=60)
+    guarded()
+    assert len(calls) == 1
+
+
+def test_gates_closed_round_trips(mt: MaestroTest) -> None:
+    """Micro-benchmark: the per-gate loop grows with the enum, the bulk read stays at one MGET"""
+    for size in (3, 30, 300):
+        bench_gates = cast(
+            list[Gate], list(StrEnum("BenchGate", [f"GATE_{i}" for i in range(size)]))
+        )
+        for gate in bench_gates[::2]:
+            GateManager.close(gate, ttl_seconds=60)
+
+        raw_client = MagicMock(spec=Redis)
+        raw_client.mget.side_effect = lambda keys: [GateManager.redis.get(key) for key in keys]
+
+        with (
+            patch.object(GateManager.redis, "client", raw_client, create=True),
+            patch.object(GateManager, "_ensure_listener", return_value=False),
+        ):
+            looped = {gate: GateManager.is_closed(gate) for gate in bench_gates}
+            assert raw_client.mget.call_count == size
+
+            raw_client.mget.reset_mock()
+            batched = GateManager.gates_closed(*bench_gates)
+            assert raw_client.mget.call_count == 1
+
+        assert batched == looped
+        assert sum(expiry is not None for expiry in batched.values()) == len(bench_gates[::2])
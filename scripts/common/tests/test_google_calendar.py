@@ -0,0 +1,157 @@
+from datetime import datetime, timedelta
+from typing import Any
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+
+from maestro.integrations import EntityId
+from maestro.testing import MaestroTest
+
+from custom_domains import GoogleCalendar
+from custom_domains.google_calendar import CALENDAR_CACHE_TTL, get_fetch_end
+
+CALENDAR_ID = EntityId("calendar.bench")
+EVENT_COUNT = 5000
+NOW = datetime(2026, 3, 10, 9, 0, tzinfo=ZoneInfo("America/Detroit"))
+
+
+def build_events() -> list[dict[str, str]]:
+    """Staggered events every 15 minutes, with every tenth one running for a whole day"""
+    events = []
+    for i in range(EVENT_COUNT):
+        start = NOW - timedelta(days=2) + timedelta(minutes=15 * i)
+        end = start + (timedelta(days=1) if i % 10 == 0 else timedelta(minutes=30))
+        events.append({"start": start.isoformat(), "end": end.isoformat(), "summary": f"Event {i}"})
+    return events
+
+
+class FakeCalendarService:
+    def __init__(self) -> None:
+        self.events = build_events()
+        self.calls: list[tuple[datetime, datetime]] = []
+
+    def get_events(
+        self,
+        start_date_time: datetime,
+        end_date_time: datetime,
+        calendar_ids: list[EntityId],
+        **_: Any,
+    ) -> dict[str, Any]:
+        self.calls.append((start_date_time, end_date_time))
+        return {
+            calendar_id: {
+                "events": [
+                    event
+                    for event in self.events
+                    if datetime.fromisoformat(event["start"]) < end_date_time
+                    and datetime.fromisoformat(event["end"]) > start_date_time
+                ]
+            }
+            for calendar_id in calendar_ids
+        }
+
+
+def expected_titles(service: FakeCalendarService, start: datetime, end: datetime) -> list[str]:
+    return [
+        event["summary"]
+        for event in service.events
+        if datetime.fromisoformat(event["start"]) < end
+        and datetime.fromisoformat(event["end"]) > start
+    ]
+
+
+def test_calendar_window_index(mt: MaestroTest) -> None:
+    """Micro-benchmark: a week of queries over thousands of events costs one service call"""
+    mt.set_state(CALENDAR_ID, "off", {"message": "Event 0"})
+    calendar = GoogleCalendar(CALENDAR_ID)
+    service = FakeCalendarService()
+    GoogleCalendar.invalidate_event_cache()
+
+    windows = [
+        (NOW + timedelta(hours=hour), NOW + timedelta(hours=hour + 3)) for hour in range(0, 168, 3)
+    ]
+    with (
+        patch.object(GoogleCalendar, "get_events", side_effect=service.get_events),
+        mt.mock_datetime_as(NOW),
+    ):
+        week = calendar.get_gcal_events(days=7)
+        assert [event.title for event in week] == expected_titles(
+            service, NOW, NOW + timedelta(days=7)
+        )
+
+        for start, end in windows:
+            events = calendar.get_events_between(start, end)
+            assert [event.title for event in events] == expected_titles(service, start, end)
+
+        upcoming = calendar.get_upcoming_events(5)
+        assert [event.title for event in upcoming] == [f"Event {i}" for i in range(192, 197)]
+
+        assert len(service.calls) == 1
+
+        # Asking for a longer window only fetches the days not yet cached
+        fortnight = calendar.get_gcal_events(days=14)
+        assert service.calls[-1] == (
+            get_fetch_end(NOW + timedelta(days=7)),
+            get_fetch_end(NOW + timedelta(days=14)),
+        )
+        assert [event.title for event in fortnight] == expected_titles(
+            service, NOW, NOW + timedelta(days=14)
+        )
+        assert len(service.calls) == 2
+
+
+def test_calendar_cache_refresh(mt: MaestroTest) -> None:
+    mt.set_state(CALENDAR_ID, "off", {"message": "Event 0"})
+    calendar = GoogleCalendar(CALENDAR_ID)
+    service = FakeCalendarService()
+    GoogleCalendar.invalidate_event_cache()
+
+    with patch.object(GoogleCalendar, "get_events", side_effect=service.get_events):
+        with mt.mock_datetime_as(NOW):
+            calendar.get_gcal_events()
+            calendar.get_gcal_events()
+        assert len(service.calls) == 1
+
+        # Windows that slide forward with the clock are served from the fetched day
+        for minutes in (1, 5, 14):
+            with mt.mock_datetime_as(NOW + timedelta(minutes=minutes)):
+                calendar.get_gcal_events()
+        assert len(service.calls) == 1
+
+        # An edit moves the next event, which refetches the window
+        service.events[200]["summary"] = "Edited"
+        mt.set_state(CALENDAR_ID, "on", {"message": "Edited"})
+        with mt.mock_datetime_as(NOW):
+            assert "Edited" in [event.title for event in calendar.get_gcal_events()]
+        assert len(service.calls) == 2
+
+        # Entries expire even if the calendar's state doesn't change
+        with mt.mock_datetime_as(NOW + CALENDAR_CACHE_TTL):
+            calendar.get_gcal_events()
+        assert len(service.calls) == 3
+
+
+def test_calendar_invalidated_during_fetch(mt: MaestroTest) -> None:
+    mt.set_state(CALENDAR_ID, "off", {"message": "Event 0"})
+    calendar = GoogleCalendar(CALENDAR_ID)
+    service = FakeCalendarService()
+    GoogleCalendar.invalidate_event_cache()
+
+    def invalidate_then_fetch(**kwargs: Any) -> dict[str, Any]:
+        GoogleCalendar.invalidate_event_cache(CALENDAR_ID)
+        return service.get_events(**kwargs)
+
+    with mt.mock_datetime_as(NOW):
+        with patch.object(GoogleCalendar, "get_events", side_effect=service.get_events):
+            calendar.get_gcal_events(days=7)
+
+        # The tail has nothing left to extend, so the whole range is fetched again
+        with patch.object(GoogleCalendar, "get_events", side_effect=invalidate_then_fetch):
+            fortnight = calendar.get_gcal_events(days=14)
+
+    assert [event.title for event in fortnight] == expected_titles(
+        service, NOW, NOW + timedelta(days=14)
+    )
+    assert service.calls[1:] == [
+        (get_fetch_end(NOW + timedelta(days=7)), get_fetch_end(NOW + timedelta(days=14))),
+        (NOW, get_fetch_end(NOW + timedelta(days=14))),
+    ]
@@ -0,0 +1,55 @@
+from datetime import timedelta
+from unittest.mock import call, patch
+
+import pytest
+from maestro.testing import MaestroTest
+from maestro.utils import local_now
+
+from ..job_groups import GroupJob, JobGroup
+
+
+def noop(value: int = 0) -> None:
+    pass
+
+
+def test_schedule_and_cancel_group(mt: MaestroTest) -> None:
+    run_time = local_now() + timedelta(minutes=5)
+    group = JobGroup("test")
+    other = JobGroup("other")
+
+    group.schedule(
+        GroupJob("test_job_1", run_time, noop, {"value": 1}),
+        GroupJob("test_job_2", run_time + timedelta(minutes=1), noop),
+    )
+    other.schedule(GroupJob("other_job", run_time, noop))
+    mt.assert_job_scheduled("test_job_1", noop)
+    mt.assert_job_scheduled("test_job_2", noop)
+
+    # Rescheduling a member replaces its job without duplicating membership
+    group.schedule(GroupJob("test_job_1", run_time + timedelta(minutes=2), noop))
+    assert group.job_ids() == ["test_job_1", "test_job_2"]
+
+    # Cancelling one group leaves the others alone
+    with patch.object(group.scheduler, "cancel_job", wraps=group.scheduler.cancel_job) as cancel:
+        group.cancel()
+    assert cancel.call_args_list == [call("test_job_1"), call("test_job_2")]
+    mt.assert_job_not_scheduled("test_job_1")
+    mt.assert_job_not_scheduled("test_job_2")
+    mt.assert_job_scheduled("other_job", noop)
+    assert group.job_ids() == []
+    assert other.job_ids() == ["other_job"]
+
+
+def test_membership_follows_job_store(mt: MaestroTest) -> None:
+    run_time = local_now() + timedelta(minutes=5)
+    group = JobGroup("test")
+
+    # Jobs outside the group's prefix are rejected before anything is scheduled
+    with pytest.raises(ValueError, match="must start with test_"):
+        group.schedule(GroupJob("test_job", run_time, noop), GroupJob("stray_job", run_time, noop))
+    assert mt.get_scheduled_jobs() == []
+
+    # A member that has run, or was cancelled on its own, is no longer part of the group
+    group.schedule(GroupJob("test_job_1", run_time, noop), GroupJob("test_job_2", run_time, noop))
+    group.scheduler.cancel_job("test_job_1")
+    assert group.job_ids() == ["test_job_2"]
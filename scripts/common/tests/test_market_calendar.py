@@ -0,0 +1,54 @@
+from datetime import date, datetime
+
+from ..market_calendar import (
+    MARKET_TIMEZONE,
+    get_early_closes,
+    get_holidays,
+    get_next_market_open,
+    get_session,
+    is_market_open,
+)
+
+
+def test_holidays() -> None:
+    assert get_holidays(2026) == {
+        date(2026, 1, 1),
+        date(2026, 1, 19),
+        date(2026, 2, 16),
+        date(2026, 4, 3),
+        date(2026, 5, 25),
+        date(2026, 6, 19),
+        date(2026, 7, 3),  # Independence Day observed on Friday
+        date(2026, 9, 7),
+        date(2026, 11, 26),
+        date(2026, 12, 25),
+    }
+    # Christmas on a Saturday is observed Friday, and New Year's on a Saturday isn't observed
+    assert date(2021, 12, 24) in get_holidays(2021)
+    assert date(2021, 12, 31) not in get_holidays(2021)
+    assert date(2022, 1, 3) not in get_holidays(2022)
+
+
+def test_early_closes() -> None:
+    assert get_early_closes(2025) == {date(2025, 7, 3), date(2025, 11, 28), date(2025, 12, 24)}
+    # No early close on July 3rd when it's the observed holiday
+    assert get_early_closes(2026) == {date(2026, 11, 27), date(2026, 12, 24)}
+
+
+def test_sessions() -> None:
+    def at(month: int, day: int, hour: int, minute: int) -> datetime:
+        return datetime(2026, month, day, hour, minute, tzinfo=MARKET_TIMEZONE)
+
+    assert get_session(date(2026, 3, 14)) is None  # Saturday
+    assert get_session(date(2026, 4, 3)) is None  # Good Friday
+
+    assert not is_market_open(at(3, 10, 9, 29))
+    assert is_market_open(at(3, 10, 9, 30))
+    assert is_market_open(at(3, 10, 15, 59))
+    assert not is_market_open(at(3, 10, 16, 0))
+    assert is_market_open(at(11, 27, 12, 59))
+    assert not is_market_open(at(11, 27, 13, 0))
+
+    assert get_next_market_open(at(3, 10, 8, 0)) == at(3, 10, 9, 30)
+    assert get_next_market_open(at(3, 10, 9, 30)) == at(3, 11, 9, 30)
+    assert get_next_market_open(at(4, 2, 12, 0)) == at(4, 6, 9, 30)
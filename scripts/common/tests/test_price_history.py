@@ -0,0 +1,80 @@
+from datetime import date, datetime
+
+from maestro.testing import MaestroTest
+
+from ..finance import FinnhubResponse
+from ..market_calendar import MARKET_TIMEZONE, get_session
+from ..price_history import (
+    PriceHistory,
+    clear_price_histories,
+    downsample_session,
+    get_price_history,
+    record_quotes,
+)
+
+SESSION = get_session(date(2026, 3, 10))
+
+
+def session_timestamp(hour: int, minute: int) -> float:
+    return datetime(2026, 3, 10, hour, minute, tzinfo=MARKET_TIMEZONE).timestamp()
+
+
+def build_quote(timestamp: float, price: float) -> FinnhubResponse:
+    return FinnhubResponse(c=price, d=0, dp=0, h=price, l=price, o=price, pc=price, t=timestamp)
+
+
+def test_ring_buffer_wraps() -> None:
+    history = PriceHistory("SPY", capacity=3)
+    for timestamp in range(1, 6):
+        assert history.append(timestamp, timestamp * 10)
+
+    # Only the newest points are kept, in order
+    assert len(history) == 3
+    assert list(history.timestamps()) == [3, 4, 5]
+    assert list(history.prices()) == [30, 40, 50]
+
+    # Repeated and out-of-order quotes are ignored
+    assert not history.append(5, 55)
+    assert not history.append(4, 44)
+    assert list(history.prices()) == [30, 40, 50]
+
+
+def test_serialization_round_trip() -> None:
+    history = PriceHistory("SPY", capacity=3)
+    for timestamp in range(1, 6):
+        history.append(timestamp, timestamp * 10)
+
+    restored = PriceHistory.from_bytes("SPY", history.to_bytes(), capacity=3)
+    assert list(restored.timestamps()) == [3, 4, 5]
+    assert list(restored.prices()) == [30, 40, 50]
+
+    # A smaller capacity keeps the newest points
+    shrunk = PriceHistory.from_bytes("SPY", history.to_bytes(), capacity=2)
+    assert list(shrunk.prices()) == [40, 50]
+
+
+def test_downsample_session() -> None:
+    assert SESSION is not None
+    history = PriceHistory("SPY")
+    history.append(session_timestamp(9, 0), 99)  # Pre-market
+    history.append(session_timestamp(9, 45), 100)
+    history.append(session_timestamp(10, 5), 101)
+    history.append(session_timestamp(10, 10), 102)
+    history.append(session_timestamp(11, 40), 104)
+
+    # 30 minute buckets, with the gap carried forward and nothing past the latest point
+    assert downsample_session(history, buckets=13) == [100, 102, 102, 102, 104]
+    assert downsample_session(PriceHistory("SPY"), buckets=13) == []
+
+
+def test_record_quotes_persists(mt: MaestroTest) -> None:
+    clear_price_histories()
+    record_quotes({"SPY": build_quote(session_timestamp(10, 0), 500)})
+    record_quotes({"SPY": build_quote(session_timestamp(10, 0), 500)})
+    record_quotes({"SPY": build_quote(session_timestamp(10, 1), 501)})
+
+    # Reloaded from Redis once the in-memory copy is dropped
+    clear_price_histories()
+    history = get_price_history("SPY")
+    assert list(history.prices()) == [500, 501]
+    clear_price_histories()
@@ -0,0 +1,91 @@
+from maestro.integrations import Domain
+from maestro.testing import MaestroTest
+
+from registry import media_player
+
+from ..speaker_scenes import (
+    SpeakerState,
+    apply_scene,
+    capture_scene,
+    load_scene,
+    restore_scene,
+    save_scene,
+    snapshot_scene,
+)
+
+SPEAKERS = [media_player.living_room, media_player.craft_room, media_player.front_room]
+
+
+def set_speaker(
+    mt: MaestroTest, index: int, volume: float, muted: bool, group: list[str], source: str
+) -> None:
+    mt.set_state(
+        SPEAKERS[index],
+        "playing",
+        {
+            "volume_level": volume,
+            "is_volume_muted": muted,
+            "group_members": group,
+            "source": source,
+        },
+    )
+
+
+def test_capture_and_store_scene(mt: MaestroTest) -> None:
+    living_room, craft_room, front_room = (speaker.id for speaker in SPEAKERS)
+    set_speaker(mt, 0, 0.5, False, [living_room, craft_room], "TV")
+    set_speaker(mt, 1, 0.25, True, [living_room, craft_room], "TV")
+    set_speaker(mt, 2, 0.3, False, [front_room], "Line-in")
+
+    scene = capture_scene(SPEAKERS)
+    assert scene[living_room] == SpeakerState(0.5, False, (living_room, craft_room), "TV")
+    assert scene[craft_room].muted is True
+    assert scene[front_room].group == (front_room,)
+
+    save_scene("test", scene)
+    assert load_scene("test") == scene
+    assert load_scene("missing") is None
+
+
+def test_apply_scene_sends_only_deltas(mt: MaestroTest) -> None:
+    for index, speaker in enumerate(SPEAKERS):
+        set_speaker(mt, index, 0.4, False, [speaker.id], "TV")
+    mt.set_state(SPEAKERS[2], "playing", {"volume_level": 0.8, "is_volume_muted": True})
+
+    scene = {speaker.id: SpeakerState(volume=0.4, muted=False) for speaker in SPEAKERS}
+    report = apply_scene(scene, SPEAKERS)
+
+    # Speakers already in the scene are left alone
+    assert [(result.action, result.entity_ids) for result in report.results] == [
+        ("volume_set", [SPEAKERS[2].id]),
+        ("volume_mute", [SPEAKERS[2].id]),
+    ]
+    mt.assert_action_not_called(Domain.MEDIA_PLAYER, "volume_set", SPEAKERS[0].id)
+
+
+def test_restore_scene_after_announcement(mt: MaestroTest) -> None:
+    living_room, craft_room, front_room = (speaker.id for speaker in SPEAKERS)
+    set_speaker(mt, 0, 0.3, False, [living_room, craft_room], "TV")
+    set_speaker(mt, 1, 0.3, False, [living_room, craft_room], "TV")
+    set_speaker(mt, 2, 0.2, False, [front_room], "TV")
+    snapshot_scene("announcement", SPEAKERS)
+
+    # The announcement groups everything and turns it up
+    announcement_group = [front_room, living_room, craft_room]
+    for index in range(len(SPEAKERS)):
+        set_speaker(mt, index, 0.7, False, announcement_group, "TV")
+
+    report = restore_scene("announcement", SPEAKERS)
+    assert report is not None
+    assert not report.failures
+
+    # Volumes go back in one merged call per level, and each group is rebuilt from its coordinator
+    mt.assert_action_called(Domain.MEDIA_PLAYER, "volume_set", living_room, volume_level=0.3)
+    mt.assert_action_called(Domain.MEDIA_PLAYER, "volume_set", front_room, volume_level=0.2)
+    assert len(mt.get_action_calls(Domain.MEDIA_PLAYER, "volume_set")) == 2
+    mt.assert_action_called(
+        Domain.MEDIA_PLAYER, "join", living_room, group_members=[craft_room], call_count=1
+    )
+    mt.assert_action_called(Domain.MEDIA_PLAYER, "unjoin", front_room, call_count=1)
+    mt.assert_action_not_called(Domain.MEDIA_PLAYER, "volume_mute")
+    assert restore_scene("missing", SPEAKERS) is None
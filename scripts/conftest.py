@@ -0,0 +1,16 @@
+import pytest
+
+from scripts.common.connectivity import connectivity_monitor
+from scripts.frontend.common import card_updates
+
+
+@pytest.fixture(autouse=True)
+def post_card_updates_immediately(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Skip the coalescing window so card writes land before the test asserts on them"""
+    monkeypatch.setattr(card_updates, "COALESCE_WINDOW_SECONDS", 0)
+
+
+@pytest.fixture(autouse=True)
+def stop_connectivity_monitor(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the shared monitor from probing the real internet in a background thread"""
+    monkeypatch.setattr(connectivity_monitor, "start_monitor", False)
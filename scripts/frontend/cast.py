@@ -1,11 +1,17 @@
-from concurrent.futures import ThreadPoolExecutor
-from time import sleep
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from enum import StrEnum
 
-from catt.controllers import setup_cast  # type:ignore[import-untyped]
+from catt.controllers import (  # type:ignore[import-untyped]
+    DASHCAST_APP_ID,
+    CastController,
+    setup_cast,
+)
 from maestro.domains import MediaPlayer
-from maestro.integrations import RedisClient
+from maestro.integrations import EntityId, RedisClient, StateManager
 from maestro.triggers import cron_trigger
-from maestro.utils import log
+from maestro.utils import IntervalSeconds, log
 
 from registry import media_player
 
@@ -17,39 +23,157 @@ NEST_DISPLAYS: list[tuple[MediaPlayer, str]] = [
 
 CAST_URL = "http://192.168.0.107:8123/lovelace-cast/overview"
 CAST_LOCK_KEY_PREFIX = "cast_lock_"
+CAST_URL_KEY_PREFIX = "CAST_URL"
 CAST_TIMEOUT_SECONDS = 60
 
 
-def execute_cast(ip_address: str) -> None:
-    cast_controller = setup_cast(
-        ip_address,
-        controller="dashcast",
-        action="load_url",
-        prep="app",
-    )
-    cast_controller.load_url(CAST_URL)
+class CastOutcome(StrEnum):
+    CAST = "cast"
+    SKIPPED = "skipped"
+    FAILED = "failed"
+    TIMED_OUT = "timed_out"
+    # A previous cast to the display still hasn't returned
+    BUSY = "busy"
 
 
-def call_cast_command(display: MediaPlayer, ip_address: str) -> None:
-    lock_key = CAST_LOCK_KEY_PREFIX + display.id.entity
-    with RedisClient().lock(lock_key, timeout_seconds=100, exit_if_owned=True):
-        executor = ThreadPoolExecutor(max_workers=1)
+def connect_dashcast(ip_address: str) -> CastController:
+    return setup_cast(ip_address, controller="dashcast", action="load_url")
+
+
+class CastManager:
+    """
+    Casts a URL to displays concurrently, reusing one controller connection per display.
+    Displays already running DashCast on the URL last loaded there are left alone. A cast that
+    times out has its connection closed, which unblocks it, and the next round reconnects.
+    Casts never queue behind one still running on the same display.
+    """
+
+    def __init__(
+        self,
+        displays: Sequence[tuple[MediaPlayer, str]],
+        url: str = CAST_URL,
+        timeout_seconds: float = CAST_TIMEOUT_SECONDS,
+        connect: Callable[[str], CastController] = connect_dashcast,
+    ) -> None:
+        self.displays = list(displays)
+        self.url = url
+        self.timeout_seconds = timeout_seconds
+        self.connect = connect
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(self.displays), thread_name_prefix="cast"
+        )
+        self._controllers: dict[str, CastController] = {}
+        self._in_flight: dict[str, Future[CastOutcome]] = {}
+        self._connection_locks = {ip_address: threading.Lock() for _, ip_address in self.displays}
+        self._lock = threading.Lock()
+
+    def cast_all(self) -> dict[EntityId, CastOutcome]:
+        """Cast to every display at once, waiting at most `timeout_seconds` for all of them"""
+        outcomes: dict[EntityId, CastOutcome] = {}
+        futures: dict[EntityId, Future[CastOutcome]] = {}
+        with self._lock:
+            for display, ip_address in self.displays:
+                previous = self._in_flight.get(ip_address)
+                if previous is not None and not previous.done():
+                    log.warning("Previous cast still running, skipping display", target=display.id)
+                    outcomes[display.id] = CastOutcome.BUSY
+                    continue
+
+                future = self._executor.submit(self.cast, display, ip_address)
+                futures[display.id] = self._in_flight[ip_address] = future
+
+        wait(futures.values(), timeout=self.timeout_seconds)
+
+        for display, ip_address in self.displays:
+            if (future := futures.get(display.id)) is None:
+                continue
+            if not future.done():
+                log.error(
+                    "Timed out while attempting to cast",
+                    target=display.id,
+                    timeout_seconds=self.timeout_seconds,
+                )
+                # Closing the hung connection lets its call return, and the next round starts
+                # from a fresh one rather than skipping the display while it's in flight
+                self._discard_controller(ip_address)
+                with self._lock:
+                    self._in_flight.pop(ip_address, None)
+                outcomes[display.id] = CastOutcome.TIMED_OUT
+            elif (exception := future.exception()) is not None:
+                log.error(
+                    "Exception raised while attempting to cast",
+                    target=display.id,
+                    exception_type=type(exception).__name__,
+                )
+                outcomes[display.id] = CastOutcome.FAILED
+            else:
+                outcomes[display.id] = future.result()
+
+        return outcomes
+
+    def cast(self, display: MediaPlayer, ip_address: str) -> CastOutcome:
+        redis = StateManager().redis_client
+        lock_key = CAST_LOCK_KEY_PREFIX + display.id.entity
+        url_key = redis.build_key(CAST_URL_KEY_PREFIX, display.id.entity)
+
+        # Never queue behind a hung cast to the same display
+        connection_lock = self._connection_locks[ip_address]
+        if not connection_lock.acquire(blocking=False):
+            return CastOutcome.BUSY
+
         try:
-            executor.submit(execute_cast, ip_address).result(timeout=CAST_TIMEOUT_SECONDS)
-        except TimeoutError:
-            log.error(
-                "Timed out while attempting to cast",
-                target=display.id,
-                timeout_seconds=CAST_TIMEOUT_SECONDS,
-            )
-        except Exception:
-            log.exception("Exception raised while attempting to cast", target=display.id)
+            with redis.lock(lock_key, timeout_seconds=100, exit_if_owned=True):
+                return self._cast(redis, url_key, ip_address)
         finally:
-            executor.shutdown(wait=False, cancel_futures=True)
+            connection_lock.release()
+
+    def _cast(self, redis: RedisClient, url_key: str, ip_address: str) -> CastOutcome:
+        controller = self._get_controller(ip_address)
+        try:
+            if controller.info.get("app_id") == DASHCAST_APP_ID and (
+                redis.get(key=url_key) == self.url
+            ):
+                return CastOutcome.SKIPPED
+
+            controller.prep_app()
+            controller.load_url(self.url)
+        except Exception:
+            self._discard_controller(ip_address, controller)
+            raise
+
+        redis.set(key=url_key, value=self.url, ttl_seconds=IntervalSeconds.ONE_DAY)
+        return CastOutcome.CAST
+
+    def _get_controller(self, ip_address: str) -> CastController:
+        with self._lock:
+            controller = self._controllers.get(ip_address)
+        if controller is None:
+            controller = self.connect(ip_address)
+            with self._lock:
+                self._controllers[ip_address] = controller
+
+        return controller
+
+    def _discard_controller(
+        self, ip_address: str, controller: CastController | None = None
+    ) -> None:
+        """Drop a display's connection (only if it's still `controller`, when given) and close it"""
+        with self._lock:
+            current = self._controllers.get(ip_address)
+            if current is None or controller not in (None, current):
+                return
+            del self._controllers[ip_address]
+
+        try:
+            current._cast.disconnect(timeout=0)
+        except Exception:
+            log.exception("Failed to disconnect from display", ip_address=ip_address)
+
+
+cast_manager = CastManager(NEST_DISPLAYS)
 
 
 @cron_trigger("*/10 * * * *")
 def cast_to_displays() -> None:
-    for display, ip_address in NEST_DISPLAYS:
-        call_cast_command(display, ip_address)
-        sleep(90)
+    cast_manager.cast_all()
@@ -0,0 +1,123 @@
+import threading
+from collections import Counter
+from collections.abc import Callable
+from typing import Any
+
+from maestro.domains import Entity
+from maestro.utils import log
+
+COALESCE_WINDOW_SECONDS = 0.25
+STATE_KEY = "state"
+
+_UNSET = object()
+
+
+class CardUpdater:
+    """
+    Funnels all writes to an entity card through one place.
+    Values matching what was last posted are dropped, and updates arriving within
+    `window_seconds` of each other are merged into a single `card.update` call. A window of 0
+    posts immediately. It defaults to COALESCE_WINDOW_SECONDS, read on each update so the test
+    fixture can set it to 0 and assert on card writes synchronously.
+    `on_flush_failed` is called if a post fails, so callers can recompute what was lost.
+    """
+
+    def __init__(
+        self,
+        card: Entity,
+        window_seconds: float | None = None,
+        on_flush_failed: Callable[[], None] | None = None,
+    ) -> None:
+        self.card = card
+        self.window_seconds = window_seconds
+        self.on_flush_failed = on_flush_failed
+
+        self._posted: dict[str, Any] = {}
+        self._pending: dict[str, Any] = {}
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+        self._post_lock = threading.Lock()
+        self._stats: Counter[str] = Counter()
+
+    def update(self, state: str | None = None, **attributes: Any) -> None:
+        changes = attributes if state is None else {STATE_KEY: state, **attributes}
+
+        with self._lock:
+            self._stats["requested"] += 1
+            delta = {
+                key: value
+                for key, value in changes.items()
+                if self._pending.get(key, self._posted.get(key, _UNSET)) != value
+            }
+            if not delta:
+                self._stats["dropped"] += 1
+                return
+
+            if self._pending:
+                self._stats["merged"] += 1
+            self._pending.update(delta)
+
+            window_seconds = (
+                COALESCE_WINDOW_SECONDS if self.window_seconds is None else self.window_seconds
+            )
+            if window_seconds <= 0:
+                flush_now = True
+            else:
+                flush_now = False
+                if self._timer is None:
+                    self._timer = threading.Timer(window_seconds, self._flush_from_timer)
+                    self._timer.daemon = True
+                    self._timer.start()
+
+        if flush_now:
+            self.flush()
+
+    def flush(self) -> None:
+        """Post any pending changes now"""
+        with self._post_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                changes = {
+                    key: value
+                    for key, value in self._pending.items()
+                    if self._posted.get(key, _UNSET) != value
+                }
+                self._pending = {}
+
+            if not changes:
+                return
+
+            attributes = dict(changes)
+            try:
+                self.card.update(state=attributes.pop(STATE_KEY, None), **attributes)
+            except Exception:
+                if self.on_flush_failed is not None:
+                    self.on_flush_failed()
+                raise
+
+            with self._lock:
+                self._posted.update(changes)
+                self._stats["posted"] += 1
+
+    def reset(self) -> None:
+        """Forget what was last posted, eg. after the card entity is re-initialized"""
+        with self._lock:
+            self._posted = {}
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "requested": self._stats["requested"],
+                "posted": self._stats["posted"],
+                "dropped": self._stats["dropped"],
+                "merged": self._stats["merged"],
+                "writes_saved": self._stats["requested"] - self._stats["posted"],
+            }
+
+    def _flush_from_timer(self) -> None:
+        try:
+            self.flush()
+        except Exception:
+            log.exception("Failed to post coalesced card update", entity_id=self.card.id)
@@ -0,0 +1,18 @@
+from collections.abc import Sequence
+
+SPARKLINE_BLOCKS = "▁▂▃▄▅▆▇█"
+SPARKLINE_WIDTH = 26
+
+
+def render_sparkline(values: Sequence[float]) -> str:
+    """Scale values between their min and max onto block characters. Flat series sit mid-height"""
+    if not values:
+        return ""
+
+    low = min(values)
+    spread = max(values) - low
+    if spread == 0:
+        return SPARKLINE_BLOCKS[len(SPARKLINE_BLOCKS) // 2 - 1] * len(values)
+
+    top = len(SPARKLINE_BLOCKS) - 1
+    return "".join(SPARKLINE_BLOCKS[round((value - low) / spread * top)] for value in values)
@@ -0,0 +1,86 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from maestro.testing import MaestroTest
+
+from registry import maestro
+from scripts.frontend.common.card_updates import CardUpdater
+from scripts.frontend.common.entity_card import RowColor
+
+test_card = maestro.entity_card_1
+
+
+def test_card_updater_drops_no_op_writes(mt: MaestroTest) -> None:
+    mt.set_state(test_card, "Loading...")
+    updater = CardUpdater(test_card)
+
+    with patch.object(test_card, "update", wraps=test_card.update) as card_update:
+        # First write is posted
+        updater.update(state="Home", row_1_value="72°")
+        assert card_update.call_count == 1
+        assert test_card.state == "Home"
+        assert test_card.row_1_value == "72°"
+
+        # Repeating the same values is dropped
+        updater.update(state="Home", row_1_value="72°")
+        assert card_update.call_count == 1
+
+        # Only changed values are posted
+        updater.update(state="Home", row_1_value="73°", row_1_color=RowColor.DEFAULT)
+        card_update.assert_called_with(state=None, row_1_value="73°", row_1_color=RowColor.DEFAULT)
+
+        # Resetting forgets what was posted
+        updater.reset()
+        updater.update(state="Home")
+        assert card_update.call_count == 3
+
+    assert updater.stats() == {
+        "requested": 4,
+        "posted": 3,
+        "dropped": 1,
+        "merged": 0,
+        "writes_saved": 1,
+    }
+
+
+def test_card_updater_merges_within_window(mt: MaestroTest) -> None:
+    mt.set_state(test_card, "Loading...")
+    updater = CardUpdater(test_card, window_seconds=60)
+
+    with patch.object(test_card, "update", wraps=test_card.update) as card_update:
+        # Updates inside the window are held and merged, later values win
+        updater.update(state="Busy", active=True)
+        updater.update(row_1_value="70°")
+        updater.update(row_1_value="71°")
+        assert card_update.call_count == 0
+
+        updater.flush()
+        card_update.assert_called_once_with(state="Busy", active=True, row_1_value="71°")
+
+        # Flushing with nothing pending doesn't post
+        updater.flush()
+        assert card_update.call_count == 1
+
+    stats = updater.stats()
+    assert stats["posted"] == 1
+    assert stats["merged"] == 2
+    assert stats["writes_saved"] == 2
+
+
+def test_card_updater_reports_failed_posts(mt: MaestroTest) -> None:
+    mt.set_state(test_card, "Loading...")
+    on_flush_failed = MagicMock()
+    updater = CardUpdater(test_card, on_flush_failed=on_flush_failed)
+
+    # A failed post is reported and not remembered as posted
+    with (
+        patch.object(test_card, "update", side_effect=ConnectionError("hass unavailable")),
+        pytest.raises(ConnectionError),
+    ):
+        updater.update(state="Home")
+    on_flush_failed.assert_called_once_with()
+
+    # So the same value isn't dropped as a no-op on the next attempt
+    updater.update(state="Home")
+    assert test_card.state == "Home"
+    assert updater.stats()["posted"] == 1
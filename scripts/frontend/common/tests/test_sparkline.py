@@ -0,0 +1,8 @@
+from scripts.frontend.common.sparkline import render_sparkline
+
+
+def test_render_sparkline() -> None:
+    assert render_sparkline([]) == ""
+    assert render_sparkline([1, 2, 3, 4, 5, 6, 7, 8]) == "▁▂▃▄▅▆▇█"
+    assert render_sparkline([10, 20, 10]) == "▁█▁"
+    assert render_sparkline([5, 5, 5]) == "▄▄▄"
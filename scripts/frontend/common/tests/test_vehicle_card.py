@@ -0,0 +1,177 @@
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+import pytest
+from maestro.domains import OFF, ON
+from maestro.integrations import StateManager
+from maestro.testing import MaestroTest
+from maestro.utils import JobScheduler
+
+from registry import maestro
+from scripts.frontend.common.entity_card import RowColor
+from scripts.frontend.common.icons import Icon
+from scripts.frontend.common.vehicle_card import VehicleCard
+from scripts.vehicles.common import Nyx
+
+test_card = maestro.entity_card_2
+COUNTDOWN_JOB_ID = "test_arrival_countdown"
+
+
+def tick() -> None: ...
+
+
+def build_vehicle_card(mt: MaestroTest) -> VehicleCard:
+    mt.set_state(test_card, "Loading...")
+    mt.set_state(Nyx.parked, ON)
+    mt.set_state(Nyx.climate, Nyx.climate.HVACMode.OFF)
+    mt.set_state(Nyx.software_update, OFF)
+    mt.set_state(Nyx.battery, "80")
+    mt.set_state(Nyx.charger, OFF)
+    mt.set_state(Nyx.charge_limit, "90")
+    mt.set_state(Nyx.location, "home")
+    mt.set_state(Nyx.destination, "unknown")
+    mt.set_state(Nyx.lock, "locked")
+    mt.set_state(Nyx.arrival_time, "2026-01-01T12:00:00+00:00")
+    mt.set_state(Nyx.temperature_inside, "72.4")
+
+    return VehicleCard(
+        vehicle=Nyx,
+        card=test_card,
+        title="Nyx",
+        icon=Icon.CAR_ELECTRIC_OUTLINE,
+        countdown_job_id=COUNTDOWN_JOB_ID,
+    )
+
+
+def test_vehicle_card_renders_all_rows(mt: MaestroTest) -> None:
+    vehicle_card = build_vehicle_card(mt)
+    vehicle_card.render(countdown_func=tick)
+
+    mt.assert_state(test_card, "Air Off")
+    mt.assert_attribute(test_card, "row_1_value", "80%")
+    mt.assert_attribute(test_card, "row_2_value", "Home")
+    mt.assert_attribute(test_card, "row_3_value", "72° F")
+    mt.assert_attribute(test_card, "row_3_color", RowColor.DEFAULT)
+
+
+def test_vehicle_card_recomputes_only_changed_rows(mt: MaestroTest) -> None:
+    vehicle_card = build_vehicle_card(mt)
+    vehicle_card.render(countdown_func=tick)
+
+    with (
+        patch.object(vehicle_card, "_compute_state", wraps=vehicle_card._compute_state) as state,
+        patch.object(vehicle_card, "_compute_row_1", wraps=vehicle_card._compute_row_1) as row_1,
+        patch.object(vehicle_card, "_compute_row_2", wraps=vehicle_card._compute_row_2) as row_2,
+        patch.object(vehicle_card, "_compute_row_3", wraps=vehicle_card._compute_row_3) as row_3,
+    ):
+        # Nothing changed, so nothing is recomputed
+        vehicle_card.render(countdown_func=tick)
+        assert (state.call_count, row_1.call_count, row_2.call_count, row_3.call_count) == (
+            0,
+            0,
+            0,
+            0,
+        )
+
+        # Battery only feeds row 1
+        mt.set_state(Nyx.battery, "79")
+        vehicle_card.render(countdown_func=tick)
+        assert (state.call_count, row_1.call_count, row_2.call_count, row_3.call_count) == (
+            0,
+            1,
+            0,
+            0,
+        )
+        mt.assert_attribute(test_card, "row_1_value", "79%")
+
+        # Lock feeds row 2
+        mt.set_state(Nyx.location, "not_home")
+        mt.set_state(Nyx.lock, "unlocked")
+        vehicle_card.render(countdown_func=tick)
+        assert row_2.call_count == 1
+        assert row_3.call_count == 0
+        mt.assert_attribute(test_card, "row_2_color", RowColor.RED)
+
+
+def test_vehicle_card_snapshot_reads_cached_states(mt: MaestroTest) -> None:
+    vehicle_card = build_vehicle_card(mt)
+
+    with patch.object(
+        StateManager, "get_entity_state", wraps=StateManager().get_entity_state
+    ) as get_entity_state:
+        snapshot = vehicle_card.take_snapshot()
+
+    # Every input was cached, so nothing falls back to a per-entity fetch
+    assert get_entity_state.call_count == 0
+    assert snapshot["parked"] == ON
+    assert snapshot["battery"] == "80"
+    assert snapshot["lock"] == "locked"
+
+
+def test_vehicle_card_initialize_forces_full_render(mt: MaestroTest) -> None:
+    vehicle_card = build_vehicle_card(mt)
+    vehicle_card.render(countdown_func=tick)
+    vehicle_card.initialize()
+
+    with patch.object(vehicle_card, "_compute_row_1", wraps=vehicle_card._compute_row_1) as row_1:
+        vehicle_card.render(countdown_func=tick)
+
+    assert row_1.call_count == 1
+
+
+def test_vehicle_card_failed_post_forces_full_render(mt: MaestroTest) -> None:
+    vehicle_card = build_vehicle_card(mt)
+
+    # The first render's post fails, so none of its rows reach the card
+    with (
+        patch.object(test_card, "update", side_effect=ConnectionError("hass unavailable")),
+        pytest.raises(ConnectionError),
+    ):
+        vehicle_card.render(countdown_func=tick)
+
+    # The next render recomputes every row even though no inputs changed
+    vehicle_card.render(countdown_func=tick)
+    mt.assert_state(test_card, "Air Off")
+    mt.assert_attribute(test_card, "row_1_value", "80%")
+    mt.assert_attribute(test_card, "row_3_value", "72° F")
+
+
+def test_vehicle_card_countdown_ticks_when_minute_changes(mt: MaestroTest) -> None:
+    vehicle_card = build_vehicle_card(mt)
+    vehicle_card.render(countdown_func=tick)
+    mt.assert_job_not_scheduled(COUNTDOWN_JOB_ID)
+
+    with mt.mock_datetime_as(datetime(2026, 1, 1, 11, 50, 30, tzinfo=UTC)):
+        mt.set_state(Nyx.parked, OFF)
+        vehicle_card.render(countdown_func=tick)
+
+    # 9.5 minutes out shows 9, which changes once fewer than 9 minutes remain
+    mt.assert_attribute(test_card, "row_3_value", "9 minutes")
+    mt.assert_job_scheduled(
+        COUNTDOWN_JOB_ID, tick, run_time=datetime(2026, 1, 1, 11, 51, 1, tzinfo=UTC)
+    )
+
+    with (
+        patch.object(JobScheduler, "schedule_job", wraps=JobScheduler().schedule_job) as schedule,
+        mt.mock_datetime_as(datetime(2026, 1, 1, 11, 50, 45, tzinfo=UTC)),
+    ):
+        # Unrelated changes don't touch the countdown
+        mt.set_state(Nyx.battery, "79")
+        vehicle_card.render(countdown_func=tick)
+        assert schedule.call_count == 0
+
+    with mt.mock_datetime_as(datetime(2026, 1, 1, 11, 51, 1, tzinfo=UTC)):
+        vehicle_card.tick_countdown(countdown_func=tick)
+
+    mt.assert_attribute(test_card, "row_3_value", "8 minutes")
+    mt.assert_job_scheduled(
+        COUNTDOWN_JOB_ID, tick, run_time=datetime(2026, 1, 1, 11, 52, 1, tzinfo=UTC)
+    )
+
+    # Parking cancels the countdown
+    with mt.mock_datetime_as(datetime(2026, 1, 1, 11, 53, tzinfo=UTC)):
+        mt.set_state(Nyx.parked, ON)
+        vehicle_card.render(countdown_func=tick)
+
+    mt.assert_job_not_scheduled(COUNTDOWN_JOB_ID)
+    mt.assert_attribute(test_card, "row_3_value", "72° F")
@@ -0,0 +1,236 @@
+import threading
+from collections.abc import Callable
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from typing import Any
+
+from maestro.domains import HOME, ON, UNAVAILABLE, UNKNOWN, Entity
+from maestro.integrations import StateManager
+from maestro.utils import JobScheduler, local_now, resolve_timestamp
+
+from custom_domains.zone_extended import ZoneExtended
+from scripts.common.cache_reads import get_cached_states
+from scripts.frontend.common.card_updates import CardUpdater
+from scripts.frontend.common.entity_card import EntityCardAttributes, RowColor
+from scripts.frontend.common.icons import Icon, battery_icon
+from scripts.vehicles.common import Nyx, Tess
+
+type VehicleConfig = type[Nyx] | type[Tess]
+type VehicleSnapshot = dict[str, str]
+
+# Lands each countdown tick just after the displayed minute rolls over
+COUNTDOWN_TICK_OFFSET = timedelta(seconds=1)
+
+# Vehicle config attributes whose state changes should re-render the card
+TRIGGER_FIELDS = (
+    "climate",
+    "parked",
+    "software_update",
+    "battery",
+    "location",
+    "destination",
+    "lock",
+    "arrival_time",
+    "temperature_inside",
+)
+
+# Vehicle config attributes each part of the card is computed from
+ROW_INPUTS: dict[str, tuple[str, ...]] = {
+    "state": ("parked", "climate", "software_update"),
+    "row_1": ("battery", "charger", "charge_limit"),
+    "row_2": ("location", "destination", "parked", "lock"),
+    "row_3": ("temperature_inside", "parked", "arrival_time", "climate"),
+}
+SNAPSHOT_FIELDS = tuple(sorted({field for fields in ROW_INPUTS.values() for field in fields}))
+
+
+class VehicleCard:
+    """
+    Renders an entity card for one vehicle from a single batched read of its entity states.
+    The previous snapshot is kept so that only rows whose inputs changed are recomputed.
+    While driving, the arrival countdown is ticked only when its displayed minute changes.
+    """
+
+    def __init__(
+        self,
+        vehicle: VehicleConfig,
+        card: Entity,
+        title: str,
+        icon: Icon,
+        countdown_job_id: str,
+    ) -> None:
+        self.vehicle = vehicle
+        self.card = card
+        self.title = title
+        self.icon = icon
+        self.countdown_job_id = countdown_job_id
+        self.card_updater = CardUpdater(card, on_flush_failed=self._forget_snapshot)
+
+        self._last_snapshot: VehicleSnapshot = {}
+        self._countdown_at: datetime | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def trigger_entities(self) -> list[Entity]:
+        return [getattr(self.vehicle, field) for field in TRIGGER_FIELDS]
+
+    def initialize(self) -> None:
+        attributes = EntityCardAttributes(title=self.title, icon=self.icon)
+        StateManager().initialize_hass_entity(
+            entity_id=self.card.id,
+            state="Loading...",
+            attributes=asdict(attributes),
+            restore_cached=True,
+        )
+        self.card_updater.reset()
+        with self._lock:
+            self._last_snapshot = {}
+        self.card_updater.update(title=attributes.title)
+
+    def render(self, countdown_func: Callable[[], None]) -> None:
+        """Recompute the rows whose inputs changed since the last render in one card update"""
+        snapshot = self.take_snapshot()
+        with self._lock:
+            previous, self._last_snapshot = self._last_snapshot, snapshot
+
+        changed = {field for field in SNAPSHOT_FIELDS if previous.get(field) != snapshot[field]}
+
+        def is_dirty(row: str) -> bool:
+            return not changed.isdisjoint(ROW_INPUTS[row])
+
+        state = None
+        attributes: dict[str, Any] = {}
+        if is_dirty("state"):
+            state, state_attributes = self._compute_state(snapshot)
+            attributes.update(state_attributes)
+        if is_dirty("row_1"):
+            attributes.update(self._compute_row_1(snapshot))
+        if is_dirty("row_2"):
+            attributes.update(self._compute_row_2(snapshot))
+        if is_dirty("row_3"):
+            attributes.update(self._compute_row_3(snapshot, countdown_func))
+
+        if state is None and not attributes:
+            return
+
+        self.card_updater.update(state=state, **attributes)
+
+    def tick_countdown(self, countdown_func: Callable[[], None]) -> None:
+        """Refresh only the arrival countdown row. Other rows are left to `render`"""
+        self.card_updater.update(**self._compute_row_3(self.take_snapshot(), countdown_func))
+
+    def take_snapshot(self) -> VehicleSnapshot:
+        """Read every input entity's cached state in one round trip, fetching any misses"""
+        entities: list[Entity] = [getattr(self.vehicle, field) for field in SNAPSHOT_FIELDS]
+        state_manager = StateManager()
+
+        cached_states = get_cached_states([entity.id for entity in entities])
+
+        snapshot: VehicleSnapshot = {}
+        for field, entity, cached_state in zip(
+            SNAPSHOT_FIELDS, entities, cached_states, strict=True
+        ):
+            if cached_state is None:
+                snapshot[field] = state_manager.get_entity_state(entity.id)
+            else:
+                snapshot[field] = str(cached_state)
+
+        return snapshot
+
+    def _forget_snapshot(self) -> None:
+        """Recompute every row on the next render, since the last rows computed weren't posted"""
+        with self._lock:
+            self._last_snapshot = {}
+
+    def _compute_state(self, snapshot: VehicleSnapshot) -> tuple[str, dict[str, str | bool]]:
+        if snapshot["parked"] != ON:
+            return "Driving", {"icon": Icon.ROAD_VARIANT, "active": True}
+        if snapshot["climate"] == self.vehicle.climate.HVACMode.HEAT_COOL:
+            return "Air On", {"icon": Icon.FAN, "active": True}
+
+        icon = Icon.UPDATE if snapshot["software_update"] == ON else self.icon
+        return "Air Off", {"icon": icon, "active": False}
+
+    def _compute_row_1(self, snapshot: VehicleSnapshot) -> dict[str, str]:
+        battery = snapshot["battery"]
+        if battery in [UNKNOWN, UNAVAILABLE]:
+            return {"row_1_icon": Icon.BATTERY_UNKNOWN}
+
+        icon = battery_icon(
+            battery=float(battery),
+            charging=snapshot["charger"] == ON,
+            full_threshold=int(snapshot["charge_limit"]),
+        )
+        return {"row_1_value": battery + "%", "row_1_icon": icon}
+
+    def _compute_row_2(self, snapshot: VehicleSnapshot) -> dict[str, str]:
+        if snapshot["location"] == HOME:
+            return {"row_2_value": "Home", "row_2_icon": Icon.HOME, "row_2_color": RowColor.DEFAULT}
+        if snapshot["destination"] != UNKNOWN and snapshot["parked"] != ON:
+            destination_metadata = ZoneExtended.get_zone_metadata(snapshot["destination"])
+            return {
+                "row_2_value": str(destination_metadata.short_name),
+                "row_2_icon": Icon.NAVIGATION,
+                "row_2_color": RowColor.DEFAULT,
+            }
+        if snapshot["lock"] in [UNKNOWN, UNAVAILABLE]:
+            # Leave the row color as it was
+            return {"row_2_value": "Unknown", "row_2_icon": Icon.LOCK_QUESTION}
+
+        locked = snapshot["lock"] == "locked"
+        return {
+            "row_2_value": snapshot["lock"],
+            "row_2_icon": Icon.LOCK if locked else Icon.LOCK_OPEN_VARIANT,
+            "row_2_color": RowColor.DEFAULT if locked else RowColor.RED,
+        }
+
+    def _compute_row_3(
+        self, snapshot: VehicleSnapshot, countdown_func: Callable[[], None]
+    ) -> dict[str, str]:
+        if any(snapshot[field] in [UNKNOWN, UNAVAILABLE] for field in ROW_INPUTS["row_3"]):
+            self._cancel_countdown()
+            return {
+                "row_3_value": "Unavailable",
+                "row_3_icon": Icon.THERMOMETER_OFF,
+                "row_3_color": RowColor.DEFAULT,
+            }
+
+        if snapshot["parked"] != ON:
+            arrival_time = resolve_timestamp(snapshot["arrival_time"])
+            seconds_remaining = (arrival_time - local_now()).total_seconds()
+            minutes_remaining = int(seconds_remaining // 60)
+
+            if minutes_remaining >= 0:
+                # The display drops a minute once less than `minutes_remaining` are left
+                tick_at = arrival_time - timedelta(minutes=minutes_remaining)
+                self._schedule_countdown(tick_at + COUNTDOWN_TICK_OFFSET, countdown_func)
+                return {"row_3_value": f"{minutes_remaining} minutes", "row_3_icon": Icon.MAP_CLOCK}
+
+        self._cancel_countdown()
+        current_temp = int(float(snapshot["temperature_inside"]))
+        color = RowColor.RED if current_temp >= 100 else RowColor.DEFAULT
+        return {
+            "row_3_value": f"{current_temp}° F",
+            "row_3_icon": Icon.THERMOMETER,
+            "row_3_color": color,
+        }
+
+    def _schedule_countdown(self, run_time: datetime, countdown_func: Callable[[], None]) -> None:
+        with self._lock:
+            if self._countdown_at == run_time:
+                return
+            self._countdown_at = run_time
+
+        JobScheduler().schedule_job(
+            run_time=run_time,
+            func=countdown_func,
+            job_id=self.countdown_job_id,
+        )
+
+    def _cancel_countdown(self) -> None:
+        with self._lock:
+            if self._countdown_at is None:
+                return
+            self._countdown_at = None
+
+        JobScheduler().cancel_job(self.countdown_job_id)
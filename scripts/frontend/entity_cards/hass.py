@@ -1,5 +1,3 @@
-import socket
-from contextlib import suppress
 from dataclasses import asdict
 from datetime import timedelta
 
@@ -16,12 +14,16 @@ from maestro.triggers import (
 from maestro.utils import JobScheduler, local_now
 
 from registry import binary_sensor, maestro, sensor, update
+from scripts.common.connectivity import connectivity_monitor
+from scripts.frontend.common.card_updates import CardUpdater
 from scripts.frontend.common.entity_card import EntityCardAttributes, RowColor
 from scripts.frontend.common.icons import Icon
 
 card = maestro.entity_card_6
+card_updater = CardUpdater(card)
 
 ZWAVE_CHECK_JOB_ID = "post_startup_zwave_check"
+LATENCY_BUCKET_MS = 10
 
 
 @hass_trigger(HassEvent.STARTUP)
@@ -37,7 +39,8 @@ def initialize_card() -> None:
         attributes=asdict(attributes),
         restore_cached=True,
     )
-    card.update(
+    card_updater.reset()
+    card_updater.update(
         title=attributes.title,
         row_1_icon=Icon.Z_WAVE,
         row_2_icon=Icon.THERMOMETER,
@@ -51,7 +54,8 @@ def set_state() -> None:
         update.home_assistant_core_update.state == ON
         or update.home_assistant_supervisor_update.state == ON
     )
-    if not check_internet_connection():
+    connectivity = connectivity_monitor.status()
+    if not connectivity.online:
         state = "Offline"
         icon = Icon.WEB_OFF
         blink = True
@@ -60,7 +64,22 @@ def set_state() -> None:
         icon = Icon.UPDATE if update_available else Icon.HOME_ASSISTANT
         blink = False
 
-    card.update(state=state, icon=icon, active=update_available, blink=blink)
+    card_updater.update(
+        state=state,
+        icon=icon,
+        active=update_available,
+        blink=blink,
+        latency=format_latency(connectivity.latency_ms),
+    )
+
+
+def format_latency(latency_ms: int | None) -> str:
+    """Latency rounded to the nearest bucket, so jitter doesn't re-post the card every minute"""
+    if latency_ms is None:
+        return "Offline"
+
+    bucketed = round(latency_ms / LATENCY_BUCKET_MS) * LATENCY_BUCKET_MS
+    return f"{max(bucketed, LATENCY_BUCKET_MS)} ms"
 
 
 @hass_trigger(HassEvent.STARTUP)
@@ -73,7 +92,7 @@ def post_startup_zwave_check() -> None:
 def set_row_1() -> None:
     value = "Running" if binary_sensor.z_wave_js_running.is_on else "Not Running"
     color = RowColor.DEFAULT if binary_sensor.z_wave_js_running.is_on else RowColor.RED
-    card.update(row_1_value=value, row_1_color=color)
+    card_updater.update(row_1_value=value, row_1_color=color)
 
 
 @state_change_trigger(sensor.cpu_temperature)
@@ -81,7 +100,7 @@ def set_row_2() -> None:
     cpu_temp = float(sensor.cpu_temperature.state)
     value = f"{cpu_temp:.0f} °F"
     color = RowColor.RED if cpu_temp >= 110 else RowColor.DEFAULT
-    card.update(row_2_value=value, row_2_color=color)
+    card_updater.update(row_2_value=value, row_2_color=color)
 
 
 @state_change_trigger(sensor.memory_use_percent)
@@ -89,12 +108,4 @@ def set_row_3() -> None:
     memory_use = float(sensor.memory_use_percent.state)
     value = f"{memory_use:.1f}%"
     color = RowColor.RED if memory_use >= 85 else RowColor.DEFAULT
-    card.update(row_3_value=value, row_3_color=color)
-
-
-def check_internet_connection() -> bool:
-    """Check internet connection by attempting TCP connections"""
-    for host in [("8.8.8.8", 53), ("1.1.1.1", 53)]:
-        with suppress(OSError), socket.create_connection(host, timeout=3):
-            return True
-    return False
+    card_updater.update(row_3_value=value, row_3_color=color)
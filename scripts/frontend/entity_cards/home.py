@@ -18,11 +18,13 @@ from maestro.utils import local_now
 
 from registry import binary_sensor, climate, maestro
 from scripts.common.event_type import UIEvent, ui_event_trigger
+from scripts.frontend.common.card_updates import CardUpdater
 from scripts.frontend.common.entity_card import EntityCardAttributes, RowColor
 from scripts.frontend.common.icons import Icon
 from scripts.home.door_left_open import EXTERIOR_DOORS
 
 card = maestro.entity_card_3
+card_updater = CardUpdater(card)
 
 
 @hass_trigger(HassEvent.STARTUP)
@@ -38,7 +40,8 @@ def initialize_card() -> None:
         attributes=asdict(attributes),
         restore_cached=True,
     )
-    card.update(title=attributes.title, row_3_icon=Icon.DOG)
+    card_updater.reset()
+    card_updater.update(title=attributes.title, row_3_icon=Icon.DOG)
 
 
 @state_change_trigger(*EXTERIOR_DOORS)
@@ -58,28 +61,28 @@ def set_state() -> None:
         icon = Icon.HOME
         active = False
 
-    card.update(state=state, icon=icon, active=active)
+    card_updater.update(state=state, icon=icon, active=active)
 
 
 @state_change_trigger(climate.thermostat)
 @cron_trigger("*/10 * * * *")
 def set_row_1() -> None:
     if climate.thermostat.state in [UNKNOWN, UNAVAILABLE]:
-        card.update(row_1_value="Offline", row_1_icon=Icon.THERMOMETER_OFF)
+        card_updater.update(row_1_value="Offline", row_1_icon=Icon.THERMOMETER_OFF)
         return
 
     temperature = climate.thermostat.current_temperature
     humidity = climate.thermostat.current_humidity
 
     value = f"{temperature:.0f}° · {humidity:.0f}%"
-    card.update(row_1_value=value, row_1_icon=Icon.THERMOMETER)
+    card_updater.update(row_1_value=value, row_1_icon=Icon.THERMOMETER)
 
 
 @state_change_trigger(climate.thermostat)
 @cron_trigger("*/10 * * * *")
 def set_row_2() -> None:
     if climate.thermostat.state in [UNKNOWN, UNAVAILABLE]:
-        card.update(row_2_value="Offline", row_2_icon=Icon.HVAC)
+        card_updater.update(row_2_value="Offline", row_2_icon=Icon.HVAC)
         return
 
     value = climate.thermostat.hvac_action
@@ -92,18 +95,18 @@ def set_row_2() -> None:
 
     icon_map = {"cool": Icon.SNOWFLAKE, "heat": Icon.FIRE, "off": Icon.HVAC_OFF}
     icon = icon_map.get(climate.thermostat.state, Icon.HELP)
-    card.update(row_2_value=value, row_2_icon=icon)
+    card_updater.update(row_2_value=value, row_2_icon=icon)
 
 
 @state_change_trigger(binary_sensor.chelsea_cabinet, to_state=ON)
 def set_row_3() -> None:
     value = local_now().strftime("%-I:%M %p")
-    card.update(row_3_value=value, row_3_color=RowColor.DEFAULT)
+    card_updater.update(row_3_value=value, row_3_color=RowColor.DEFAULT)
 
 
 @cron_trigger(hour=18, day_of_week=Day.MONDAY)
 def garbage_bin_reminder() -> None:
-    card.blink = True
+    card_updater.update(blink=True)
 
 
 @cron_trigger(hour=7)
@@ -111,13 +114,15 @@ def garbage_bin_reminder() -> None:
 def feed_chelsea_reminder() -> None:
     last_changed = binary_sensor.chelsea_cabinet.last_changed
     if local_now() - last_changed > timedelta(hours=1):
-        card.row_3_color = RowColor.RED
+        card_updater.update(row_3_color=RowColor.RED)
 
 
 @ui_event_trigger(UIEvent.ENTITY_CARD_3_TAP)
 def handle_tap() -> None:
     if card.blink:
-        card.blink = False
+        card_updater.update(blink=False)
         return
 
-    card.row_3_color = RowColor.DEFAULT if card.row_3_color == RowColor.RED else RowColor.RED
+    card_updater.update(
+        row_3_color=RowColor.DEFAULT if card.row_3_color == RowColor.RED else RowColor.RED
+    )
@@ -1,6 +1,5 @@
 from dataclasses import asdict
 from datetime import timedelta
-from time import sleep
 
 from maestro.integrations import StateManager
 from maestro.triggers import (
@@ -15,11 +14,13 @@ from maestro.utils import format_duration, local_now
 
 from registry import maestro
 from scripts.common.event_type import EventType
+from scripts.frontend.common.card_updates import CardUpdater
 from scripts.frontend.common.entity_card import EntityCardAttributes
 from scripts.frontend.common.icons import Icon
-from scripts.sleep_tracking.queries import get_awake_time, get_last_events
+from scripts.sleep_tracking.queries import get_awake_time, get_recent_events
 
 card = maestro.entity_card_5
+card_updater = CardUpdater(card)
 
 
 @hass_trigger(HassEvent.STARTUP)
@@ -35,7 +36,8 @@ def initialize_card() -> None:
         attributes=asdict(attributes),
         restore_cached=True,
     )
-    card.update(
+    card_updater.reset()
+    card_updater.update(
         title=attributes.title,
         row_1_icon=Icon.TIMER_OUTLINE,
         row_2_icon=Icon.HISTORY,
@@ -45,13 +47,14 @@ def initialize_card() -> None:
 
 @cron_trigger("* * * * *")
 def update_card() -> None:
-    most_recent_event, previous_event = get_last_events(count=2)
+    """Durations are computed from cached event timestamps, so the per-minute tick skips the DB"""
+    most_recent_event, previous_event = get_recent_events()
     awake: bool = most_recent_event.wakeup
     duration: timedelta = local_now() - most_recent_event.timestamp
     prev_duration: timedelta = most_recent_event.timestamp - previous_event.timestamp
     awake_time = get_awake_time()
 
-    card.update(
+    card_updater.update(
         state="Awake" if awake else "Asleep",
         icon=Icon.BABY_BUGGY if awake else Icon.SLEEP,
         active=not awake,
@@ -61,8 +64,6 @@ def update_card() -> None:
     )
 
 
-@event_fired_trigger(EventType.OLIVIA_ASLEEP)
-@event_fired_trigger(EventType.OLIVIA_AWAKE)
+@event_fired_trigger(EventType.SLEEP_EVENT_COMMITTED)
 def trigger_update() -> None:
-    sleep(2)  # Let DB operations complete
     update_card()
@@ -12,17 +12,30 @@ from maestro.triggers import (
     maestro_trigger,
     state_change_trigger,
 )
-from maestro.utils import local_now, log
+from maestro.utils import JobScheduler, local_now, log
 
 from registry import maestro, sensor, switch
 from scripts.common.event_type import UIEvent, ui_event_trigger
-from scripts.common.finance import NET_SYMBOL, SPY_SYMBOL, get_stock_quote
+from scripts.common.finance import (
+    NET_SYMBOL,
+    SPY_SYMBOL,
+    FinnhubResponse,
+    finnhub_client,
+    get_next_quote_refresh,
+)
+from scripts.common.market_calendar import is_market_open
+from scripts.common.price_history import downsample_session, get_price_history, record_quotes
 from scripts.config.secrets import ANNUAL_NET_SHARES
+from scripts.frontend.common.card_updates import CardUpdater
 from scripts.frontend.common.entity_card import EntityCardAttributes, RowColor
 from scripts.frontend.common.icons import Icon
+from scripts.frontend.common.sparkline import SPARKLINE_WIDTH, render_sparkline
 from scripts.home.office.meetings import toggle_meeting_active
 
 card = maestro.entity_card_4
+card_updater = CardUpdater(card)
+
+STOCK_REFRESH_JOB_ID = "office_stock_refresh"
 
 
 @hass_trigger(HassEvent.STARTUP)
@@ -38,7 +51,10 @@ def initialize_card() -> None:
         attributes=asdict(attributes),
         restore_cached=True,
     )
-    card.update(title=attributes.title, row_2_icon=Icon.FINANCE, row_3_icon=Icon.CLOUD_OUTLINE)
+    card_updater.reset()
+    card_updater.update(
+        title=attributes.title, row_2_icon=Icon.FINANCE, row_3_icon=Icon.CLOUD_OUTLINE
+    )
 
 
 @state_change_trigger(maestro.meeting_active)
@@ -52,7 +68,7 @@ def set_state(state_change: StateChangeEvent) -> None:
         state = "Available"
         icon = Icon.CLOUD
 
-    card.update(state=state, active=active, icon=icon)
+    card_updater.update(state=state, active=active, icon=icon)
 
 
 @state_change_trigger(
@@ -62,7 +78,7 @@ def set_state(state_change: StateChangeEvent) -> None:
 )
 def set_row_1() -> None:
     if sensor.office_ambient_sensor_temperature.state in [UNKNOWN, UNAVAILABLE]:
-        card.update(row_1_value="Offline", row_1_icon=Icon.THERMOMETER_OFF)
+        card_updater.update(row_1_value="Offline", row_1_icon=Icon.THERMOMETER_OFF)
         return
 
     temperature = float(sensor.office_ambient_sensor_temperature.state)
@@ -70,16 +86,13 @@ def set_row_1() -> None:
 
     value = f"{temperature:.0f}° · {humidity:.0f}%"
     icon = Icon.RADIATOR if switch.space_heater.is_on else Icon.THERMOMETER_WATER
-    card.update(row_1_value=value, row_1_icon=icon)
+    card_updater.update(row_1_value=value, row_1_icon=icon)
 
 
-def build_stock_row(symbol: str) -> tuple[str, RowColor] | None:
-    """Fetch stock quote and return current display value and color"""
-    try:
-        quote = get_stock_quote(symbol)
-    except Exception as e:
-        log.error("Finnhub API request failed", exception_type=type(e).__name__)
-        return "API Error", RowColor.DEFAULT
+def build_stock_row(quote: FinnhubResponse | None, market_open: bool) -> tuple[str, RowColor]:
+    """Return the display value and color for a stock quote, or why there isn't one"""
+    if quote is None:
+        return "API Error" if market_open else "Closed", RowColor.DEFAULT
 
     value = f"${quote.c:.0f}"
     color = RowColor.DEFAULT
@@ -89,37 +102,79 @@ def build_stock_row(symbol: str) -> tuple[str, RowColor] | None:
         plus_sign = "+" if quote.dp >= 0 else ""
         value += f" ({plus_sign}{quote.dp:.0f}%)"
         color = RowColor.GREEN if quote.dp > 5 else RowColor.RED if quote.dp < -5 else color
+    elif not market_open:
+        value += " · Closed"
 
     return value, color
 
 
-@cron_trigger("* 9-16 * * 1-5")
+@hass_trigger(HassEvent.STARTUP)
+@maestro_trigger(MaestroEvent.STARTUP)
+def start_stock_refresh() -> None:
+    refresh_stock_rows()
+
+
+def refresh_stock_rows(settle: bool = False) -> None:
+    """Refresh the stock rows, then schedule the next refresh from the market calendar"""
+    try:
+        set_stock_rows(settle=settle)
+    finally:
+        refresh = get_next_quote_refresh(local_now())
+        JobScheduler().schedule_job(
+            run_time=refresh.run_time,
+            func=refresh_stock_rows,
+            func_params={"settle": refresh.settle},
+            job_id=STOCK_REFRESH_JOB_ID,
+        )
+
+
 @cron_trigger(hour=1)
-def set_stock_rows() -> None:
-    attr_updates = {}
+def redraw_stock_rows() -> None:
+    """Nightly redraw from cache so the rows show Closed, restarting the refresh chain if lost"""
+    if JobScheduler().get_job(STOCK_REFRESH_JOB_ID) is None:
+        refresh_stock_rows()
+        return
+
+    set_stock_rows()
+
 
-    if spy_result := build_stock_row(SPY_SYMBOL):
-        value, color = spy_result
-        attr_updates["row_2_value"] = value
-        attr_updates["row_2_color"] = color
+def set_stock_rows(settle: bool = False) -> None:
+    """Quotes are only fetched during a session or to settle the close; otherwise cache is used"""
+    market_open = is_market_open(local_now())
+    symbols = [SPY_SYMBOL, NET_SYMBOL]
+    if market_open or settle:
+        quotes = finnhub_client.get_quotes(symbols)
+        record_quotes(quotes)
+    else:
+        quotes = finnhub_client.get_cached_quotes(symbols)
+
+    row_2_value, row_2_color = build_stock_row(quotes.get(SPY_SYMBOL), market_open or settle)
+    row_3_value, row_3_color = build_stock_row(quotes.get(NET_SYMBOL), market_open or settle)
+
+    card_updater.update(
+        row_2_value=row_2_value,
+        row_2_color=row_2_color,
+        row_3_value=row_3_value,
+        row_3_color=row_3_color,
+        row_2_sparkline=build_sparkline(SPY_SYMBOL),
+        row_3_sparkline=build_sparkline(NET_SYMBOL),
+    )
 
-    if spy_result := build_stock_row(NET_SYMBOL):
-        value, color = spy_result
-        attr_updates["row_3_value"] = value
-        attr_updates["row_3_color"] = color
 
-    card.update(**attr_updates)
+def build_sparkline(symbol: str) -> str:
+    """Intraday sparkline of the latest session, drawn from recorded quotes"""
+    return render_sparkline(downsample_session(get_price_history(symbol), SPARKLINE_WIDTH))
 
 
 @cron_trigger(hour=8, minute=20, day_of_week=[0, 1, 2, 3, 4])
 def daily_review_reminder() -> None:
-    card.blink = True
+    card_updater.update(blink=True)
 
 
 @ui_event_trigger(UIEvent.ENTITY_CARD_4_TAP)
 def handle_tap() -> None:
     if card.blink:
-        card.blink = False
+        card_updater.update(blink=False)
         return
 
     toggle_meeting_active()
@@ -128,16 +183,16 @@ def handle_tap() -> None:
 @ui_event_trigger(UIEvent.ENTITY_CARD_4_DOUBLE_TAP)
 def handle_double_tap() -> None:
     try:
-        quote = get_stock_quote(NET_SYMBOL)
+        quote = finnhub_client.get_quote(NET_SYMBOL)
     except Exception:
         log.exception("Finnhub API request failed")
-        card.update(row_2_value="Failed :(", row_3_value="Failed :(")
+        card_updater.update(row_2_value="Failed :(", row_3_value="Failed :(")
         return
 
     annual_vest = quote.c * ANNUAL_NET_SHARES
     quarterly_vest = annual_vest / 4
 
-    card.update(
+    card_updater.update(
         row_2_value=f"${quarterly_vest:,.0f}",
         row_2_color=RowColor.DEFAULT,
         row_3_value=f"${annual_vest:,.0f}",
@@ -7,21 +7,25 @@ from maestro.triggers import (
     maestro_trigger,
     state_change_trigger,
 )
-from maestro.utils import local_now, readable_relative_date
+from maestro.utils import JobScheduler, local_now, readable_relative_date
 
 from registry import calendar, maestro
 from scripts.common.balldontlie import (
     DETROIT_TIGERS_TEAM_ID,
+    STATUS_FINAL,
+    STATUS_IN_PROGRESS,
     InningHalf,
     LiveGameData,
-    get_live_game,
+    balldontlie_client,
+    get_poll_interval,
 )
+from scripts.frontend.common.card_updates import CardUpdater
 from scripts.frontend.common.icons import Icon
 
 card = maestro.next_game_card
+card_updater = CardUpdater(card)
 
-STATUS_IN_PROGRESS = "STATUS_IN_PROGRESS"
-STATUS_FINAL = "STATUS_FINAL"
+LIVE_GAME_POLL_JOB_ID = "next_game_live_poll"
 
 NBSP = "\u00a0"
 ARROW_PAD = NBSP * 2
@@ -46,12 +50,54 @@ def initialize_card() -> None:
         attributes=attributes,
         restore_cached=True,
     )
-    card.update(icon=attributes["icon"])
+    card_updater.reset()
+    card_updater.update(icon=attributes["icon"])
 
 
-@cron_trigger("*/2 * * * *")
+@cron_trigger(minute=0)
 @state_change_trigger(calendar.detroit_tigers)
 def update_card() -> None:
+    """Render from the latest known game state, and make sure live polling is scheduled"""
+    next_game = calendar.detroit_tigers.next_event
+    game_date = next_game.start.strftime("%Y-%m-%d")
+
+    if next_game.start > local_now():
+        render_card(game=None)
+        JobScheduler().schedule_job(
+            run_time=next_game.start, func=poll_live_game, job_id=LIVE_GAME_POLL_JOB_ID
+        )
+        return
+
+    game = balldontlie_client.get_latest_game(DETROIT_TIGERS_TEAM_ID, game_date)
+    if game is not None and (game.status == STATUS_FINAL or is_poll_scheduled()):
+        render_card(game)
+        return
+
+    poll_live_game()
+
+
+def poll_live_game() -> None:
+    """Fetch the live game and poll again at a cadence that follows the game's state"""
+    next_game = calendar.detroit_tigers.next_event
+    if next_game.start > local_now():
+        return
+
+    game_date = next_game.start.strftime("%Y-%m-%d")
+    previous = balldontlie_client.get_latest_game(DETROIT_TIGERS_TEAM_ID, game_date)
+    game = balldontlie_client.get_live_game(DETROIT_TIGERS_TEAM_ID, game_date)
+    render_card(game)
+
+    if (interval := get_poll_interval(game, previous)) is not None:
+        JobScheduler().schedule_job(
+            run_time=local_now() + interval, func=poll_live_game, job_id=LIVE_GAME_POLL_JOB_ID
+        )
+
+
+def is_poll_scheduled() -> bool:
+    return JobScheduler().get_job(LIVE_GAME_POLL_JOB_ID) is not None
+
+
+def render_card(game: LiveGameData | None) -> None:
     next_game = calendar.detroit_tigers.next_event
     away_team, home_team = parse_teams(next_game.title)
     game_active = next_game.start <= local_now()
@@ -59,12 +105,10 @@ def update_card() -> None:
     middle_row = readable_relative_date(next_game.start).capitalize()
     bottom_row = next_game.start.strftime("%-I:%M %p")
 
-    if game_active:
-        game = get_live_game(DETROIT_TIGERS_TEAM_ID, next_game.start.strftime("%Y-%m-%d"))
-        if game is not None:
-            middle_row, bottom_row = format_live_game(game)
+    if game_active and game is not None:
+        middle_row, bottom_row = format_live_game(game)
 
-    card.update(
+    card_updater.update(
         top_row=next_game.title,
         middle_row=middle_row,
         bottom_row=bottom_row,
@@ -0,0 +1,128 @@
+import threading
+from collections import Counter
+from time import monotonic, sleep
+from typing import Any
+
+from maestro.testing import MaestroTest
+
+from registry import media_player
+
+from ..cast import DASHCAST_APP_ID, NEST_DISPLAYS, CastManager, CastOutcome
+
+CAST_DELAY_SECONDS = 0.2
+
+
+class FakeChromecast:
+    def __init__(self) -> None:
+        self.disconnected = threading.Event()
+
+    def disconnect(self, **_: Any) -> None:
+        self.disconnected.set()
+
+
+class FakeDashCastController:
+    def __init__(self, ip_address: str, connections: Counter[str]) -> None:
+        self.ip_address = ip_address
+        self._cast = FakeChromecast()
+        self.app_id: str | None = None
+        self.loaded: list[str] = []
+        connections[ip_address] += 1
+
+    @property
+    def info(self) -> dict[str, Any]:
+        return {"app_id": self.app_id}
+
+    def prep_app(self) -> None:
+        self.app_id = DASHCAST_APP_ID
+
+    def load_url(self, url: str) -> None:
+        sleep(CAST_DELAY_SECONDS)
+        if self.ip_address == "hung":
+            # Never returns on its own, only once the connection is closed under it
+            self._cast.disconnected.wait()
+            raise ConnectionError("disconnected")
+        if self.ip_address == "unreachable":
+            raise ConnectionError(self.ip_address)
+        self.loaded.append(url)
+
+
+class FakeDisplays:
+    def __init__(self) -> None:
+        self.connections: Counter[str] = Counter()
+        self.controllers: dict[str, FakeDashCastController] = {}
+        self.lock = threading.Lock()
+
+    def connect(self, ip_address: str) -> FakeDashCastController:
+        with self.lock:
+            controller = FakeDashCastController(ip_address, self.connections)
+            self.controllers[ip_address] = controller
+            return controller
+
+
+def test_cast_all_concurrently(mt: MaestroTest) -> None:
+    displays = FakeDisplays()
+    manager = CastManager(NEST_DISPLAYS, url="http://dashboard", connect=displays.connect)
+
+    started = monotonic()
+    outcomes = manager.cast_all()
+    assert monotonic() - started < CAST_DELAY_SECONDS * len(NEST_DISPLAYS)
+    assert set(outcomes.values()) == {CastOutcome.CAST}
+
+    # Displays still showing the dashboard are skipped over the same connections
+    assert set(manager.cast_all().values()) == {CastOutcome.SKIPPED}
+    assert displays.connections == {ip_address: 1 for _, ip_address in NEST_DISPLAYS}
+
+    # A display that has dropped out of DashCast is cast to again
+    office_ip = NEST_DISPLAYS[0][1]
+    displays.controllers[office_ip].app_id = None
+    outcomes = manager.cast_all()
+    assert outcomes[media_player.office_display.id] == CastOutcome.CAST
+    assert list(outcomes.values()).count(CastOutcome.SKIPPED) == len(NEST_DISPLAYS) - 1
+    assert displays.controllers[office_ip].loaded == ["http://dashboard"] * 2
+
+
+def test_cast_failures_reconnect(mt: MaestroTest) -> None:
+    displays = FakeDisplays()
+    manager = CastManager(
+        [(media_player.office_display, "unreachable")],
+        url="http://dashboard",
+        timeout_seconds=CAST_DELAY_SECONDS / 2,
+        connect=displays.connect,
+    )
+
+    # A slow cast times out, and a failed one is reported rather than raised
+    assert manager.cast_all() == {media_player.office_display.id: CastOutcome.TIMED_OUT}
+    sleep(CAST_DELAY_SECONDS)
+    manager.timeout_seconds = CAST_DELAY_SECONDS * 5
+    assert manager.cast_all() == {media_player.office_display.id: CastOutcome.FAILED}
+
+    # Each failure drops the connection so the next attempt starts fresh
+    assert displays.connections["unreachable"] == 2
+
+
+def test_hung_cast_does_not_starve_other_displays(mt: MaestroTest) -> None:
+    displays = FakeDisplays()
+    hung_display = media_player.office_display
+    manager = CastManager(
+        [(hung_display, "hung"), *NEST_DISPLAYS[1:]],
+        url="http://dashboard",
+        timeout_seconds=CAST_DELAY_SECONDS * 3,
+        connect=displays.connect,
+    )
+
+    try:
+        # Each round the hung cast times out and is disconnected, which unblocks its thread,
+        # so the next round reconnects instead of leaving the display skipped for good
+        for round_number in range(1, len(NEST_DISPLAYS) + 3):
+            for _, ip_address in NEST_DISPLAYS[1:]:
+                if ip_address in displays.controllers:
+                    displays.controllers[ip_address].app_id = None
+
+            outcomes = manager.cast_all()
+            assert outcomes.pop(hung_display.id) == CastOutcome.TIMED_OUT
+            assert set(outcomes.values()) == {CastOutcome.CAST}
+            assert displays.connections["hung"] == round_number
+            assert displays.controllers["hung"]._cast.disconnected.is_set()
+            sleep(CAST_DELAY_SECONDS)
+    finally:
+        displays.controllers["hung"]._cast.disconnect()
@@ -3,11 +3,12 @@ from datetime import timedelta
 from maestro.domains import Person
 from maestro.integrations import FiredEvent, StateChangeEvent
 from maestro.triggers import event_fired_trigger, state_change_trigger
-from maestro.utils import JobScheduler, Notif, format_duration, local_now
+from maestro.utils import Notif, format_duration, local_now
 
 from custom_domains import BathroomFloor
 from registry import climate, person
 from scripts.common.event_type import EventType
+from scripts.common.job_groups import GroupJob, JobGroup
 from scripts.config.secrets import USER_ID_TO_PERSON
 
 HEAT_TEMPERATURE = 85
@@ -17,6 +18,7 @@ AUTO_SHUTOFF_TIME = timedelta(hours=3)
 TEMPERATURE_CHECK_JOB_ID = "bathroom_floor_check_temp"
 TURN_OFF_HEAT_JOB_ID = "bathroom_floor_turn_off_heat"
 AUTO_SHUTOFF_JOB_ID = "bathroom_floor_auto_shutoff"
+JOB_GROUP = "bathroom_floor"
 
 
 @event_fired_trigger(EventType.BATHROOM_FLOOR)
@@ -26,19 +28,16 @@ def heat_bathroom_floor(event: FiredEvent) -> None:
 
     climate.bathroom_floor_thermostat.set_temperature(HEAT_TEMPERATURE)
 
-    scheduler = JobScheduler()
-
-    scheduler.schedule_job(
-        run_time=now + timedelta(minutes=1),
-        func=check_floor_temp,
-        func_params={"caller": caller},
-        job_id=TEMPERATURE_CHECK_JOB_ID,
-    )
-
-    scheduler.schedule_job(
-        run_time=now + HEAT_DURATION,
-        func=reset_floor_to_auto,
-        job_id=TURN_OFF_HEAT_JOB_ID,
+    JobGroup(JOB_GROUP).schedule(
+        GroupJob(
+            job_id=TEMPERATURE_CHECK_JOB_ID,
+            run_time=now + timedelta(minutes=1),
+            func=check_floor_temp,
+            func_params={"caller": caller},
+        ),
+        GroupJob(
+            job_id=TURN_OFF_HEAT_JOB_ID, run_time=now + HEAT_DURATION, func=reset_floor_to_auto
+        ),
     )
 
 
@@ -51,11 +50,13 @@ def check_floor_temp(caller: Person) -> None:
     ready_threshold = HEAT_TEMPERATURE - 5
 
     if current_temp < ready_threshold:
-        JobScheduler().schedule_job(
-            run_time=local_now() + timedelta(minutes=1),
-            func=check_floor_temp,
-            func_params={"caller": caller},
-            job_id=TEMPERATURE_CHECK_JOB_ID,
+        JobGroup(JOB_GROUP).schedule(
+            GroupJob(
+                job_id=TEMPERATURE_CHECK_JOB_ID,
+                run_time=local_now() + timedelta(minutes=1),
+                func=check_floor_temp,
+                func_params={"caller": caller},
+            )
         )
         return
 
@@ -79,16 +80,16 @@ def reset_after_timeout() -> None:
 
 @state_change_trigger(climate.bathroom_floor_thermostat)
 def bathroom_floor_timeout_handler(state_change: StateChangeEvent) -> None:
-    scheduler = JobScheduler()
+    jobs = JobGroup(JOB_GROUP)
 
     if state_change.new.state == BathroomFloor.HVACMode.AUTO:
-        scheduler.cancel_job(TEMPERATURE_CHECK_JOB_ID)
-        scheduler.cancel_job(TURN_OFF_HEAT_JOB_ID)
-        scheduler.cancel_job(AUTO_SHUTOFF_JOB_ID)
+        jobs.cancel()
         return
 
-    scheduler.schedule_job(
-        run_time=local_now() + AUTO_SHUTOFF_TIME,
-        func=reset_after_timeout,
-        job_id=AUTO_SHUTOFF_JOB_ID,
+    jobs.schedule(
+        GroupJob(
+            job_id=AUTO_SHUTOFF_JOB_ID,
+            run_time=local_now() + AUTO_SHUTOFF_TIME,
+            func=reset_after_timeout,
+        )
     )
@@ -3,9 +3,10 @@ from datetime import timedelta
 from maestro.domains import OFF, ON, UNAVAILABLE, BinarySensor, Cover
 from maestro.integrations import EntityId, NotifActionEvent, StateChangeEvent
 from maestro.triggers import notif_action_trigger, state_change_trigger
-from maestro.utils import JobScheduler, Notif, format_duration, local_now
+from maestro.utils import Notif, format_duration
 
 from registry import binary_sensor, cover, person
+from scripts.common.escalation import cancel_escalation, schedule_escalation
 
 PROCESS_ID_PREFIX = "door_left_open"
 SILENCE_NOTIF_ACTION_ID = "silence_door_notif"
@@ -30,8 +31,8 @@ def get_process_id(entity_id: EntityId) -> str:
     return f"{PROCESS_ID_PREFIX}_{entity_id.entity}"
 
 
-def get_job_id(entity_id: EntityId, time: timedelta) -> str:
-    return f"{get_process_id(entity_id)}_{int(time.total_seconds())}"
+def get_job_id(entity_id: EntityId) -> str:
+    return f"{get_process_id(entity_id)}_escalation"
 
 
 @state_change_trigger(*EXTERIOR_DOORS, to_state=ON)
@@ -40,18 +41,13 @@ def schedule_notifications(state_change: StateChangeEvent) -> None:
     if state_change.old.state == UNAVAILABLE:
         return
 
-    scheduler = JobScheduler()
-    now = local_now()
     door = state_change.entity_id.resolve_entity()
-
-    for time in NOTIFICATION_TIMES:
-        job_id = get_job_id(entity_id=state_change.entity_id, time=time)
-        scheduler.schedule_job(
-            run_time=now + time,
-            func=send_notifications,
-            func_params={"door": door, "duration": time},
-            job_id=job_id,
-        )
+    schedule_escalation(
+        job_id=get_job_id(state_change.entity_id),
+        func=send_notifications,
+        steps=NOTIFICATION_TIMES,
+        func_params={"door": door},
+    )
 
 
 def send_notifications(door: BinarySensor | Cover, duration: timedelta) -> None:
@@ -90,7 +86,4 @@ def silence_notif_action_called(notif_action: NotifActionEvent) -> None:
 
 
 def cancel_notifications(entity_id: EntityId) -> None:
-    scheduler = JobScheduler()
-    for time in NOTIFICATION_TIMES:
-        job_id = get_job_id(entity_id, time)
-        scheduler.cancel_job(job_id)
+    cancel_escalation(get_job_id(entity_id))
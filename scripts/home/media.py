@@ -1,8 +1,13 @@
-from maestro.integrations import StateChangeEvent
+from collections import Counter
+from datetime import timedelta
+
+from maestro.integrations import EntityId, StateChangeEvent, StateManager
 from maestro.triggers import cron_trigger, state_change_trigger
+from maestro.utils import JobScheduler, local_now, log
 
-from custom_domains.sonos_speaker import SonosSpeaker
+from custom_domains.sonos_speaker import SonosSpeaker, SpeakerAction
 from registry import media_player
+from scripts.common.speaker_scenes import SpeakerScene, SpeakerState, apply_scene
 
 MAIN_SPEAKERS: list[SonosSpeaker] = [
     media_player.living_room,
@@ -16,29 +21,79 @@ ALL_SPEAKERS: list[SonosSpeaker] = [
     media_player.office,
 ]
 
+GROUP_SPEAKERS_JOB_ID = "group_main_speakers"
+GROUP_SPEAKERS_LOCK_KEY = "group_main_speakers"
+# Long enough for speakers started together to all report playing before membership is read
+GROUPING_DEBOUNCE = timedelta(seconds=3)
 
-@cron_trigger(hour=3)
-def reset_speakers() -> None:
-    for speaker in ALL_SPEAKERS:
-        speaker.pause()
-        speaker.unmute()
+_grouping_stats: Counter[str] = Counter()
 
-    for speaker in MAIN_SPEAKERS:
-        speaker.set_volume(0.4)
 
-    media_player.portable.set_volume(0.2)
-    media_player.basement.set_volume(0.3)
-    media_player.office.set_volume(0.35)
-    media_player.living_room_tv.set_volume(0.1)
+NIGHTLY_SCENE: SpeakerScene = {
+    **{speaker.id: SpeakerState(volume=0.4, muted=False) for speaker in MAIN_SPEAKERS},
+    media_player.portable.id: SpeakerState(volume=0.2, muted=False),
+    media_player.basement.id: SpeakerState(volume=0.3, muted=False),
+    media_player.office.id: SpeakerState(volume=0.35, muted=False),
+    media_player.living_room_tv.id: SpeakerState(volume=0.1),
+}
+
+
+@cron_trigger(hour=3)
+def reset_speakers() -> None:
+    apply_scene(
+        NIGHTLY_SCENE,
+        [*ALL_SPEAKERS, media_player.living_room_tv],
+        extra_actions=[SpeakerAction(speaker, "media_pause") for speaker in ALL_SPEAKERS],
+    )
 
 
 @state_change_trigger(*MAIN_SPEAKERS, to_state="playing")
 def group_speakers(state_change: StateChangeEvent) -> None:
+    """Collapse a burst of speakers starting into one grouping pass, led by the first to start"""
     target = state_change.entity_id.resolve_entity()
     if not isinstance(target, SonosSpeaker):
         raise TypeError
 
-    if all(speaker.id in target.group_members for speaker in MAIN_SPEAKERS):
+    if is_grouped(target):
+        _grouping_stats["redundant_joins_suppressed"] += 1
         return
 
-    target.join(MAIN_SPEAKERS)
+    redis = StateManager().redis_client
+    with redis.lock(GROUP_SPEAKERS_LOCK_KEY):
+        if JobScheduler().get_job(GROUP_SPEAKERS_JOB_ID) is not None:
+            _grouping_stats["debounced"] += 1
+            return
+
+        JobScheduler().schedule_job(
+            run_time=local_now() + GROUPING_DEBOUNCE,
+            func=apply_speaker_grouping,
+            func_params={"coordinator_id": target.id},
+            job_id=GROUP_SPEAKERS_JOB_ID,
+        )
+
+
+def apply_speaker_grouping(coordinator_id: str) -> None:
+    """Join the main speakers to the coordinator, unless the burst has already grouped them"""
+    coordinator = EntityId(coordinator_id).resolve_entity()
+    if not isinstance(coordinator, SonosSpeaker):
+        raise TypeError
+
+    redis = StateManager().redis_client
+    with redis.lock(GROUP_SPEAKERS_LOCK_KEY):
+        if is_grouped(coordinator):
+            _grouping_stats["redundant_joins_suppressed"] += 1
+            log.debug("Main speakers already grouped", coordinator=coordinator.id)
+            return
+
+        coordinator.join(MAIN_SPEAKERS)
+        _grouping_stats["joins"] += 1
+
+
+def is_grouped(coordinator: SonosSpeaker) -> bool:
+    return {speaker.id for speaker in MAIN_SPEAKERS} <= set(coordinator.group_members)
+
+
+def grouping_stats() -> dict[str, int]:
+    return {
+        key: _grouping_stats[key] for key in ("joins", "debounced", "redundant_joins_suppressed")
+    }
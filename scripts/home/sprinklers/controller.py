@@ -5,6 +5,7 @@ from maestro.utils import IntervalSeconds, JobScheduler, local_now, log
 
 from custom_domains.sprinkler_zone import SprinklerZone
 from registry import input_boolean, person, switch
+from scripts.common.job_groups import GroupJob, JobGroup
 
 
 class SprinklerController:
@@ -20,7 +21,8 @@ class SprinklerController:
     all_zones: tuple[SprinklerZone, ...] = (zone_1, zone_2, zone_3, zone_4, zone_5)
 
     ZONE_RUN_TIME_CACHE_PREFIX = "sprinkler_run_time_zone_"
-    RUN_ZONE_JOB_ID_PREFIX = "sprinkler_run_zone_"
+    PROGRAM_JOB_GROUP = "sprinkler_run_zone"
+    RUN_ZONE_JOB_ID_PREFIX = f"{PROGRAM_JOB_GROUP}_"
 
     def __init__(
         self,
@@ -29,11 +31,11 @@ class SprinklerController:
     ) -> None:
         self.redis = redis_client or RedisClient()
         self.scheduler = scheduler or JobScheduler()
+        self.program_jobs = JobGroup(self.PROGRAM_JOB_GROUP, self.scheduler)
 
     def stop_all(self) -> None:
+        self.program_jobs.cancel()
         for zone in self.all_zones:
-            job_id = self.build_zone_run_job_id(zone)
-            self.scheduler.cancel_job(job_id)
             zone.turn_off()
 
     def get_zone_run_time(self, zone: SprinklerZone) -> int:
@@ -60,16 +62,21 @@ class SprinklerController:
         person.marshall.notify("Starting sprinkler program")
         start_time = local_now() + timedelta(seconds=2)
 
+        jobs: list[GroupJob] = []
         for zone in self.all_zones:
             run_time = min(self.get_zone_run_time(zone), 30)
-            self.scheduler.schedule_job(
-                run_time=start_time,
-                func=zone.run,
-                func_params={"minutes": run_time},
-                job_id=self.build_zone_run_job_id(zone),
+            jobs.append(
+                GroupJob(
+                    job_id=self.build_zone_run_job_id(zone),
+                    run_time=start_time,
+                    func=zone.run,
+                    func_params={"minutes": run_time},
+                )
             )
             start_time = start_time + timedelta(minutes=run_time, seconds=5)
 
+        self.program_jobs.schedule(*jobs)
+
     @classmethod
     def build_run_time_cache_key(cls, zone: SprinklerZone) -> str:
         prefix = cls.ZONE_RUN_TIME_CACHE_PREFIX
@@ -1,14 +1,18 @@
-from datetime import timedelta
+from datetime import datetime, timedelta
+from unittest.mock import patch
 
 from maestro.domains import OFF, ON, Cover
 from maestro.integrations import Domain
 from maestro.testing import MaestroTest
 
 from registry import binary_sensor, cover, person
+from scripts.common.escalation import run_escalation_step
 
 from .. import door_left_open
 
 test_door = binary_sensor.front_door
+FLAP_COUNT = 50
+OPENED_AT = datetime.fromisoformat("2026-05-01T18:00:00-04:00")
 
 
 def test_schedule_notifications(mt: MaestroTest) -> None:
@@ -18,9 +22,32 @@ def test_schedule_notifications(mt: MaestroTest) -> None:
     for door in door_left_open.EXTERIOR_DOORS:
         new_state = "open" if isinstance(door, Cover) else ON
         mt.trigger_state_change(door, new=new_state)
-        for time in door_left_open.NOTIFICATION_TIMES:
-            job_id = door_left_open.get_job_id(door.id, time)
-            mt.assert_job_scheduled(job_id, door_left_open.send_notifications)
+        mt.assert_job_scheduled(door_left_open.get_job_id(door.id), run_escalation_step)
+
+
+def test_notifications_escalate(mt: MaestroTest) -> None:
+    job_id = door_left_open.get_job_id(test_door.id)
+    with mt.mock_datetime_as(OPENED_AT):
+        mt.trigger_state_change(test_door, new=ON)
+    mt.assert_job_scheduled(job_id, run_escalation_step, OPENED_AT + timedelta(minutes=10))
+
+    # Each step notifies and re-arms the same job for the next one
+    for step, next_step in zip(
+        door_left_open.NOTIFICATION_TIMES, door_left_open.NOTIFICATION_TIMES[1:], strict=False
+    ):
+        job = mt.get_scheduled_job(job_id)
+        with mt.mock_datetime_as(OPENED_AT + step):
+            job.func(**job.kwargs)
+        mt.assert_job_scheduled(job_id, run_escalation_step, OPENED_AT + next_step)
+        assert len(mt.get_scheduled_jobs()) == 1
+
+    notifs = [
+        call
+        for call in mt.get_action_calls(Domain.NOTIFY, person.marshall.notify_action_name)
+        if "has been open" in call.kwargs["message"]
+    ]
+    assert len(notifs) == len(door_left_open.NOTIFICATION_TIMES) - 1
+    assert "open for 1 hour" in notifs[-1].kwargs["message"]
 
 
 def test_send_notifications(mt: MaestroTest) -> None:
@@ -35,25 +62,37 @@ def test_door_closed_cancel_notifs(mt: MaestroTest) -> None:
     # Exterior door jobs are cancelled when door closes
     mt.trigger_state_change(test_door, new=ON)
     mt.trigger_state_change(test_door, new=OFF)
-    for time in door_left_open.NOTIFICATION_TIMES:
-        job_id = door_left_open.get_job_id(test_door.id, time)
-        mt.assert_job_not_scheduled(job_id)
+    mt.assert_job_not_scheduled(door_left_open.get_job_id(test_door.id))
 
     # Garage door jobs are cancelled when door closes
     mt.trigger_state_change(cover.west_stall, new="open")
     mt.trigger_state_change(cover.west_stall, new="closed")
-    for time in door_left_open.NOTIFICATION_TIMES:
-        job_id = door_left_open.get_job_id(cover.west_stall.id, time)
-        mt.assert_job_not_scheduled(job_id)
+    mt.assert_job_not_scheduled(door_left_open.get_job_id(cover.west_stall.id))
+
+
+def test_door_flapping_scheduler_writes(mt: MaestroTest) -> None:
+    """Micro-benchmark: each open/close costs one job write and one removal, down from 4 of each"""
+    job_scheduler = mt.job_scheduler
+    with (
+        patch.object(job_scheduler, "add_job", wraps=job_scheduler.add_job) as add_job,
+        patch.object(job_scheduler, "remove_job", wraps=job_scheduler.remove_job) as remove_job,
+    ):
+        for _ in range(FLAP_COUNT):
+            mt.trigger_state_change(test_door, new=ON)
+            mt.trigger_state_change(test_door, new=OFF)
+
+    assert add_job.call_count == FLAP_COUNT
+    assert remove_job.call_count == FLAP_COUNT
+    assert mt.get_scheduled_jobs() == []
 
 
 def test_silence_notif_action_called(mt: MaestroTest) -> None:
-    job_id = door_left_open.get_job_id(test_door.id, door_left_open.NOTIFICATION_TIMES[0])
+    job_id = door_left_open.get_job_id(test_door.id)
     action = door_left_open.SILENCE_NOTIF_ACTION_ID
     action_data = {"entity_id": test_door.id}
 
     # Job is scheduled and then cancelled by silence notif action
     mt.trigger_state_change(test_door, new=ON)
-    mt.assert_job_scheduled(job_id, door_left_open.send_notifications)
+    mt.assert_job_scheduled(job_id, run_escalation_step)
     mt.trigger_notif_action(action, action_data)
     mt.assert_job_not_scheduled(job_id)
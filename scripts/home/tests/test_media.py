@@ -1,8 +1,12 @@
+from typing import Any
+from unittest.mock import patch
+
 from maestro.domains import MediaPlayer
 from maestro.integrations import Domain
 from maestro.testing import MaestroTest
+from maestro.utils import JobScheduler
 
-from custom_domains.sonos_speaker import SonosSpeaker
+from custom_domains.sonos_speaker import SonosSpeaker, SpeakerAction
 from registry import media_player
 
 from .. import media
@@ -33,24 +37,72 @@ def test_reset_speakers(mt: MaestroTest) -> None:
     for speaker in speakers_and_tv:
         mt.assert_action_called(Domain.MEDIA_PLAYER, "volume_set", speaker.id)
 
+    # Matching calls are merged: one pause, one unmute and one volume_set per distinct level
+    assert len(mt.get_action_calls(Domain.MEDIA_PLAYER, "media_pause")) == 1
+    assert len(mt.get_action_calls(Domain.MEDIA_PLAYER, "volume_mute")) == 1
+    assert len(mt.get_action_calls(Domain.MEDIA_PLAYER, "volume_set")) == 5
+    mt.assert_action_called(
+        Domain.MEDIA_PLAYER, "volume_set", media_player.office.id, volume_level=0.35
+    )
+
+
+def test_perform_bulk_reports_failures(mt: MaestroTest) -> None:
+    hass_client = test_speaker.state_manager.hass_client
+    perform_action = hass_client.perform_action
+
+    def fail_joins(**kwargs: Any) -> Any:
+        if kwargs["action"] == "join":
+            raise ConnectionError
+        return perform_action(**kwargs)
+
+    main_speaker_ids = [speaker.id for speaker in media.MAIN_SPEAKERS]
+    with patch.object(hass_client, "perform_action", side_effect=fail_joins):
+        report = SonosSpeaker.perform_bulk(
+            [
+                SpeakerAction(test_speaker, "join", {"group_members": main_speaker_ids}),
+                *(SpeakerAction(speaker, "media_pause") for speaker in media.MAIN_SPEAKERS),
+            ]
+        )
+
+    # A failed call doesn't stop the others, and each call is reported with its latency
+    assert [(result.action, result.ok) for result in report.results] == [
+        ("join", False),
+        ("media_pause", True),
+    ]
+    assert report.results[1].entity_ids == main_speaker_ids
+    assert all(result.latency_seconds >= 0 for result in report.results)
+    assert isinstance(report.failures[0].error, ConnectionError)
+
+
+def run_grouping_job(mt: MaestroTest) -> None:
+    job = mt.get_scheduled_job(media.GROUP_SPEAKERS_JOB_ID)
+    JobScheduler().cancel_job(media.GROUP_SPEAKERS_JOB_ID)
+    job.func(**job.kwargs)
+
 
 def test_group_speakers(mt: MaestroTest) -> None:
     main_speaker_ids = [speaker.id for speaker in media.MAIN_SPEAKERS]
+    stats_before = media.grouping_stats()
+
     # Nothing happens if all speakers are grouped
     mt.trigger_state_change(
         test_speaker,
         new="playing",
         new_attributes={"group_members": main_speaker_ids},
     )
+    mt.assert_job_not_scheduled(media.GROUP_SPEAKERS_JOB_ID)
+
+    # Speakers starting together are grouped once, to the first speaker that started
+    for speaker in media.MAIN_SPEAKERS:
+        mt.trigger_state_change(speaker, new="playing", new_attributes={"group_members": []})
+    mt.assert_job_scheduled(media.GROUP_SPEAKERS_JOB_ID, media.apply_speaker_grouping)
+    assert mt.get_scheduled_job(media.GROUP_SPEAKERS_JOB_ID).kwargs == {
+        "coordinator_id": test_speaker.id
+    }
     mt.assert_action_not_called(Domain.MEDIA_PLAYER, "join")
 
-    # Speakers group to target if none are grouped
-    mt.trigger_state_change(
-        test_speaker,
-        new="playing",
-        new_attributes={"group_members": []},
-    )
-    mt.assert_action_called(Domain.MEDIA_PLAYER, "join", test_speaker.id)
+    run_grouping_job(mt)
+    mt.assert_action_called(Domain.MEDIA_PLAYER, "join", test_speaker.id, call_count=1)
 
     # Speakers group to target if some are grouped
     mt.trigger_state_change(
@@ -58,4 +110,18 @@ def test_group_speakers(mt: MaestroTest) -> None:
         new="playing",
         new_attributes={"group_members": main_speaker_ids[1:]},
     )
-    mt.assert_action_called(Domain.MEDIA_PLAYER, "join", test_speaker.id)
+    run_grouping_job(mt)
+    mt.assert_action_called(Domain.MEDIA_PLAYER, "join", test_speaker.id, call_count=2)
+
+    # No join is sent if the speakers have grouped by the time the burst settles
+    mt.trigger_state_change(test_speaker, new="playing", new_attributes={"group_members": []})
+    mt.set_state(test_speaker, "playing", {"group_members": main_speaker_ids})
+    run_grouping_job(mt)
+    mt.assert_action_called(Domain.MEDIA_PLAYER, "join", call_count=2)
+
+    stats = media.grouping_stats()
+    assert {key: stats[key] - stats_before[key] for key in stats} == {
+        "joins": 2,
+        "debounced": 2,
+        "redundant_joins_suppressed": 2,
+    }
@@ -0,0 +1,93 @@
+from dataclasses import dataclass
+from datetime import date
+
+from maestro import db
+
+from .models import ZoneDwellRollup
+from .rollups import (
+    DWELL_BUCKET_BOUNDS,
+    RollupPeriod,
+    ensure_rollup_table,
+    get_period_start_date,
+)
+
+
+@dataclass(frozen=True)
+class DwellSummary:
+    total_seconds: int
+    visit_count: int
+    histogram: tuple[int, ...]
+
+    @property
+    def total_hours(self) -> float:
+        return self.total_seconds / 3600
+
+    def percentile(self, percent: float) -> int | None:
+        """Approximate dwell time at `percent` (0-100) as the upper bound of its histogram bucket"""
+        if self.visit_count == 0:
+            return None
+
+        rank = max(1, round(self.visit_count * percent / 100))
+        seen = 0
+        for bucket, count in enumerate(self.histogram):
+            seen += count
+            if seen >= rank:
+                return DWELL_BUCKET_BOUNDS[min(bucket, len(DWELL_BUCKET_BOUNDS) - 1)]
+
+        return DWELL_BUCKET_BOUNDS[-1]
+
+
+def get_dwell_summary(
+    person_id: str,
+    zone_name: str,
+    start: date,
+    end: date,
+    period: RollupPeriod = RollupPeriod.DAY,
+) -> DwellSummary:
+    """
+    Summarize time spent in a zone across every period overlapping `start` to `end`
+    (inclusive), and the visits that arrived in those periods. Reads one rollup row per
+    period, so cost is independent of how much history exists.
+    """
+    ensure_rollup_table()
+    rollups = (
+        db.session.query(
+            ZoneDwellRollup.total_seconds, ZoneDwellRollup.visit_count, ZoneDwellRollup.histogram
+        )
+        .filter(
+            ZoneDwellRollup.person == person_id,
+            ZoneDwellRollup.zone_name == zone_name,
+            ZoneDwellRollup.period == period,
+            ZoneDwellRollup.period_start.between(get_period_start_date(period, start), end),
+        )
+        .all()
+    )
+
+    histogram = [0] * (len(DWELL_BUCKET_BOUNDS) + 1)
+    for rollup in rollups:
+        for bucket, count in enumerate(rollup.histogram):
+            histogram[bucket] += count
+
+    return DwellSummary(
+        total_seconds=sum(rollup.total_seconds for rollup in rollups),
+        visit_count=sum(rollup.visit_count for rollup in rollups),
+        histogram=tuple(histogram),
+    )
+
+
+def get_total_seconds(person_id: str, zone_name: str, start: date, end: date) -> int:
+    return get_dwell_summary(person_id, zone_name, start, end).total_seconds
+
+
+def get_visit_count(person_id: str, zone_name: str, start: date, end: date) -> int:
+    return get_dwell_summary(person_id, zone_name, start, end).visit_count
+
+
+def get_dwell_percentile(
+    person_id: str,
+    zone_name: str,
+    start: date,
+    end: date,
+    percent: float,
+) -> int | None:
+    return get_dwell_summary(person_id, zone_name, start, end).percentile(percent)
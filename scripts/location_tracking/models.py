@@ -7,7 +7,10 @@ from scripts.common.db_types import TZDateTime
 
 class ZoneChange(db.Model):  # type:ignore [name-defined]
     __tablename__ = "zone_change"
-    __table_args__: ClassVar = {"extend_existing": True}
+    __table_args__: ClassVar = (
+        db.Index("ix_zone_change_arrived_at", "arrived_at"),
+        {"extend_existing": True},
+    )
 
     person = db.Column(db.String, primary_key=True, nullable=False)
     arrived_at = db.Column(TZDateTime, primary_key=True, nullable=False)
@@ -16,3 +19,37 @@ class ZoneChange(db.Model):  # type:ignore [name-defined]
 
     def __repr__(self) -> str:
         return f"<ZoneChange(person={self.person}, zone_name={self.zone_name})>"
+
+
+class ZoneChangeArchive(db.Model):  # type:ignore [name-defined]
+    """Zone changes moved out of `zone_change` by retention. Partitioned by year on Postgres"""
+
+    __tablename__ = "zone_change_archive"
+    __table_args__: ClassVar = {"extend_existing": True}
+
+    person = db.Column(db.String, primary_key=True, nullable=False)
+    arrived_at = db.Column(TZDateTime, primary_key=True, nullable=False)
+    zone_name = db.Column(db.String, nullable=False)
+    duration_seconds = db.Column(db.Integer, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<ZoneChangeArchive(person={self.person}, zone_name={self.zone_name})>"
+
+
+class ZoneDwellRollup(db.Model):  # type:ignore [name-defined]
+    __tablename__ = "zone_dwell_rollup"
+    __table_args__: ClassVar = {"extend_existing": True}
+
+    person = db.Column(db.String, primary_key=True, nullable=False)
+    zone_name = db.Column(db.String, primary_key=True, nullable=False)
+    period = db.Column(db.String, primary_key=True, nullable=False)
+    period_start = db.Column(db.Date, primary_key=True, nullable=False)
+    total_seconds = db.Column(db.Integer, nullable=False, default=0)
+    visit_count = db.Column(db.Integer, nullable=False, default=0)
+    histogram = db.Column(db.JSON, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<ZoneDwellRollup(person={self.person}, zone_name={self.zone_name}, "
+            f"period={self.period}, period_start={self.period_start})>"
+        )
@@ -1,10 +1,22 @@
+import json
+from dataclasses import dataclass
 from datetime import datetime
 
 from maestro.domains import Person
+from maestro.integrations import StateManager
 from maestro.utils import IntervalSeconds
 
 LAST_LEFT_HOME_KEY_PREFIX = "LAST_LEFT_HOME"
 PREV_ARRIVAL_KEY_PREFIX = "PREV_ZONE_ARRIVAL"
+OPEN_ZONE_CHANGE_KEY_PREFIX = "OPEN_ZONE_CHANGE"
+
+
+@dataclass(frozen=True)
+class OpenZoneChange:
+    """Primary key and zone of a person's latest ZoneChange row, which has no duration yet"""
+
+    arrived_at: datetime
+    zone_name: str
 
 
 def get_last_left_home(person: Person) -> datetime | None:
@@ -45,3 +57,31 @@ def set_last_zone_arrival(person: Person, value: datetime) -> None:
         value=value.isoformat(),
         ttl_seconds=IntervalSeconds.TWO_WEEKS,
     )
+
+
+def get_open_zone_change(person_id: str) -> OpenZoneChange | None:
+    redis = StateManager().redis_client
+    open_zone_change_key = redis.build_key(OPEN_ZONE_CHANGE_KEY_PREFIX, person_id)
+
+    cached = redis.get(key=open_zone_change_key)
+    if not cached:
+        return None
+
+    data = json.loads(cached)
+    return OpenZoneChange(
+        arrived_at=datetime.fromisoformat(data["arrived_at"]),
+        zone_name=data["zone_name"],
+    )
+
+
+def set_open_zone_change(person_id: str, value: OpenZoneChange) -> None:
+    redis = StateManager().redis_client
+    open_zone_change_key = redis.build_key(OPEN_ZONE_CHANGE_KEY_PREFIX, person_id)
+
+    redis.set(
+        key=open_zone_change_key,
+        value=json.dumps(
+            {"arrived_at": value.arrived_at.isoformat(), "zone_name": value.zone_name}
+        ),
+        ttl_seconds=IntervalSeconds.TWO_WEEKS,
+    )
@@ -0,0 +1,168 @@
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Any, cast
+
+from maestro import db
+from maestro.triggers import cron_trigger
+from maestro.utils import local_now, log
+from sqlalchemy import CursorResult, delete, func, insert, select, text
+
+from custom_domains import ZoneExtended
+
+from .models import ZoneChange, ZoneChangeArchive
+
+REGION_RETENTION = timedelta(days=90)
+REGION_MIN_DWELL_SECONDS = 30 * 60
+ARCHIVE_AFTER = timedelta(days=730)
+
+ZONE_CHANGE_COLUMNS = ("person", "arrived_at", "zone_name", "duration_seconds")
+
+
+@dataclass(frozen=True)
+class RetentionReport:
+    regions_downsampled: int
+    rows_archived: int
+    # How much the files on disk shrank. Usually 0 on Postgres, where VACUUM leaves freed
+    # space in the table for reuse and only truncates empty pages at its end
+    disk_bytes_freed: int
+
+    @property
+    def rows_pruned(self) -> int:
+        return self.regions_downsampled + self.rows_archived
+
+
+@cron_trigger(hour=5, minute=15)
+def daily_zone_change_retention() -> None:
+    run_retention()
+
+
+def run_retention(now: datetime | None = None) -> RetentionReport:
+    """
+    Keep `zone_change` small enough that latest-row and rollup queries stay fast:
+    drop brief region-level pass-throughs after REGION_RETENTION and move everything
+    older than ARCHIVE_AFTER into `zone_change_archive`. Only closed rows are touched.
+    """
+    now = now or local_now()
+    ensure_schema()
+    size_before = get_zone_change_bytes()
+
+    regions_downsampled = downsample_regions(before=now - REGION_RETENTION)
+    rows_archived = archive_zone_changes(before=now - ARCHIVE_AFTER)
+    db.session.commit()
+
+    if regions_downsampled or rows_archived:
+        compact()
+
+    report = RetentionReport(
+        regions_downsampled=regions_downsampled,
+        rows_archived=rows_archived,
+        disk_bytes_freed=max(0, size_before - get_zone_change_bytes()),
+    )
+    log.info("Zone change retention complete", rows_pruned=report.rows_pruned, **asdict(report))
+
+    return report
+
+
+def is_region_zone(zone_name: str) -> bool:
+    return bool(ZoneExtended.get_zone_metadata(zone_name).region)
+
+
+def downsample_regions(before: datetime) -> int:
+    """Delete brief region-level rows older than `before`. Rollups keep their totals"""
+    zone_names = db.session.scalars(
+        select(ZoneChange.zone_name).where(ZoneChange.arrived_at < before).distinct()
+    ).all()
+    region_names = [zone_name for zone_name in zone_names if is_region_zone(zone_name)]
+
+    if not region_names:
+        return 0
+
+    result = cast(
+        CursorResult[Any],
+        db.session.execute(
+            delete(ZoneChange).where(
+                ZoneChange.arrived_at < before,
+                ZoneChange.zone_name.in_(region_names),
+                ZoneChange.duration_seconds < REGION_MIN_DWELL_SECONDS,
+            )
+        ),
+    )
+    return result.rowcount
+
+
+def archive_zone_changes(before: datetime) -> int:
+    """Move closed rows older than `before` into the archive table"""
+    archivable = (ZoneChange.arrived_at < before, ZoneChange.duration_seconds.is_not(None))
+
+    oldest = db.session.scalar(select(func.min(ZoneChange.arrived_at)).where(*archivable))
+    if oldest is None:
+        return 0
+
+    if is_postgres():
+        for year in range(oldest.year, before.year + 1):
+            ensure_archive_partition(year)
+
+    db.session.execute(
+        insert(ZoneChangeArchive).from_select(
+            ZONE_CHANGE_COLUMNS,
+            select(*(getattr(ZoneChange, column) for column in ZONE_CHANGE_COLUMNS)).where(
+                *archivable
+            ),
+        )
+    )
+    result = cast(CursorResult[Any], db.session.execute(delete(ZoneChange).where(*archivable)))
+    return result.rowcount
+
+
+def ensure_schema() -> None:
+    """Create the arrived_at index and the archive table if they don't exist yet"""
+    for index in ZoneChange.__table__.indexes:
+        index.create(bind=db.engine, checkfirst=True)
+
+    if is_postgres():
+        db.session.execute(
+            text(
+                "CREATE TABLE IF NOT EXISTS zone_change_archive "
+                "(LIKE zone_change INCLUDING DEFAULTS INCLUDING INDEXES) "
+                "PARTITION BY RANGE (arrived_at)"
+            )
+        )
+        db.session.commit()
+    else:
+        ZoneChangeArchive.__table__.create(bind=db.engine, checkfirst=True)
+
+
+def ensure_archive_partition(year: int) -> None:
+    db.session.execute(
+        text(
+            f"CREATE TABLE IF NOT EXISTS zone_change_archive_{year} "
+            f"PARTITION OF zone_change_archive "
+            f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"
+        )
+    )
+
+
+def get_zone_change_bytes() -> int:
+    """On-disk size of `zone_change` on Postgres, or of the whole database file on SQLite"""
+    if is_postgres():
+        return int(db.session.scalar(text("SELECT pg_total_relation_size('zone_change')")) or 0)
+
+    page_count = db.session.scalar(text("PRAGMA page_count")) or 0
+    page_size = db.session.scalar(text("PRAGMA page_size")) or 0
+    return int(page_count * page_size)
+
+
+def compact() -> None:
+    """
+    Vacuum after pruning. SQLite rebuilds the file and returns freed pages to the filesystem.
+    Postgres marks the pruned rows' space as reusable, so the table stops growing until it
+    is refilled, without shrinking it. VACUUM can't run inside a transaction.
+    """
+    statement = "VACUUM zone_change" if is_postgres() else "VACUUM"
+
+    with db.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text(statement))
+
+
+def is_postgres() -> bool:
+    return db.engine.dialect.name == "postgresql"
@@ -0,0 +1,193 @@
+from bisect import bisect_left
+from collections.abc import Iterator
+from datetime import UTC, date, datetime, time, timedelta
+from enum import StrEnum
+from functools import cache
+
+from maestro import db, get_config
+from maestro.utils import local_now, log
+
+from .models import ZoneChange, ZoneDwellRollup
+from .retention import REGION_RETENTION
+
+# Upper bounds (seconds) of the dwell histogram buckets, plus one overflow bucket past the last
+DWELL_BUCKET_BOUNDS = (60, 300, 900, 1800, 3600, 7200, 14400, 28800, 57600, 86400, 604800)
+BACKFILL_BATCH_SIZE = 1000
+
+type RollupKey = tuple[str, str, RollupPeriod, date]
+
+
+class RollupPeriod(StrEnum):
+    DAY = "day"
+    WEEK = "week"
+
+
+PERIOD_LENGTHS = {RollupPeriod.DAY: timedelta(days=1), RollupPeriod.WEEK: timedelta(days=7)}
+
+
+def get_period_start(period: RollupPeriod, timestamp: datetime) -> date:
+    """Local date that the rollup period containing `timestamp` starts on (weeks start Monday)"""
+    return get_period_start_date(period, timestamp.astimezone(get_config().timezone).date())
+
+
+def get_period_start_date(period: RollupPeriod, local_date: date) -> date:
+    if period == RollupPeriod.WEEK:
+        return local_date - timedelta(days=local_date.weekday())
+
+    return local_date
+
+
+def split_dwell(
+    period: RollupPeriod, arrived_at: datetime, duration_seconds: int
+) -> dict[date, int]:
+    """Seconds of a visit that fall in each period it spans, split at local midnight"""
+    timezone = get_config().timezone
+    # Step in UTC so that DST transitions don't add or drop an hour
+    cursor = arrived_at.astimezone(UTC)
+    remaining = duration_seconds
+    split = {get_period_start(period, arrived_at): 0}
+
+    while remaining > 0:
+        period_start = get_period_start(period, cursor)
+        period_end = datetime.combine(
+            period_start + PERIOD_LENGTHS[period], time(), tzinfo=timezone
+        )
+        seconds = min(remaining, max(1, int((period_end - cursor).total_seconds())))
+        split[period_start] = split.get(period_start, 0) + seconds
+        remaining -= seconds
+        cursor = period_end.astimezone(UTC)
+
+    return split
+
+
+def get_dwell_bucket(duration_seconds: int) -> int:
+    return bisect_left(DWELL_BUCKET_BOUNDS, duration_seconds)
+
+
+@cache
+def ensure_rollup_table() -> None:
+    """
+    Create the rollup table the first time this process needs it. This runs on the session's
+    connection so it doesn't wait on the session's own uncommitted writes.
+    """
+    ZoneDwellRollup.__table__.create(bind=db.session.connection(), checkfirst=True)
+
+
+def record_dwell(
+    person_id: str, zone_name: str, arrived_at: datetime, duration_seconds: int
+) -> None:
+    """
+    Add a closed zone visit to its daily and weekly rollups. The caller commits.
+    Runs in a savepoint and logs any failure, so the caller's zone change is never lost.
+    """
+    try:
+        with db.session.begin_nested():
+            ensure_rollup_table()
+            for key, seconds, visit_duration in get_dwell_contributions(
+                person_id, zone_name, arrived_at, duration_seconds
+            ):
+                rollup = db.session.get(ZoneDwellRollup, key)
+                if rollup is None:
+                    rollup = _new_rollup(key)
+                    db.session.add(rollup)
+
+                _add_dwell(rollup, seconds, visit_duration)
+    except Exception:
+        # The table may have been created in the savepoint that was just rolled back
+        ensure_rollup_table.cache_clear()
+        log.exception("Failed to record zone dwell", person=person_id, zone_name=zone_name)
+
+
+def get_dwell_contributions(
+    person_id: str, zone_name: str, arrived_at: datetime, duration_seconds: int
+) -> Iterator[tuple[RollupKey, int, int | None]]:
+    """
+    Rollup rows a visit touches, with the seconds it spent in each. Time is split across
+    every period the visit spans, while the visit itself (count and histogram) belongs to the
+    period it arrived in, which is the only row given its duration.
+    """
+    for period in RollupPeriod:
+        arrival_start = get_period_start(period, arrived_at)
+        for period_start, seconds in split_dwell(period, arrived_at, duration_seconds).items():
+            visit_duration = duration_seconds if period_start == arrival_start else None
+            yield (person_id, zone_name, period, period_start), seconds, visit_duration
+
+
+def backfill_rollups(now: datetime | None = None) -> int:
+    """
+    Rebuild rollups from ZoneChange history in one streaming pass. Returns visits counted.
+    Only periods from the week before REGION_RETENTION onward are rebuilt, since retention has
+    since dropped or archived older rows and those rollups are the only complete record left.
+    """
+    now = now or local_now()
+    rebuild_from = get_period_start(RollupPeriod.WEEK, now - REGION_RETENTION)
+    ensure_rollup_table()
+    rollups: dict[RollupKey, ZoneDwellRollup] = {}
+    visit_count = 0
+
+    closed_zone_changes = (
+        db.session.query(
+            ZoneChange.person,
+            ZoneChange.zone_name,
+            ZoneChange.arrived_at,
+            ZoneChange.duration_seconds,
+        )
+        .filter(ZoneChange.duration_seconds.is_not(None))
+        .yield_per(BACKFILL_BATCH_SIZE)
+    )
+
+    for zone_change in closed_zone_changes:
+        counted = False
+        for key, seconds, visit_duration in get_dwell_contributions(
+            zone_change.person,
+            zone_change.zone_name,
+            zone_change.arrived_at,
+            zone_change.duration_seconds,
+        ):
+            if key[3] < rebuild_from:
+                continue
+
+            if (rollup := rollups.get(key)) is None:
+                rollup = rollups[key] = _new_rollup(key)
+
+            _add_dwell(rollup, seconds, visit_duration)
+            counted = counted or visit_duration is not None
+        visit_count += counted
+
+    db.session.query(ZoneDwellRollup).filter(ZoneDwellRollup.period_start >= rebuild_from).delete()
+    db.session.add_all(rollups.values())
+    db.session.commit()
+
+    log.info(
+        "Rebuilt zone dwell rollups",
+        since=rebuild_from,
+        visits=visit_count,
+        rollups=len(rollups),
+    )
+    return visit_count
+
+
+def _new_rollup(key: RollupKey) -> ZoneDwellRollup:
+    person_id, zone_name, period, period_start = key
+
+    return ZoneDwellRollup(
+        person=person_id,
+        zone_name=zone_name,
+        period=period,
+        period_start=period_start,
+        total_seconds=0,
+        visit_count=0,
+        histogram=[0] * (len(DWELL_BUCKET_BOUNDS) + 1),
+    )
+
+
+def _add_dwell(rollup: ZoneDwellRollup, seconds: int, visit_duration: int | None) -> None:
+    rollup.total_seconds += seconds
+    if visit_duration is None:
+        return
+
+    histogram = list(rollup.histogram)
+    histogram[get_dwell_bucket(visit_duration)] += 1
+
+    rollup.visit_count += 1
+    rollup.histogram = histogram
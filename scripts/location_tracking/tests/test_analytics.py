@@ -0,0 +1,64 @@
+from datetime import timedelta
+
+from maestro.testing import MaestroTest
+from maestro.utils import local_now
+
+from registry import person
+
+from .. import analytics
+from ..rollups import RollupPeriod, get_period_start
+
+test_person = person.marshall
+
+
+def test_get_dwell_summary(mt: MaestroTest) -> None:
+    day_start = local_now().replace(hour=0, minute=0, second=0, microsecond=0)
+    today = day_start.date()
+
+    # No rollups yields an empty summary
+    empty = analytics.get_dwell_summary(test_person.id, "Office", today, today)
+    assert empty.visit_count == 0
+    assert empty.percentile(50) is None
+
+    # Short, medium and long office visits
+    for hours, zone_name in (
+        (1, "Office"),
+        (1.25, "home"),
+        (2, "Office"),
+        (4, "home"),
+        (6, "Office"),
+        (15, "home"),
+    ):
+        mt.trigger_state_change(
+            test_person, new=zone_name, time_fired=day_start + timedelta(hours=hours)
+        )
+
+    summary = analytics.get_dwell_summary(test_person.id, "Office", today, today)
+    assert summary.visit_count == 3
+    assert summary.total_hours == 0.25 + 2 + 9
+    assert (
+        analytics.get_total_seconds(test_person.id, "Office", today, today) == summary.total_seconds
+    )
+    assert analytics.get_visit_count(test_person.id, "Office", today, today) == 3
+
+    # Percentiles resolve to histogram bucket upper bounds
+    assert analytics.get_dwell_percentile(test_person.id, "Office", today, today, 0) == 900
+    assert summary.percentile(50) == 7200
+    assert summary.percentile(100) == 57600
+
+    # Weekly rollups agree with daily rollups
+    week_start = get_period_start(RollupPeriod.WEEK, day_start)
+    weekly = analytics.get_dwell_summary(
+        test_person.id, "Office", week_start, week_start, RollupPeriod.WEEK
+    )
+    assert weekly == summary
+
+    # A range starting mid-week still includes that week
+    assert (
+        analytics.get_dwell_summary(test_person.id, "Office", today, today, RollupPeriod.WEEK)
+        == summary
+    )
+
+    # Other ranges are excluded
+    yesterday = today - timedelta(days=1)
+    assert analytics.get_visit_count(test_person.id, "Office", yesterday, yesterday) == 0
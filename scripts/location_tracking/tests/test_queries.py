@@ -58,3 +58,16 @@ def test_last_zone_arrival(mt: MaestroTest) -> None:
     queries.set_last_zone_arrival(person.emily, emily_time)
     assert queries.get_last_zone_arrival(test_person) == later
     assert queries.get_last_zone_arrival(person.emily) == emily_time
+
+
+def test_open_zone_change(mt: MaestroTest) -> None:
+    # Fetching when there's no stored value returns None
+    assert queries.get_open_zone_change(test_person.id) is None
+
+    # Stored value round trips through redis
+    open_zone_change = queries.OpenZoneChange(arrived_at=local_now(), zone_name="Target")
+    queries.set_open_zone_change(test_person.id, open_zone_change)
+    assert queries.get_open_zone_change(test_person.id) == open_zone_change
+
+    # Different people have independent values
+    assert queries.get_open_zone_change(person.emily.id) is None
@@ -0,0 +1,67 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from maestro import db
+from maestro.testing import MaestroTest
+from maestro.utils import local_now
+
+from registry import person
+
+from .. import retention
+from ..models import ZoneChange, ZoneChangeArchive
+
+test_person = person.marshall
+test_region_name = "Grand Rapids"
+
+
+def add_zone_change(days_ago: int, zone_name: str, duration_seconds: int | None) -> None:
+    db.session.add(
+        ZoneChange(
+            person=test_person.id,
+            arrived_at=local_now() - timedelta(days=days_ago),
+            zone_name=zone_name,
+            duration_seconds=duration_seconds,
+        )
+    )
+
+
+def test_run_retention(mt: MaestroTest) -> None:
+    add_zone_change(days_ago=900, zone_name="Target", duration_seconds=600)
+    add_zone_change(days_ago=800, zone_name=test_region_name, duration_seconds=300)
+    add_zone_change(days_ago=120, zone_name=test_region_name, duration_seconds=300)
+    add_zone_change(days_ago=110, zone_name=test_region_name, duration_seconds=7200)
+    add_zone_change(days_ago=100, zone_name="Target", duration_seconds=300)
+    add_zone_change(days_ago=10, zone_name=test_region_name, duration_seconds=300)
+    add_zone_change(days_ago=0, zone_name="home", duration_seconds=None)
+    db.session.commit()
+
+    with patch.object(
+        retention, "is_region_zone", side_effect=lambda name: name == test_region_name
+    ):
+        report = retention.run_retention()
+
+    # Brief old region stays are dropped and rows past the archive cutoff are moved
+    assert report.regions_downsampled == 2
+    assert report.rows_archived == 1
+    assert report.rows_pruned == 3
+    assert report.disk_bytes_freed >= 0
+
+    archived = db.session.query(ZoneChangeArchive).all()
+    assert [row.zone_name for row in archived] == ["Target"]
+    assert archived[0].duration_seconds == 600
+
+    # Long region stays, recent rows and the open row are kept
+    remaining = db.session.query(ZoneChange).order_by(ZoneChange.arrived_at.asc()).all()
+    assert [(row.zone_name, row.duration_seconds) for row in remaining] == [
+        (test_region_name, 7200),
+        ("Target", 300),
+        (test_region_name, 300),
+        ("home", None),
+    ]
+
+    # A second run has nothing left to do
+    with patch.object(
+        retention, "is_region_zone", side_effect=lambda name: name == test_region_name
+    ):
+        report = retention.run_retention()
+    assert report.rows_pruned == 0
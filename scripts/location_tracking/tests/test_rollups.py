@@ -0,0 +1,159 @@
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+
+from maestro import db, get_config
+from maestro.testing import MaestroTest
+from maestro.utils import local_now
+
+from registry import person
+
+from .. import rollups
+from ..models import ZoneChange, ZoneDwellRollup
+from ..retention import REGION_RETENTION
+from ..rollups import RollupPeriod
+
+test_person = person.marshall
+
+
+def test_get_period_start() -> None:
+    # Days start at local midnight and weeks start on Monday
+    now = local_now()
+    assert rollups.get_period_start(RollupPeriod.DAY, now) == now.date()
+    week_start = rollups.get_period_start(RollupPeriod.WEEK, now)
+    assert week_start.weekday() == 0
+    assert 0 <= (now.date() - week_start).days < 7
+
+
+def test_rollups_updated_on_zone_change(mt: MaestroTest) -> None:
+    day_start = local_now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+    # Two office visits and a trip home, each closed by the next arrival
+    for hours, zone_name in ((8, "Office"), (12, "home"), (13, "Office"), (17, "home")):
+        mt.trigger_state_change(
+            test_person, new=zone_name, time_fired=day_start + timedelta(hours=hours)
+        )
+
+    daily = db.session.get(
+        ZoneDwellRollup, (test_person.id, "Office", RollupPeriod.DAY, day_start.date())
+    )
+    assert daily is not None
+    assert daily.visit_count == 2
+    assert daily.total_seconds == 8 * 3600
+    assert sum(daily.histogram) == 2
+
+    weekly = db.session.get(
+        ZoneDwellRollup,
+        (
+            test_person.id,
+            "Office",
+            RollupPeriod.WEEK,
+            rollups.get_period_start(RollupPeriod.WEEK, day_start),
+        ),
+    )
+    assert weekly is not None
+    assert weekly.total_seconds == daily.total_seconds
+
+    # The still-open visit home is not rolled up yet
+    home = db.session.get(
+        ZoneDwellRollup, (test_person.id, "home", RollupPeriod.DAY, day_start.date())
+    )
+    assert home is not None
+    assert home.visit_count == 1
+
+
+def test_overnight_visit_split(mt: MaestroTest) -> None:
+    # Sunday night into Monday morning crosses both a day and a week boundary
+    arrived_at = datetime(2026, 3, 1, 22, tzinfo=get_config().timezone)
+    mt.trigger_state_change(test_person, new="Office", time_fired=arrived_at)
+    mt.trigger_state_change(test_person, new="home", time_fired=arrived_at + timedelta(hours=8))
+
+    def get_rollup(period: RollupPeriod, period_start: date) -> ZoneDwellRollup:
+        rollup = db.session.get(ZoneDwellRollup, (test_person.id, "Office", period, period_start))
+        assert rollup is not None
+        return rollup
+
+    # Time goes to the day it was spent in, the visit to the day it arrived
+    sunday, monday = date(2026, 3, 1), date(2026, 3, 2)
+    assert get_rollup(RollupPeriod.DAY, sunday).total_seconds == 2 * 3600
+    assert get_rollup(RollupPeriod.DAY, sunday).visit_count == 1
+    assert get_rollup(RollupPeriod.DAY, monday).total_seconds == 6 * 3600
+    assert get_rollup(RollupPeriod.DAY, monday).visit_count == 0
+    assert sum(get_rollup(RollupPeriod.DAY, monday).histogram) == 0
+
+    assert get_rollup(RollupPeriod.WEEK, date(2026, 2, 23)).total_seconds == 2 * 3600
+    assert get_rollup(RollupPeriod.WEEK, monday).total_seconds == 6 * 3600
+
+
+def test_rollup_failure_keeps_zone_change(mt: MaestroTest) -> None:
+    day_start = local_now().replace(hour=0, minute=0, second=0, microsecond=0)
+    mt.trigger_state_change(test_person, new="Office", time_fired=day_start)
+
+    # A failing rollup is logged and skipped rather than rolling back the zone change
+    with patch.object(rollups, "_new_rollup", side_effect=RuntimeError("rollup failed")):
+        mt.trigger_state_change(test_person, new="home", time_fired=day_start + timedelta(hours=1))
+
+    zone_changes = db.session.query(ZoneChange).order_by(ZoneChange.arrived_at).all()
+    assert [zone_change.zone_name for zone_change in zone_changes] == ["Office", "home"]
+    assert zone_changes[0].duration_seconds == 3600
+    assert db.session.query(ZoneDwellRollup).count() == 0
+
+
+def test_rollup_table_created_on_demand(mt: MaestroTest) -> None:
+    ZoneDwellRollup.__table__.drop(bind=db.engine)
+    rollups.ensure_rollup_table.cache_clear()
+
+    day_start = local_now().replace(hour=0, minute=0, second=0, microsecond=0)
+    mt.trigger_state_change(test_person, new="Office", time_fired=day_start)
+    mt.trigger_state_change(test_person, new="home", time_fired=day_start + timedelta(hours=1))
+
+    assert db.session.query(ZoneDwellRollup).count() == 2
+
+
+def test_backfill_rollups(mt: MaestroTest) -> None:
+    day_start = local_now().replace(hour=0, minute=0, second=0, microsecond=0)
+    for hours, zone_name in ((8, "Office"), (12, "home"), (13, "Office"), (17, "home")):
+        mt.trigger_state_change(
+            test_person, new=zone_name, time_fired=day_start + timedelta(hours=hours)
+        )
+    # An overnight stay is split the same way by both paths
+    mt.trigger_state_change(
+        test_person, new="Office", time_fired=day_start + timedelta(days=1, hours=22)
+    )
+    mt.trigger_state_change(
+        test_person, new="home", time_fired=day_start + timedelta(days=2, hours=6)
+    )
+
+    def snapshot() -> dict[tuple, tuple]:
+        return {
+            (r.person, r.zone_name, r.period, r.period_start): (
+                r.total_seconds,
+                r.visit_count,
+                r.histogram,
+            )
+            for r in db.session.query(ZoneDwellRollup).all()
+        }
+
+    incremental = snapshot()
+
+    # Backfill rebuilds the same rollups from history
+    db.session.query(ZoneDwellRollup).delete()
+    db.session.commit()
+    closed_visits = (
+        db.session.query(ZoneChange).filter(ZoneChange.duration_seconds.is_not(None)).count()
+    )
+
+    assert rollups.backfill_rollups() == closed_visits
+    assert snapshot() == incremental
+
+    # Running it again doesn't double count
+    rollups.backfill_rollups()
+    assert snapshot() == incremental
+
+    # Rollups older than the rebuild range outlive the history retention removed
+    old_week = rollups.get_period_start(
+        RollupPeriod.WEEK, local_now() - REGION_RETENTION
+    ) - timedelta(days=7)
+    db.session.add(rollups._new_rollup((test_person.id, "Office", RollupPeriod.WEEK, old_week)))
+    db.session.commit()
+    rollups.backfill_rollups()
+    assert len(snapshot()) == len(incremental) + 1
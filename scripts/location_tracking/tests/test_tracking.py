@@ -1,12 +1,16 @@
+import re
+from collections import Counter
 from datetime import timedelta
+from typing import Any
 
 from maestro import db
 from maestro.testing import MaestroTest
 from maestro.utils import local_now
+from sqlalchemy import event
 
 from registry import person
 
-from .. import tracking
+from .. import queries, tracking
 from ..models import ZoneChange
 
 test_person = person.marshall
@@ -37,6 +41,50 @@ def test_save_zone_change(mt: MaestroTest) -> None:
     assert first_zone_change.duration_seconds is not None
 
 
+def test_save_zone_change_query_count(mt: MaestroTest) -> None:
+    day_start = local_now().replace(hour=0, minute=0, second=0, microsecond=0)
+    day_of_zones = ["home", "Gym", "home", "Office", "Target", "Office", "home", "Grand Rapids"]
+    statements: Counter[str] = Counter()
+
+    def count_zone_change_statements(*args: Any) -> None:
+        statement = args[2]
+        if re.search(r"\bzone_change\b", statement):
+            statements[statement.split()[0].upper()] += 1
+
+    event.listen(db.engine, "before_cursor_execute", count_zone_change_statements)
+    try:
+        for hour, zone_name in enumerate(day_of_zones):
+            mt.trigger_state_change(
+                test_person,
+                new=zone_name,
+                time_fired=day_start + timedelta(hours=hour * 3),
+            )
+    finally:
+        event.remove(db.engine, "before_cursor_execute", count_zone_change_statements)
+
+    # Only the cold start reads from the DB, after that each change is one INSERT and one UPDATE
+    assert statements["SELECT"] == 1
+    assert statements["INSERT"] == len(day_of_zones)
+    assert statements["UPDATE"] == len(day_of_zones) - 1
+
+    # Every row but the latest is closed out with its duration
+    zone_changes = (
+        db.session.query(ZoneChange)
+        .filter(ZoneChange.person == test_person.id)
+        .order_by(ZoneChange.arrived_at.asc())
+        .all()
+    )
+    assert [zone_change.zone_name for zone_change in zone_changes] == day_of_zones
+    assert all(zone_change.duration_seconds == 3 * 3600 for zone_change in zone_changes[:-1])
+    assert zone_changes[-1].duration_seconds is None
+
+    # The cache points at the open row
+    open_zone_change = queries.get_open_zone_change(test_person.id)
+    assert open_zone_change is not None
+    assert open_zone_change.zone_name == day_of_zones[-1]
+    assert open_zone_change.arrived_at == zone_changes[-1].arrived_at
+
+
 def test_update_zone_duration(mt: MaestroTest) -> None:
     # Duration is set correctly on previous zone change
     now = local_now()
@@ -50,7 +98,14 @@ def test_update_zone_duration(mt: MaestroTest) -> None:
     )
     db.session.add(previous_zone_change)
     db.session.commit()
-    tracking.update_zone_duration(previous_zone_change, now)
+    tracking.update_zone_duration(
+        person_id=test_person.id,
+        previous_zone_change=queries.OpenZoneChange(
+            arrived_at=one_hour_ago, zone_name=test_region_name
+        ),
+        departure_time=now,
+    )
+    db.session.refresh(previous_zone_change)
 
     assert previous_zone_change.duration_seconds is not None
     assert previous_zone_change.duration_seconds == 3600
@@ -0,0 +1,102 @@
+from dataclasses import FrozenInstanceError
+from types import ModuleType
+from unittest.mock import patch
+
+import pytest
+from maestro.domains import Zone
+from maestro.integrations import StateManager
+from maestro.testing import MaestroTest
+
+from custom_domains import ZoneExtended
+
+ZONE_COUNT = 300
+
+
+def test_get_zone_metadata(mt: MaestroTest) -> None:
+    ZoneExtended.clear_zone_metadata_memo()
+
+    # Repeat lookups share one resolved object
+    metadata = ZoneExtended.get_zone_metadata("Bench Zone")
+    assert ZoneExtended.get_zone_metadata("Bench Zone") is metadata
+    assert metadata.short_name == "Bench Zone"
+
+    # Shared metadata can't be mutated
+    with pytest.raises(FrozenInstanceError):
+        metadata.short_name = "Changed"  # type: ignore[misc]
+
+    # Copies are mutable and independent of the shared object
+    copied = ZoneExtended.copy_zone_metadata("Bench Zone")
+    copied.short_name = "Changed"
+    assert ZoneExtended.get_zone_metadata("Bench Zone").short_name == "Bench Zone"
+    assert ZoneExtended.copy_zone_metadata("Bench Zone").short_name == "Bench Zone"
+
+
+def build_zone_registry(mt: MaestroTest) -> ModuleType:
+    zone_registry = ModuleType("zone")
+    for i in range(ZONE_COUNT):
+        entity_id = f"zone.bench_{i}"
+        mt.set_state(entity_id, "0", {"friendly_name": f"Bench Zone {i}"})
+        setattr(zone_registry, f"bench_{i}", Zone(entity_id))
+    return zone_registry
+
+
+def linear_resolve_zone(zone_registry: ModuleType, friendly_name: str) -> Zone:
+    for attr_name in dir(zone_registry):
+        attr = getattr(zone_registry, attr_name)
+        if isinstance(attr, Zone) and attr.friendly_name == friendly_name:
+            return attr
+    raise ValueError(friendly_name)
+
+
+def test_resolve_zone_index(mt: MaestroTest) -> None:
+    """Micro-benchmark: the index costs one state read per lookup against a scan of every zone"""
+    zone_registry = build_zone_registry(mt)
+    lookups = [f"Bench Zone {i}" for i in range(ZONE_COUNT - 20, ZONE_COUNT)]
+    ZoneExtended.invalidate_zone_index()
+
+    with (
+        patch.object(ZoneExtended, "_zone_registry", return_value=zone_registry),
+        patch.object(
+            StateManager,
+            "get_attribute_state",
+            autospec=True,
+            side_effect=StateManager.get_attribute_state,
+        ) as state_reads,
+    ):
+        linear = [linear_resolve_zone(zone_registry, name) for name in lookups]
+        linear_reads = state_reads.call_count
+
+        # First lookup builds the index, every later one is a single validating read
+        state_reads.reset_mock()
+        indexed = [ZoneExtended.resolve_zone(name) for name in lookups]
+        assert state_reads.call_count == ZONE_COUNT + len(lookups) - 1
+
+        state_reads.reset_mock()
+        assert [ZoneExtended.resolve_zone(name) for name in lookups] == indexed
+        assert state_reads.call_count == len(lookups)
+        assert state_reads.call_count * 50 < linear_reads
+
+    assert [zone.id for zone in indexed] == [zone.id for zone in linear]
+
+
+def test_resolve_zone_renamed(mt: MaestroTest) -> None:
+    zone_registry = build_zone_registry(mt)
+    ZoneExtended.invalidate_zone_index()
+
+    with patch.object(ZoneExtended, "_zone_registry", return_value=zone_registry):
+        assert ZoneExtended.resolve_zone("Bench Zone 5").id == "zone.bench_5"
+
+        # Renaming a zone rebuilds the index under the new name
+        mt.set_state("zone.bench_5", "0", {"friendly_name": "Renamed Zone"})
+        assert ZoneExtended.resolve_zone("Renamed Zone").id == "zone.bench_5"
+
+        # The old name no longer resolves
+        with pytest.raises(ValueError, match="Bench Zone 5"):
+            ZoneExtended.resolve_zone("Bench Zone 5")
+
+    # A different registry module is never served from the old index
+    with (
+        patch.object(ZoneExtended, "_zone_registry", return_value=ModuleType("zone")),
+        pytest.raises(ValueError, match="Renamed Zone"),
+    ):
+        ZoneExtended.resolve_zone("Renamed Zone")
@@ -3,10 +3,13 @@ from datetime import UTC, datetime
 from maestro import db, get_config
 from maestro.integrations import StateChangeEvent
 from maestro.triggers import state_change_trigger
+from sqlalchemy import update
 
 from registry import person
 
 from .models import ZoneChange
+from .queries import OpenZoneChange, get_open_zone_change, set_open_zone_change
+from .rollups import record_dwell
 
 
 @state_change_trigger(person.marshall, person.emily)
@@ -15,18 +18,10 @@ def save_zone_change(state_change: StateChangeEvent) -> None:
     zone_name = state_change.new.state
     arrival_time = state_change.time_fired
 
-    previous_zone_change: ZoneChange | None = (
-        db.session.query(ZoneChange)
-        .filter(ZoneChange.person == entity_id)
-        .order_by(ZoneChange.arrived_at.desc())
-        .first()
-    )
+    previous_zone_change = get_open_zone_change(entity_id) or load_open_zone_change(entity_id)
 
     if previous_zone_change is not None:
-        update_zone_duration(
-            previous_zone_change=previous_zone_change,
-            departure_time=arrival_time,
-        )
+        update_zone_duration(entity_id, previous_zone_change, departure_time=arrival_time)
 
     new_zone_change = ZoneChange(
         person=entity_id,
@@ -38,16 +33,54 @@ def save_zone_change(state_change: StateChangeEvent) -> None:
     db.session.add(new_zone_change)
     db.session.commit()
 
+    set_open_zone_change(entity_id, OpenZoneChange(arrived_at=arrival_time, zone_name=zone_name))
+
+
+def load_open_zone_change(person_id: str) -> OpenZoneChange | None:
+    """Read a person's latest zone change from the DB when the Redis cache is cold."""
+    latest = (
+        db.session.query(ZoneChange.arrived_at, ZoneChange.zone_name)
+        .filter(ZoneChange.person == person_id)
+        .order_by(ZoneChange.arrived_at.desc())
+        .first()
+    )
 
-def update_zone_duration(previous_zone_change: ZoneChange, departure_time: datetime) -> None:
-    """Update the duration of the previous zone change based on the new arrival time."""
-    prev_arrival = previous_zone_change.arrived_at
+    if latest is None:
+        return None
 
-    if not isinstance(prev_arrival, datetime):
+    return OpenZoneChange(arrived_at=latest.arrived_at, zone_name=latest.zone_name)
+
+
+def compute_zone_duration(arrived_at: datetime, departure_time: datetime) -> int:
+    """Seconds spent in a zone between arrival and departure."""
+    if not isinstance(arrived_at, datetime):
         raise TypeError
 
-    if prev_arrival.tzinfo is None:
-        prev_arrival = prev_arrival.replace(tzinfo=UTC).astimezone(get_config().timezone)
+    if arrived_at.tzinfo is None:
+        arrived_at = arrived_at.replace(tzinfo=UTC).astimezone(get_config().timezone)
+
+    return int((departure_time - arrived_at).total_seconds())
+
 
-    duration = (departure_time - prev_arrival).total_seconds()
-    previous_zone_change.duration_seconds = int(duration)
+def update_zone_duration(
+    person_id: str, previous_zone_change: OpenZoneChange, departure_time: datetime
+) -> None:
+    """Close out the previous zone change's row and roll its duration into the dwell totals."""
+    duration_seconds = compute_zone_duration(
+        arrived_at=previous_zone_change.arrived_at,
+        departure_time=departure_time,
+    )
+    db.session.execute(
+        update(ZoneChange)
+        .where(
+            ZoneChange.person == person_id,
+            ZoneChange.arrived_at == previous_zone_change.arrived_at,
+        )
+        .values(duration_seconds=duration_seconds)
+    )
+    record_dwell(
+        person_id=person_id,
+        zone_name=previous_zone_change.zone_name,
+        arrived_at=previous_zone_change.arrived_at,
+        duration_seconds=duration_seconds,
+    )
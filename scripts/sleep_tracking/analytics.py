@@ -0,0 +1,161 @@
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+
+from maestro import db, get_config
+from maestro.utils import local_now
+
+from .models import SleepEvent
+
+NAP_START_HOUR = 7
+NAP_END_HOUR = 19
+LONG_ROLLING_WINDOW_DAYS = 30
+SHORT_ROLLING_WINDOW_DAYS = 7
+
+
+@dataclass(frozen=True)
+class DailySleepStats:
+    day: date
+    awake_seconds: float
+    nap_count: int
+    nap_seconds: float
+    longest_sleep_seconds: float
+    awake_avg_7d: float
+    awake_avg_30d: float
+
+
+@dataclass(frozen=True)
+class SleepTimeline:
+    """Event timestamps (epoch seconds) and wakeup flags packed into flat arrays"""
+
+    timestamps: array
+    wakeups: array
+    initially_awake: bool
+
+
+def get_sleep_stats(start: date, end: date, now: datetime | None = None) -> list[DailySleepStats]:
+    """Per-day stats for `start` through `end` inclusive. Rolling averages look back past `start`"""
+    history_start = start - timedelta(days=LONG_ROLLING_WINDOW_DAYS - 1)
+    midnights = build_midnights(history_start, end)
+    end_epoch = min(midnights[-1], (now or local_now()).timestamp())
+
+    timeline = load_sleep_timeline(midnights[0], midnights[-1])
+    stats = compute_sleep_stats(history_start, midnights, timeline, end_epoch)
+
+    return stats[(start - history_start).days :]
+
+
+def build_midnights(start: date, end: date) -> array:
+    """Epoch seconds of each local midnight from `start` through the midnight after `end`"""
+    timezone = get_config().timezone
+    day_count = (end - start).days + 2
+
+    return array(
+        "d",
+        (
+            datetime.combine(start + timedelta(days=offset), time(), tzinfo=timezone).timestamp()
+            for offset in range(day_count)
+        ),
+    )
+
+
+def load_sleep_timeline(start_epoch: float, end_epoch: float) -> SleepTimeline:
+    timezone = get_config().timezone
+    start = datetime.fromtimestamp(start_epoch, tz=timezone)
+    end = datetime.fromtimestamp(end_epoch, tz=timezone)
+
+    prior_wakeup = (
+        db.session.query(SleepEvent.wakeup)
+        .filter(SleepEvent.timestamp < start)
+        .order_by(SleepEvent.timestamp.desc())
+        .limit(1)
+        .scalar()
+    )
+    rows = (
+        db.session.query(SleepEvent.timestamp, SleepEvent.wakeup)
+        .filter(SleepEvent.timestamp >= start)
+        .filter(SleepEvent.timestamp < end)
+        .order_by(SleepEvent.timestamp.asc())
+        .all()
+    )
+
+    return SleepTimeline(
+        timestamps=array("d", (row.timestamp.timestamp() for row in rows)),
+        wakeups=array("b", (row.wakeup for row in rows)),
+        initially_awake=bool(prior_wakeup),
+    )
+
+
+def compute_sleep_stats(
+    first_day: date,
+    midnights: array,
+    timeline: SleepTimeline,
+    end_epoch: float,
+) -> list[DailySleepStats]:
+    """
+    Single pass over the timeline. Awake time is split across midnights; sleep stretches count
+    toward the day they started, and are naps if they started between NAP_START/END_HOUR.
+    Repeated events of the same kind are treated as a continuation of the current state.
+    """
+    day_count = len(midnights) - 1
+    awake = array("d", [0.0]) * day_count
+    nap_count = array("l", [0]) * day_count
+    nap_seconds = array("d", [0.0]) * day_count
+    longest_sleep = array("d", [0.0]) * day_count
+
+    is_awake = timeline.initially_awake
+    state_since = midnights[0]
+
+    def close_state(until: float) -> None:
+        if is_awake:
+            cursor = state_since
+            day = bisect_right(midnights, cursor) - 1
+            while cursor < until:
+                segment_end = min(until, midnights[day + 1])
+                awake[day] += segment_end - cursor
+                cursor = segment_end
+                day += 1
+            return
+
+        day = bisect_right(midnights, state_since) - 1
+        duration = until - state_since
+        longest_sleep[day] = max(longest_sleep[day], duration)
+        if NAP_START_HOUR * 3600 <= state_since - midnights[day] < NAP_END_HOUR * 3600:
+            nap_count[day] += 1
+            nap_seconds[day] += duration
+
+    for timestamp, wakeup in zip(timeline.timestamps, timeline.wakeups, strict=True):
+        if timestamp >= end_epoch:
+            break
+        if bool(wakeup) == is_awake:
+            continue
+
+        close_state(timestamp)
+        is_awake = bool(wakeup)
+        state_since = timestamp
+
+    close_state(end_epoch)
+
+    awake_prefix_sums = array("d", [0.0]) * (day_count + 1)
+    for day in range(day_count):
+        awake_prefix_sums[day + 1] = awake_prefix_sums[day] + awake[day]
+
+    def rolling_awake_avg(day: int, window_days: int) -> float:
+        window_start = max(0, day + 1 - window_days)
+        return (awake_prefix_sums[day + 1] - awake_prefix_sums[window_start]) / (
+            day + 1 - window_start
+        )
+
+    return [
+        DailySleepStats(
+            day=first_day + timedelta(days=day),
+            awake_seconds=awake[day],
+            nap_count=nap_count[day],
+            nap_seconds=nap_seconds[day],
+            longest_sleep_seconds=longest_sleep[day],
+            awake_avg_7d=rolling_awake_avg(day, SHORT_ROLLING_WINDOW_DAYS),
+            awake_avg_30d=rolling_awake_avg(day, LONG_ROLLING_WINDOW_DAYS),
+        )
+        for day in range(day_count)
+    ]
@@ -9,6 +9,7 @@ from registry import person
 from scripts.common.event_type import EventType
 from scripts.config.secrets import USER_ID_TO_PERSON
 
+from .analytics import get_sleep_stats
 from .queries import (
     delete_last_event,
     get_awake_time,
@@ -94,3 +95,26 @@ def olivia_info(event: FiredEvent) -> None:
 
     if target := USER_ID_TO_PERSON.get(event.user_id or ""):
         sleep_tracker_notify(message, target)
+
+
+@event_fired_trigger(EventType.OLIVIA_STATS)
+def olivia_stats(event: FiredEvent) -> None:
+    today = local_now().date()
+    week = get_sleep_stats(start=today - timedelta(days=6), end=today)
+    stats = week[-1]
+
+    message = (
+        f"Wake time today: {format_duration(timedelta(seconds=stats.awake_seconds))}\n"
+        f"7-day average: {format_duration(timedelta(seconds=stats.awake_avg_7d))}\n"
+        f"30-day average: {format_duration(timedelta(seconds=stats.awake_avg_30d))}\n"
+        f"Naps today: {stats.nap_count} ({format_duration(timedelta(seconds=stats.nap_seconds))})\n"
+    )
+
+    for day_stats in reversed(week[:-1]):
+        longest_sleep = format_duration(timedelta(seconds=day_stats.longest_sleep_seconds))
+        message += (
+            f"\n{day_stats.day.strftime('%a')}: {day_stats.nap_count} naps, longest {longest_sleep}"
+        )
+
+    if target := USER_ID_TO_PERSON.get(event.user_id or ""):
+        sleep_tracker_notify(message, target)
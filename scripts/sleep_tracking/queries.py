@@ -1,16 +1,45 @@
-from datetime import datetime, timedelta
+import json
+from dataclasses import dataclass, replace
+from datetime import date, datetime, timedelta
 
-from maestro import db
-from maestro.utils import local_now
+from maestro import db, get_config
+from maestro.integrations import StateManager
+from maestro.utils import IntervalSeconds, local_now
+
+from scripts.common.event_type import EventType
 
 from .models import SleepEvent
 
+AWAKE_ACCUMULATOR_KEY_PREFIX = "SLEEP_AWAKE_ACCUMULATOR"
+RECENT_EVENTS_KEY_PREFIX = "SLEEP_RECENT_EVENTS"
+RECENT_EVENTS_CACHE_SIZE = 2
+
+
+@dataclass(frozen=True)
+class AwakeAccumulator:
+    """Running awake time for one day: closed wake windows plus the start of the open one"""
+
+    day: date
+    closed_seconds: float
+    open_since: datetime | None
+    last_event_at: datetime | None
+
+    def awake_time(self, now: datetime) -> timedelta:
+        awake_time = timedelta(seconds=self.closed_seconds)
+        if self.open_since is not None:
+            awake_time += now - self.open_since
+        return awake_time
+
 
 def save_sleep_event(timestamp: datetime, wakeup: bool) -> None:
     sleep_event = SleepEvent(timestamp=timestamp, wakeup=wakeup)
     db.session.add(sleep_event)
     db.session.commit()
 
+    apply_to_awake_accumulator(timestamp, wakeup)
+    _push_recent_event(sleep_event)
+    notify_sleep_event_committed()
+
 
 def get_last_event() -> SleepEvent:
     """Get the most recent sleep event."""
@@ -39,12 +68,35 @@ def get_last_events(count: int = 1) -> list[SleepEvent]:
     return events
 
 
+def get_recent_events() -> list[SleepEvent]:
+    """Like `get_last_events(count=2)` but served from Redis, as detached SleepEvent objects"""
+    recent_events = _load_recent_events()
+
+    if recent_events is None:
+        recent_events = _query_recent_events()
+        _cache_recent_events(recent_events)
+
+    if not recent_events:
+        midnight_today = local_now().replace(hour=0, minute=0, second=0, microsecond=0)
+        recent_events = [SleepEvent(timestamp=midnight_today, wakeup=False)]
+
+    return recent_events
+
+
+def notify_sleep_event_committed() -> None:
+    """Let listeners (eg. the Livi card) know sleep data changed, once it's safely committed"""
+    StateManager().hass_client.fire_event(EventType.SLEEP_EVENT_COMMITTED)
+
+
 def delete_last_event() -> None:
     """Delete the most recent sleep event."""
     latest_event = db.session.query(SleepEvent).order_by(SleepEvent.timestamp.desc()).first()
     if latest_event:
         db.session.delete(latest_event)
         db.session.commit()
+        rebuild_awake_accumulator()
+        _cache_recent_events(_query_recent_events())
+        notify_sleep_event_committed()
 
 
 def get_wake_windows(
@@ -94,7 +146,14 @@ def get_awake_time(
     start: datetime | None = None,
     end: datetime | None = None,
 ) -> timedelta:
-    """Calculate total awake time time for a given day."""
+    """
+    Calculate total awake time time for a given day.
+    Today-so-far (no explicit bounds) is served from the cached accumulator without DB access.
+    """
+    if start is None and end is None:
+        now = local_now()
+        return get_awake_accumulator().awake_time(now)
+
     if start is None:
         start = local_now().replace(hour=0, minute=0, second=0, microsecond=0)
     if end is None:
@@ -110,3 +169,161 @@ def get_awake_time(
         total_wake_time += window_end - window_start
 
     return total_wake_time
+
+
+def get_awake_accumulator() -> AwakeAccumulator:
+    """Today's awake accumulator, rebuilt from the DB if it's missing or from a previous day"""
+    accumulator = _load_awake_accumulator()
+
+    if accumulator is None or accumulator.day != local_now().date():
+        accumulator = rebuild_awake_accumulator()
+
+    return accumulator
+
+
+def apply_to_awake_accumulator(timestamp: datetime, wakeup: bool) -> None:
+    """Fold a committed sleep event into the accumulator, or drop it if the event is out of order"""
+    accumulator = _load_awake_accumulator()
+    event_day = timestamp.astimezone(get_config().timezone).date()
+
+    if (
+        accumulator is None
+        or accumulator.day != event_day
+        or (accumulator.last_event_at is not None and timestamp < accumulator.last_event_at)
+    ):
+        _delete_awake_accumulator()
+        return
+
+    if wakeup:
+        accumulator = replace(accumulator, open_since=timestamp, last_event_at=timestamp)
+    else:
+        window_start = accumulator.open_since or _start_of_day(timestamp)
+        accumulator = replace(
+            accumulator,
+            closed_seconds=accumulator.closed_seconds + (timestamp - window_start).total_seconds(),
+            open_since=None,
+            last_event_at=timestamp,
+        )
+
+    _store_awake_accumulator(accumulator)
+
+
+def rebuild_awake_accumulator() -> AwakeAccumulator:
+    now = local_now()
+    day_start = _start_of_day(now)
+    closed_seconds = 0.0
+    open_since: datetime | None = None
+    last_event_at: datetime | None = None
+
+    for window_start, window_end in get_wake_windows(day_start, now):
+        if window_end is None:
+            open_since = window_start
+            last_event_at = window_start
+        else:
+            closed_seconds += (window_end - (window_start or day_start)).total_seconds()
+            last_event_at = window_end
+
+    accumulator = AwakeAccumulator(
+        day=now.date(),
+        closed_seconds=closed_seconds,
+        open_since=open_since,
+        last_event_at=last_event_at,
+    )
+    _store_awake_accumulator(accumulator)
+
+    return accumulator
+
+
+def _query_recent_events() -> list[SleepEvent]:
+    return (
+        db.session.query(SleepEvent)
+        .order_by(SleepEvent.timestamp.desc())
+        .limit(RECENT_EVENTS_CACHE_SIZE)
+        .all()
+    )
+
+
+def _push_recent_event(sleep_event: SleepEvent) -> None:
+    recent_events = _load_recent_events()
+
+    if recent_events is None or (
+        recent_events and recent_events[0].timestamp > sleep_event.timestamp
+    ):
+        recent_events = _query_recent_events()
+    else:
+        recent_events = [sleep_event, *recent_events][:RECENT_EVENTS_CACHE_SIZE]
+
+    _cache_recent_events(recent_events)
+
+
+def _load_recent_events() -> list[SleepEvent] | None:
+    redis = StateManager().redis_client
+    cached = redis.get(key=redis.build_key(RECENT_EVENTS_KEY_PREFIX))
+    if cached is None:
+        return None
+
+    return [
+        SleepEvent(timestamp=datetime.fromisoformat(event["timestamp"]), wakeup=event["wakeup"])
+        for event in json.loads(cached)
+    ]
+
+
+def _cache_recent_events(recent_events: list[SleepEvent]) -> None:
+    redis = StateManager().redis_client
+    redis.set(
+        key=redis.build_key(RECENT_EVENTS_KEY_PREFIX),
+        value=json.dumps(
+            [
+                {"timestamp": event.timestamp.isoformat(), "wakeup": event.wakeup}
+                for event in recent_events
+            ]
+        ),
+        ttl_seconds=IntervalSeconds.ONE_WEEK,
+    )
+
+
+def _start_of_day(timestamp: datetime) -> datetime:
+    local_timestamp = timestamp.astimezone(get_config().timezone)
+    return local_timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _load_awake_accumulator() -> AwakeAccumulator | None:
+    redis = StateManager().redis_client
+    cached = redis.get(key=redis.build_key(AWAKE_ACCUMULATOR_KEY_PREFIX))
+    if not cached:
+        return None
+
+    data = json.loads(cached)
+    return AwakeAccumulator(
+        day=date.fromisoformat(data["day"]),
+        closed_seconds=data["closed_seconds"],
+        open_since=datetime.fromisoformat(data["open_since"]) if data["open_since"] else None,
+        last_event_at=(
+            datetime.fromisoformat(data["last_event_at"]) if data["last_event_at"] else None
+        ),
+    )
+
+
+def _store_awake_accumulator(accumulator: AwakeAccumulator) -> None:
+    redis = StateManager().redis_client
+    redis.set(
+        key=redis.build_key(AWAKE_ACCUMULATOR_KEY_PREFIX),
+        value=json.dumps(
+            {
+                "day": accumulator.day.isoformat(),
+                "closed_seconds": accumulator.closed_seconds,
+                "open_since": accumulator.open_since.isoformat()
+                if accumulator.open_since
+                else None,
+                "last_event_at": (
+                    accumulator.last_event_at.isoformat() if accumulator.last_event_at else None
+                ),
+            }
+        ),
+        ttl_seconds=IntervalSeconds.ONE_DAY,
+    )
+
+
+def _delete_awake_accumulator() -> None:
+    redis = StateManager().redis_client
+    redis.delete(redis.build_key(AWAKE_ACCUMULATOR_KEY_PREFIX))
@@ -0,0 +1,95 @@
+from array import array
+from datetime import date, timedelta
+
+from maestro import db
+from maestro.testing import MaestroTest
+from maestro.utils import local_now
+
+from .. import analytics, queries
+from ..models import SleepEvent
+
+HOUR = 3600
+
+
+def test_get_sleep_stats(mt: MaestroTest) -> None:
+    yesterday = local_now().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=1)
+
+    # Up at 7, nap 10-11:30, nap 14-15, down at 19, up overnight 2-2:30
+    for hours, wakeup in (
+        (7, True),
+        (10, False),
+        (11.5, True),
+        (14, False),
+        (15, True),
+        (19, False),
+    ):
+        queries.save_sleep_event(timestamp=yesterday + timedelta(hours=hours), wakeup=wakeup)
+    queries.save_sleep_event(timestamp=yesterday + timedelta(hours=26), wakeup=True)
+    queries.save_sleep_event(timestamp=yesterday + timedelta(hours=26.5), wakeup=False)
+
+    now = yesterday + timedelta(hours=30)
+    day_1, day_2 = analytics.get_sleep_stats(
+        start=yesterday.date(), end=yesterday.date() + timedelta(days=1), now=now
+    )
+
+    assert day_1.day == yesterday.date()
+    assert day_1.awake_seconds == 9.5 * HOUR
+    assert day_1.nap_count == 2
+    assert day_1.nap_seconds == 2.5 * HOUR
+    assert day_1.longest_sleep_seconds == 7 * HOUR
+
+    # Today's numbers only run until now, and awake time matches the day query
+    assert day_2.awake_seconds == 0.5 * HOUR
+    assert day_2.nap_count == 0
+    assert day_2.longest_sleep_seconds == 3.5 * HOUR
+    assert (
+        day_1.awake_seconds
+        == queries.get_awake_time(yesterday, yesterday + timedelta(days=1)).total_seconds()
+    )
+
+    # Rolling averages span the full window, including days before tracking started
+    assert day_2.awake_avg_7d == (9.5 + 0.5) * HOUR / 7
+    assert day_2.awake_avg_30d == (9.5 + 0.5) * HOUR / 30
+
+
+def test_compute_sleep_stats_multi_year() -> None:
+    """Benchmark: three years of synthetic events go through a single pass over flat arrays"""
+    first_day = date(2023, 1, 1)
+    day_count = 3 * 365
+    midnights = array("d", (float(day * 24 * HOUR) for day in range(day_count + 1)))
+
+    # Each day: up at 7, nap 13-14:30, down at 19:30, overnight wake 2-2:15
+    daily_pattern = ((2, True), (2.25, False), (7, True), (13, False), (14.5, True), (19.5, False))
+    timestamps = array("d")
+    wakeups = array("b")
+    for day in range(day_count):
+        for hours, wakeup in daily_pattern:
+            timestamps.append(midnights[day] + hours * HOUR)
+            wakeups.append(wakeup)
+
+    timeline = analytics.SleepTimeline(
+        timestamps=timestamps, wakeups=wakeups, initially_awake=False
+    )
+    stats = analytics.compute_sleep_stats(first_day, midnights, timeline, end_epoch=midnights[-1])
+
+    assert len(stats) == day_count
+    assert stats[-1].day == first_day + timedelta(days=day_count - 1)
+    assert all(day.awake_seconds == 11.25 * HOUR for day in stats)
+    assert all(day.nap_count == 1 and day.nap_seconds == 1.5 * HOUR for day in stats)
+    assert all(day.longest_sleep_seconds == 6.5 * HOUR for day in stats[:-1])
+    assert stats[-1].awake_avg_7d == stats[-1].awake_avg_30d == 11.25 * HOUR
+
+
+def test_load_sleep_timeline(mt: MaestroTest) -> None:
+    midnight = local_now().replace(hour=0, minute=0, second=0, microsecond=0)
+    db.session.add(SleepEvent(timestamp=midnight - timedelta(hours=1), wakeup=True))
+    db.session.add(SleepEvent(timestamp=midnight + timedelta(hours=1), wakeup=False))
+    db.session.commit()
+
+    # Events before the range only set the starting state
+    timeline = analytics.load_sleep_timeline(
+        midnight.timestamp(), (midnight + timedelta(days=1)).timestamp()
+    )
+    assert timeline.initially_awake is True
+    assert list(timeline.timestamps) == [(midnight + timedelta(hours=1)).timestamp()]
+    assert list(timeline.wakeups) == [False]
@@ -104,3 +104,13 @@ def test_olivia_info(mt: MaestroTest) -> None:
     mt.trigger_event(EventType.OLIVIA_INFO, user_id=PERSON_TO_USER_ID[person.emily])
     mt.assert_action_called(Domain.NOTIFY, person.emily.notify_action_name)
     mt.assert_action_not_called(Domain.NOTIFY, person.marshall.notify_action_name)
+
+
+def test_olivia_stats(mt: MaestroTest) -> None:
+    # Stats notification is sent to requestor only
+    mt.trigger_event(EventType.OLIVIA_AWAKE)
+    mt.clear_action_calls()
+
+    mt.trigger_event(EventType.OLIVIA_STATS, user_id=PERSON_TO_USER_ID[person.emily])
+    mt.assert_action_called(Domain.NOTIFY, person.emily.notify_action_name)
+    mt.assert_action_not_called(Domain.NOTIFY, person.marshall.notify_action_name)
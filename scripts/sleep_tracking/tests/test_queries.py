@@ -1,9 +1,12 @@
 from datetime import timedelta
+from unittest.mock import patch
 
 from maestro import db
 from maestro.testing import MaestroTest
 from maestro.utils import local_now
 
+from scripts.common.event_type import EventType
+
 from .. import queries
 from ..models import SleepEvent
 
@@ -153,3 +156,72 @@ def test_get_awake_time(mt: MaestroTest) -> None:
     queries.save_sleep_event(timestamp=start + timedelta(hours=2), wakeup=False)
     awake_time = queries.get_awake_time(start=start, end=end)
     assert awake_time == timedelta(hours=2)
+
+
+def test_awake_accumulator(mt: MaestroTest) -> None:
+    midnight = local_now().replace(hour=0, minute=0, second=0, microsecond=0)
+    now = midnight + timedelta(hours=18)
+
+    def db_awake_time() -> timedelta:
+        return queries.get_awake_time(start=midnight, end=now)
+
+    with mt.mock_datetime_as(now):
+        # Asleep-at-midnight day builds the accumulator from the DB on first read
+        queries.save_sleep_event(timestamp=midnight + timedelta(hours=7), wakeup=False)
+        assert queries.get_awake_time() == timedelta(hours=7) == db_awake_time()
+
+        # Later events are folded in without touching the DB
+        with patch.object(queries, "get_wake_windows", side_effect=AssertionError):
+            queries.save_sleep_event(timestamp=midnight + timedelta(hours=9), wakeup=True)
+            assert queries.get_awake_time() == timedelta(hours=16)
+
+            queries.save_sleep_event(timestamp=midnight + timedelta(hours=11), wakeup=False)
+            assert queries.get_awake_time() == timedelta(hours=9)
+
+            queries.save_sleep_event(timestamp=midnight + timedelta(hours=15), wakeup=True)
+            assert queries.get_awake_time() == timedelta(hours=12)
+        assert queries.get_awake_time() == db_awake_time()
+
+        # Deleting an event rebuilds from the DB
+        queries.delete_last_event()
+        assert queries.get_awake_time() == timedelta(hours=9) == db_awake_time()
+
+        # Out of order events drop the accumulator so the next read rebuilds
+        queries.save_sleep_event(timestamp=midnight + timedelta(hours=8), wakeup=True)
+        assert queries.get_awake_time() == db_awake_time()
+
+    # A new day starts from a fresh accumulator
+    with mt.mock_datetime_as(now + timedelta(days=1)):
+        assert queries.get_awake_accumulator().day == (now + timedelta(days=1)).date()
+
+
+def test_recent_events(mt: MaestroTest) -> None:
+    # Returns default midnight asleep event when DB is empty
+    events = queries.get_recent_events()
+    assert len(events) == 1
+    assert events[0].wakeup is False
+    assert events[0].timestamp.hour == 0
+
+    # Saved events are pushed onto the cache and a committed signal is fired
+    now = local_now()
+    queries.save_sleep_event(timestamp=now, wakeup=True)
+    mt.assert_event_fired(EventType.SLEEP_EVENT_COMMITTED)
+    queries.save_sleep_event(timestamp=now + timedelta(hours=1), wakeup=False)
+    queries.save_sleep_event(timestamp=now + timedelta(hours=2), wakeup=True)
+
+    with patch.object(queries, "_query_recent_events", side_effect=AssertionError):
+        events = queries.get_recent_events()
+    assert [(event.timestamp, event.wakeup) for event in events] == [
+        (now + timedelta(hours=2), True),
+        (now + timedelta(hours=1), False),
+    ]
+
+    # Deleting refreshes the cache from the DB and signals again
+    fired_before = len(mt.get_fired_events(EventType.SLEEP_EVENT_COMMITTED))
+    queries.delete_last_event()
+    assert len(mt.get_fired_events(EventType.SLEEP_EVENT_COMMITTED)) == fired_before + 1
+    events = queries.get_recent_events()
+    assert [(event.timestamp, event.wakeup) for event in events] == [
+        (now + timedelta(hours=1), False),
+        (now, True),
+    ]